@@ -20,18 +20,124 @@ method to be valid.
 """
 
 import abc
-from dataclasses import dataclass, field
-from functools import cached_property, lru_cache
+import bisect
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
 from numbers import Real as _Real
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    NamedTuple, Optional, Tuple, TypeVar, Union, cast)
 
+import numpy as np
+from astropy import config as _config
 from astropy.time import Time
+from numpy.typing import ArrayLike
 
 from kanon.utils.types.number_types import Real
 
 CALENDAR_REGISTRY: Dict[str, "Calendar"] = {}
 
-__all__ = ("Julian", "Byzantine", "Arabic", "Persian", "Egyptian", "Month", "Era")
+#: Dtype of the arrays of dates returned by `Calendar.from_julian_days_array`
+YMD_DTYPE = np.dtype([("year", np.int64), ("month", np.int64), ("day", np.int64)])
+
+__all__ = ("Julian", "Byzantine", "Arabic", "Persian", "Egyptian", "Month", "Era",
+           "DateArray", "ConversionCache", "CacheInfo", "Conf", "conf")
+
+T = TypeVar("T")
+
+
+class Conf(_config.ConfigNamespace):
+    """Configuration parameters of the `kanon.calendars.calendars` module
+    """
+
+    cache_size = _config.ConfigItem(
+        1024,
+        "Number of conversions cached by each calendar created, 0 disables the cache."
+    )
+    cache_policy = _config.ConfigItem(
+        ["lru", "fifo"],
+        "Eviction policy of the conversion caches of calendars created."
+    )
+
+
+conf = Conf()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ConversionCache`
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ConversionCache:
+    """Bounded cache of the conversions computed by a `Calendar`.
+
+    >>> cache = ConversionCache(maxsize=2)
+    >>> cache.get(("jdn", 1), lambda: "first")
+    'first'
+    >>> cache.get(("jdn", 1), lambda: "second")
+    'first'
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    :param maxsize: Maximum number of conversions cached, 0 disabling the cache. Defaults \
+    to `Conf.cache_size`
+    :type maxsize: Optional[int]
+    :param policy: Eviction policy, ``"lru"`` evicting the least recently used conversion, \
+    ``"fifo"`` the oldest one. Defaults to `Conf.cache_policy`
+    :type policy: Optional[str]
+    :raises ValueError: Unknown eviction policy
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, policy: Optional[str] = None):
+        self.maxsize: int = conf.cache_size if maxsize is None else maxsize
+        self.policy: str = policy or conf.cache_policy
+        if self.policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown eviction policy {self.policy}, should be 'lru' or 'fifo'")
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Cached value of `key`, computed with `compute` when it is missing.
+        Nothing is cached when `compute` raises an exception.
+        """
+        if self.maxsize <= 0:
+            return compute()
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                if self.policy == "lru":
+                    self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Hits and misses of this cache, with its size
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """Removes all the cached conversions, and resets the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 @dataclass(frozen=True)
@@ -84,10 +190,10 @@ class Month:
         return self.days_ly if leap and self.days_ly else self.days_cy
 
 
-@dataclass
 class Date:
     """
-    Dataclass defining a date.
+    Class defining a date. Dates built from a julian day number compute their year, month
+    and day only when they are needed, and the other way round.
 
     >>> cal = Calendar.registry["Julian A.D."]
     >>> date = Date(cal, (1,2,3))
@@ -98,21 +204,64 @@ class Date:
     >>> str(date + 1)
     '4 Februarius 1 A.D. in Julian'
 
+    :param calendar: Calendar used in this date
+    :param ymd: Year, month and days, expressed in `calendar`
+    :raises ValueError: The month or the day is invalid
+
     .. rubric:: Attributes
 
     .. autoattribute:: calendar
     .. autoattribute:: ymd
     .. autoattribute:: jdn
     """
+
+    __slots__ = ("calendar", "_ymd", "_jdn")
+
     #: Calendar used in this date.
     calendar: "Calendar"
-    #: Year, month and days, expressed in the specified calendar.
-    ymd: Tuple[int, int, int]
-    #: Date as a julian day number.
-    jdn: float = field(init=False)
+    _ymd: Optional[Tuple[int, int, int]]
+    _jdn: Optional[float]
+
+    # Dates are mutable, as they used to be dataclasses
+    __hash__ = None  # type: ignore
+
+    def __init__(self, calendar: "Calendar", ymd: Tuple[int, int, int]):
+        calendar._check_ymd(*ymd)
+        self.calendar = calendar
+        self._ymd = ymd
+        self._jdn = None
+
+    @classmethod
+    def from_jdn(cls, calendar: "Calendar", jdn: float) -> "Date":
+        """Date at a julian day number, without computing its year, month and day.
+
+        >>> date = Date.from_jdn(Calendar.registry["Julian A.D."], 2204719)
+        >>> date.ymd
+        (1324, 3, 10)
 
-    def __post_init__(self):
-        self.jdn = self.calendar.jdn_at_ymd(*self.ymd)
+        :raises ValueError: When accessing `ymd`, if the day can't be expressed in `calendar`
+        """
+        self = cls.__new__(cls)
+        self.calendar = calendar
+        self._ymd = None
+        self._jdn = jdn
+        return self
+
+    @property
+    def ymd(self) -> Tuple[int, int, int]:
+        """Year, month and days, expressed in the specified calendar.
+        """
+        if self._ymd is None:
+            self._ymd = self.calendar._ymd_at(cast(float, self._jdn))
+        return self._ymd
+
+    @property
+    def jdn(self) -> float:
+        """Date as a julian day number.
+        """
+        if self._jdn is None:
+            self._jdn = self.calendar.jdn_at_ymd(*cast(Tuple[int, int, int], self._ymd))
+        return self._jdn
 
     def to_calendar(self, cal: "Calendar") -> "Date":
         """Express this date in another calendar.
@@ -129,17 +278,31 @@ class Date:
         """
         return Time(self.jdn, format="jd")
 
+    def _shifted(self, jdn: float) -> "Date":
+        if float(jdn).is_integer():
+            return Date.from_jdn(self.calendar, jdn)
+        # Days are truncated by `Calendar.from_julian_days`
+        return self.calendar.from_julian_days(jdn)
+
     def __add__(self, other: Union["Date", Real]) -> "Date":
         if not isinstance(other, (Date, _Real)):
             raise TypeError
         jdn: Real = other.jdn if isinstance(other, Date) else other
-        return self.calendar.from_julian_days(self.jdn + jdn)
+        return self._shifted(cast(float, self.jdn + jdn))
 
     def __sub__(self, other: Union["Date", Real]) -> "Date":
         if not isinstance(other, (Date, _Real)):
             raise TypeError
         jdn: Real = other.jdn if isinstance(other, Date) else other
-        return self.calendar.from_julian_days(self.jdn - jdn)
+        return self._shifted(cast(float, self.jdn - jdn))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Date):
+            return NotImplemented
+        return (self.calendar, self.ymd, self.jdn) == (other.calendar, other.ymd, other.jdn)
+
+    def __repr__(self) -> str:
+        return f"Date(calendar={self.calendar!r}, ymd={self.ymd!r}, jdn={self.jdn!r})"
 
     def __str__(self):
         year, month, days = self.ymd
@@ -149,12 +312,186 @@ class Date:
         )
 
 
+class DateArray:
+    """Dates of one calendar, stored as an array of julian day numbers. Arithmetic,
+    comparisons and conversions are computed on the whole array.
+
+    >>> julian = Calendar.registry["Julian A.D."]
+    >>> dates = DateArray.from_ymd(julian, [1324, 1325], [3, 1], [10, 1])
+    >>> dates.jdn
+    array([2204719, 2205015])
+    >>> str((dates + 1)[0])
+    '11 Martius 1324 A.D. in Julian'
+    >>> dates.to_calendar(Calendar.registry["Arabic Civil Hijra"]).ymd["year"]
+    array([724, 725])
+
+    :param calendar: Calendar used in these dates
+    :param jdn: Julian day numbers of the dates
+    :raises ValueError: Some julian day numbers are not integers
+    """
+
+    __slots__ = ("calendar", "jdn")
+
+    def __init__(self, calendar: "Calendar", jdn: ArrayLike):
+        #: Calendar used in these dates.
+        self.calendar = calendar
+        #: Dates as julian day numbers.
+        self.jdn: np.ndarray = self._days(jdn)
+
+    @staticmethod
+    def _days(values: ArrayLike) -> np.ndarray:
+        values = np.asarray(values)
+        days = values.astype(np.int64)
+        if not np.issubdtype(values.dtype, np.integer) and np.any(days != values):
+            raise ValueError("Dates in a DateArray must be whole julian day numbers")
+        return days
+
+    @classmethod
+    def from_ymd(
+        cls, calendar: "Calendar", years: ArrayLike, months: ArrayLike, days: ArrayLike
+    ) -> "DateArray":
+        """Dates at the specified years, months and days, see `Calendar.jdn_at_ymd_array`
+        """
+        return cls(calendar, calendar.jdn_at_ymd_array(years, months, days))
+
+    @classmethod
+    def from_dates(cls, calendar: "Calendar", dates: Iterable[Date]) -> "DateArray":
+        """Array of `Date` objects, expressed in `calendar`
+        """
+        return cls(calendar, [date.jdn for date in dates])
+
+    @classmethod
+    def from_time(cls, calendar: "Calendar", time: Time) -> "DateArray":
+        """Dates of the days containing the specified times, in their own time scale.
+
+        >>> julian = Calendar.registry["Julian A.D."]
+        >>> DateArray.from_time(julian, Time([2204719, 2204720.75], format="jd")).ymd["day"]
+        array([10, 11])
+
+        :param calendar: Calendar used in these dates
+        :param time: Times, as one `astropy.time.Time` object
+        """
+        # Integer and fractional parts are summed separately, to keep the precision of `time`
+        jd1 = np.floor(time.jd1)
+        jdn = jd1 + np.floor((time.jd1 - jd1) + time.jd2)
+        return cls(calendar, np.atleast_1d(jdn).astype(np.int64))
+
+    def to_time(self) -> Time:
+        """Express these dates as one `astropy.time.Time` object with ``jd`` format.
+        """
+        return Time(self.jdn, format="jd")
+
+    @property
+    def ymd(self) -> np.ndarray:
+        """Years, months and days of the dates, see `Calendar.from_julian_days_array`
+        """
+        return self.calendar.from_julian_days_array(self.jdn)
+
+    def to_calendar(self, cal: "Calendar") -> "DateArray":
+        """Express these dates in another calendar.
+        """
+        return DateArray(cal, self.jdn)
+
+    def days_from_epoch(self) -> np.ndarray:
+        """Number of days from the start of the calendar
+        """
+        return self.jdn - self.calendar.era.epoch
+
+    def __len__(self) -> int:
+        return len(self.jdn)
+
+    def __iter__(self) -> Iterator[Date]:
+        return (Date.from_jdn(self.calendar, jdn) for jdn in self.jdn.tolist())
+
+    def __getitem__(self, key) -> Union[Date, "DateArray"]:
+        jdn = self.jdn[key]
+        if np.ndim(jdn) == 0:
+            return Date.from_jdn(self.calendar, int(jdn))
+        return DateArray(self.calendar, jdn)
+
+    @staticmethod
+    def _jdn_of(other) -> Union[np.ndarray, float]:
+        if isinstance(other, (Date, DateArray)):
+            return other.jdn
+        return other
+
+    def __add__(self, days: ArrayLike) -> "DateArray":
+        """Dates shifted by whole numbers of days
+
+        :raises ValueError: Some numbers of days are not integers
+        """
+        if isinstance(days, (Date, DateArray)):
+            return NotImplemented
+        return DateArray(self.calendar, self.jdn + self._days(days))
+
+    def __radd__(self, days: ArrayLike) -> "DateArray":
+        return self + days
+
+    def __sub__(self, other):
+        """Dates shifted back by whole numbers of days, or numbers of days between dates
+
+        :raises ValueError: Some numbers of days are not integers
+        """
+        if isinstance(other, (Date, DateArray)):
+            return self.jdn - other.jdn
+        return DateArray(self.calendar, self.jdn - self._days(other))
+
+    def _same_calendar(self, other) -> np.ndarray:
+        # Like `Date`, dates of different calendars are never equal
+        shape = np.broadcast(self.jdn, self._jdn_of(other)).shape
+        same = not isinstance(other, (Date, DateArray)) or other.calendar == self.calendar
+        return np.full(shape, same)
+
+    def __eq__(self, other) -> np.ndarray:  # type: ignore
+        return self._same_calendar(other) & (self.jdn == self._jdn_of(other))
+
+    def __ne__(self, other) -> np.ndarray:  # type: ignore
+        return ~self._same_calendar(other) | (self.jdn != self._jdn_of(other))
+
+    def __lt__(self, other) -> np.ndarray:
+        return self.jdn < self._jdn_of(other)
+
+    def __le__(self, other) -> np.ndarray:
+        return self.jdn <= self._jdn_of(other)
+
+    def __gt__(self, other) -> np.ndarray:
+        return self.jdn > self._jdn_of(other)
+
+    def __ge__(self, other) -> np.ndarray:
+        return self.jdn >= self._jdn_of(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"DateArray({self.calendar!r}, {self.jdn.tolist()!r})"
+
+
 class Calendar(metaclass=abc.ABCMeta):
     """This abstract class defines calendar behaviors. You need to subclass this to
     create a working `Calendar`. You have to define its `interpolation` method, its `_name`,
     `_months` and maybe `_cycle`.
+
+    When its intercalations repeat exactly every cycle, the class defining `intercalation` can
+    set `_periodic`, so that conversions use a precomputed table of the days of each cycle.
+    Otherwise days are summed year by year.
+
+    Conversions of each calendar are cached in its own `ConversionCache`, which can be
+    replaced to change its size or policy, or to disable it :
+
+    >>> julian = Calendar.registry["Julian A.D."]
+    >>> julian.cache = ConversionCache(maxsize=0)
+    >>> julian.jdn_at_ymd(1324, 3, 10)
+    2204719
+    >>> julian.cache = ConversionCache()
+
+    .. rubric:: Attributes
+
+    .. autoattribute:: cache
     """
 
+    #: Cache of the conversions of this calendar.
+    cache: ConversionCache
+
     registry: Dict[str, "Calendar"] = CALENDAR_REGISTRY
 
     _name: str
@@ -162,6 +499,8 @@ class Calendar(metaclass=abc.ABCMeta):
     _era: Era
     _variant: str
     _cycle: Tuple[int, int] = (1, 0)
+    #: Whether intercalations repeat every cycle, only read on the class defining `intercalation`
+    _periodic: bool = False
 
     def __new__(cls, era: Era, variant: str = "",
                 months_mutation: Optional[Callable[[List[Month]], List[Month]]] = None):
@@ -170,7 +509,8 @@ class Calendar(metaclass=abc.ABCMeta):
         :type era: Era
         :param variant: Name of this variant, defaults to ""
         :type variant: str, optional
-        :param months_mutation: Function transforming the Calendar class `months` list, defaults to None
+        :param months_mutation: Function transforming the Calendar class `months` list, \
+        defaults to None
         :type months_mutation: Optional[Callable[[List[Month]], List[Month]]], optional
         :raises ValueError: Raised when the calendar's name has already been used.
         """
@@ -187,6 +527,12 @@ class Calendar(metaclass=abc.ABCMeta):
         cls.registry[self.name] = self
 
         self._months = (months_mutation or (lambda x: x))(self._months.copy())
+
+        self.cache = ConversionCache()
+
+        # Conversion tables are computed once, when the calendar is defined
+        self._month_starts
+        self._cycle_starts
         return self
 
     @property
@@ -229,23 +575,86 @@ class Calendar(metaclass=abc.ABCMeta):
         """
         return self.cycle[0] * self.common_year + self.cycle[1] * self.leap_year
 
+    @cached_property
+    def _month_starts(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Days before each month, in common years and in leap years, followed by the length
+        of the year
+        """
+        return cast(Tuple[Tuple[int, ...], Tuple[int, ...]], tuple(
+            tuple(itertools.accumulate((m.days(leap) for m in self.months), initial=0))
+            for leap in (False, True)
+        ))
+
+    @cached_property
+    def _month_offsets(self) -> np.ndarray:
+        """`_month_starts` as an array, indexed by leap year and month
+        """
+        return np.array(self._month_starts, dtype=np.int64)
+
+    @cached_property
+    def _cycle_starts(self) -> Optional[Tuple[int, ...]]:
+        """Days added to whole cycles before a year, indexed by the number of years of
+        the cycle before it. `None` when intercalations are not declared periodic.
+        """
+        owner = next(c for c in type(self).__mro__ if "intercalation" in vars(c))
+        if not vars(owner).get("_periodic", False):
+            return None
+        cycle_years = sum(self.cycle)
+        if any(
+            self.intercalation(y) != self.intercalation(y + cycle_years)
+            for y in range(-cycle_years, 2 * cycle_years)
+        ):
+            return None
+        lengths = [self._year_length(y) for y in range(2 * cycle_years)]
+        return tuple(sum(lengths[added:2 * added]) for added in range(cycle_years))
+
+    def _year_length(self, year: int) -> int:
+        return self.leap_year if self.intercalation(year) else self.common_year
+
+    def _year_start(self, year: int) -> int:
+        """Days between the start of the era and the start of a year, for positive years
+        """
+        cycles, added = divmod(year - 1, sum(self.cycle))
+        starts = self._cycle_starts
+        if starts is None:
+            # The years added to the cycles begin at `year - 1`
+            added_days = sum(self._year_length(y) for y in range(year - 1, year - 1 + added))
+            return cycles * self.cycle_length + added_days
+        return cycles * self.cycle_length + starts[added]
+
     @abc.abstractmethod
     def intercalation(self, year: int) -> bool:
         """Is the specified year an intercalation year (leap)
         """
         raise NotImplementedError
 
-    @lru_cache
+    def _intercalations(self, years: np.ndarray) -> np.ndarray:
+        """`intercalation` of an array of years, called once per distinct year
+        """
+        unique, inverse = np.unique(years, return_inverse=True)
+        leap = np.array([self.intercalation(int(y)) for y in unique], dtype=bool)
+        return leap[inverse].reshape(np.shape(years))
+
     def jdn_at_ymd(self, year: int, month: int, day: int) -> float:
         """Julian day number at the specified date in ymd
         """
+        return self.cache.get(("ymd", year, month, day), lambda: self._jdn_at_ymd(year, month, day))
+
+    def _check_ymd(self, year: int, month: int, day: int):
+        """Checks that the month and the day of a date are valid
+
+        :raises ValueError: The month or the day is invalid
+        """
         if 0 > month or month > len(self.months):
             raise ValueError(f"The month entered ({month}) is invalid 1..{len(self.months)}")
         mdn = self.months[month - 1].days(self.intercalation(year))
         if day > mdn or day < 1:
-            raise ValueError(f"The day entered ({day}) is invalid in {self.months[month-1].name} 1..{mdn}")
+            raise ValueError(
+                f"The day entered ({day}) is invalid in {self.months[month-1].name} 1..{mdn}"
+            )
 
-        days = 0
+    def _jdn_at_ymd(self, year: int, month: int, day: int) -> float:
+        self._check_ymd(year, month, day)
 
         negative_year = year < 0
 
@@ -253,15 +662,8 @@ class Calendar(metaclass=abc.ABCMeta):
             year *= -1
             year += 1
 
-        days += ((year - 1) // sum(self.cycle)) * self.cycle_length
-
-        days += sum(
-            self.leap_year if self.intercalation(y) else self.common_year
-            for y in range(year - 1, year - 1 + (year - 1) % sum(self.cycle))
-        )
-        days += sum(
-            m.days(self.intercalation(year)) for m in self.months[:month - 1]
-        )
+        days = self._year_start(year)
+        days += self._month_starts[self.intercalation(year)][(month - 1) % len(self.months)]
 
         days = days + day - 1
 
@@ -271,36 +673,130 @@ class Calendar(metaclass=abc.ABCMeta):
 
         return days + self.era.epoch
 
+    def jdn_at_ymd_array(self, years: ArrayLike, months: ArrayLike, days: ArrayLike) -> np.ndarray:
+        """Julian day numbers at the specified dates, as `jdn_at_ymd` computed on arrays.
+
+        >>> julian = Calendar.registry["Julian A.D."]
+        >>> julian.jdn_at_ymd_array([1324, 1325], [3, 1], [10, 1])
+        array([2204719, 2205015])
+
+        :param years: Years of the dates
+        :param months: Months of the dates
+        :param days: Days of the dates
+        :raises ValueError: A month or a day is invalid
+        :rtype: np.ndarray
+        """
+        years, months, days = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.int64) for a in (years, months, days))
+        )
+        if np.any((months < 0) | (months > len(self.months))):
+            raise ValueError(f"A month entered is invalid 1..{len(self.months)}")
+        index = (months - 1) % len(self.months)
+        offsets = self._month_offsets
+        lengths = np.diff(offsets, axis=1)[self._intercalations(years).astype(np.intp), index]
+        if np.any((days > lengths) | (days < 1)):
+            raise ValueError("A day entered is invalid")
+
+        negative_year = years < 0
+        years = np.where(negative_year, 1 - years, years)
+
+        cycle_years = sum(self.cycle)
+        result = ((years - 1) // cycle_years) * self.cycle_length
+
+        # Years added to the cycles, as in `jdn_at_ymd`
+        added = (years - 1) % cycle_years
+        steps = np.arange(cycle_years - 1)
+        if self._cycle_starts is not None:
+            result += np.array(self._cycle_starts, dtype=np.int64)[added]
+        elif len(steps):
+            previous = (years - 1)[..., None] + steps
+            leap = self._intercalations(previous)
+            year_lengths = np.where(leap, self.leap_year, self.common_year)
+            result += np.sum(np.where(steps < added[..., None], year_lengths, 0), axis=-1)
+
+        result += offsets[self._intercalations(years).astype(np.intp), index] + days - 1
+        result = np.where(negative_year, -result - 1, result)
+
+        return result + self.era.epoch
+
     def get_time(self, year: int, month: int, day: int) -> Time:
         """`astropy.time.Time` object at the specified date in ymd
         """
         return Time(self.jdn_at_ymd(year, month, day), format="jd")
 
-    @lru_cache
+    def get_time_array(self, years: ArrayLike, months: ArrayLike, days: ArrayLike) -> Time:
+        """One `astropy.time.Time` object at the specified dates, see `jdn_at_ymd_array`
+        """
+        return Time(self.jdn_at_ymd_array(years, months, days), format="jd")
+
     def from_julian_days(self, jdn: float) -> Date:
         """Builds a `Date` object at the specified julian day number.
         """
+        return self.cache.get(("jdn", jdn), lambda: Date(self, self._ymd_at(jdn)))
+
+    def _ymd_at(self, jdn: float) -> Tuple[int, int, int]:
+        """Year, month and day at the specified julian day number
+
+        :raises ValueError: The day can't be expressed in this calendar
+        """
         year = int((self.era.days_from_epoch(jdn)) * sum(self.cycle) // self.cycle_length) + 1
 
         rem = jdn - self.jdn_at_ymd(year, 1, 1)
-        for y in range(year, year + self.cycle_length):
-            ylength = self.leap_year if self.intercalation(y) else self.common_year
-            if rem >= ylength:
-                rem -= ylength
-                year += 1
-            else:
+        # The estimated year is at most a few years before the actual one
+        for _ in range(self.cycle_length):
+            ylength = self._year_length(year)
+            if rem < ylength:
                 break
+            rem -= ylength
+            year += 1
+
+        starts = self._month_starts[self.intercalation(year)]
+        month = max(bisect.bisect_right(starts, rem, hi=len(self.months)), 1)
+
+        ymd = (year, month, int(rem - starts[month - 1] + 1))
+        self._check_ymd(*ymd)
+        return ymd
+
+    def from_julian_days_array(self, jdns: ArrayLike) -> np.ndarray:
+        """Dates at the specified julian day numbers, as `from_julian_days` computed on arrays.
 
-        leap = self.intercalation(year)
-        for i, m in enumerate(self.months):
-            if rem < m.days(leap):
-                month = i + 1
-                days = rem + 1
+        >>> arabic = Calendar.registry["Arabic Civil Hijra"]
+        >>> dates = arabic.from_julian_days_array([2204719, 2204720])
+        >>> dates["year"], dates["month"], dates["day"]
+        (array([724, 724]), array([3, 3]), array([14, 15]))
+
+        :param jdns: Julian day numbers
+        :raises ValueError: A julian day number can't be expressed in this calendar
+        :return: Structured array of years, months and days, of dtype `YMD_DTYPE`
+        :rtype: np.ndarray
+        """
+        jdns = np.asarray(jdns)
+        cycle_years = sum(self.cycle)
+        years = self.era.days_from_epoch(jdns) * cycle_years // self.cycle_length
+        years = years.astype(np.int64) + 1
+
+        rem = jdns - self.jdn_at_ymd_array(years, 1, 1)
+        active = np.ones(jdns.shape, dtype=bool)
+        for _ in range(self.cycle_length):
+            lengths = np.where(self._intercalations(years), self.leap_year, self.common_year)
+            active &= rem >= lengths
+            if not active.any():
                 break
-            else:
-                rem -= m.days(leap)
+            rem = np.where(active, rem - lengths, rem)
+            years += active
+
+        offsets = self._month_offsets[self._intercalations(years).astype(np.intp)]
+        months = np.sum(offsets[..., 1:-1] <= rem[..., None], axis=-1)
+
+        days = np.trunc(rem - np.take_along_axis(offsets, months[..., None], axis=-1)[..., 0] + 1)
+        if np.any(days < 1):
+            raise ValueError("A julian day number can't be expressed in this calendar")
 
-        return Date(self, (year, month, int(days)))
+        dates = np.empty(jdns.shape, dtype=YMD_DTYPE)
+        dates["year"] = years
+        dates["month"] = months + 1
+        dates["day"] = days
+        return dates
 
     def __repr__(self) -> str:
         return f"Calendar({self.name})"
@@ -324,6 +820,7 @@ class Julian(Calendar):
     ]
 
     _cycle = (3, 1)
+    _periodic = True
 
     def intercalation(self, year: int) -> bool:
         return year % 4 == 0
@@ -346,6 +843,7 @@ class Arabic(Calendar):
         Month(29, 30, 'Dhū l-ḥijja')
     ]
     _cycle = (19, 11)
+    _periodic = True
 
     def intercalation(self, year: int) -> bool:
         return (1 + (year + 29) % 30) in {2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29}
@@ -369,6 +867,7 @@ class Byzantine(Calendar):
     ]
 
     _cycle = (3, 1)
+    _periodic = True
 
     def intercalation(self, year: int) -> bool:
         return (year - 1) % 4 == 0
@@ -391,6 +890,7 @@ class Egyptian(Calendar):
         Month(30, name='Mesore'),
         Month(5, name='Epagomenai')
     ]
+    _periodic = True
 
     def intercalation(self, year: int) -> bool:
         return False
@@ -413,6 +913,7 @@ class Persian(Calendar):
         Month(30, name='Isfandārmudh'),
         Month(5, name='Andarjah')
     ]
+    _periodic = True
 
     def intercalation(self, year: int) -> bool:
         return False
@@ -448,4 +949,7 @@ Byzantine(_anno_domini)
 # Persian Calendars
 _yazdigird = Era("Yazdigird", 1952063)
 Persian(_yazdigird, variant="Andarjah at the end")
-Persian(_yazdigird, variant="Andarjah after Ābān", months_mutation=lambda m: m[: -1] + [m[-1]] + m[8: -1])
+Persian(
+    _yazdigird, variant="Andarjah after Ābān",
+    months_mutation=lambda m: m[: -1] + [m[-1]] + m[8: -1]
+)
@@ -1,9 +1,12 @@
 import hypothesis.strategies as st
+import numpy as np
 import pytest
+from astropy.time import Time
 from hypothesis import given
 
-from kanon.calendars import Calendar, Date
-from kanon.calendars.calendars import Era, Julian
+from kanon.calendars import Calendar, Date, DateArray
+from kanon.calendars.calendars import (Arabic, CacheInfo, ConversionCache, Era,
+                                       Julian, conf)
 
 
 class TestCalendars:
@@ -70,3 +73,173 @@ class TestCalendars:
         date = Date(cal, (20, 3, 12))
         assert (date + 1).jdn == date.jdn + 1
         assert (date - 1).jdn == date.jdn - 1
+
+    def test_arrays(self):
+        for cal in Calendar.registry.values():
+            ymds = [(y, m, 1 + (y * m) % 20) for y in range(-50, 1500, 7) for m in (1, len(cal.months) - 1)]
+            years, months, days = np.array(ymds).T
+            jdns = cal.jdn_at_ymd_array(years, months, days)
+            assert jdns.tolist() == [cal.jdn_at_ymd(*ymd) for ymd in ymds]
+
+            jdns = np.arange(cal.era.epoch, cal.era.epoch + 3000, 3)
+            dates = cal.from_julian_days_array(jdns)
+            assert dates.tolist() == [cal.from_julian_days(jdn).ymd for jdn in jdns.tolist()]
+
+        cal = Calendar.registry["Julian A.D."]
+        assert cal.jdn_at_ymd_array(1324, [3, 4], 10).tolist() == [2204719, 2204750]
+        with pytest.raises(ValueError):
+            cal.jdn_at_ymd_array([1, 1], [1, 50], [1, 1])
+        with pytest.raises(ValueError):
+            cal.jdn_at_ymd_array([1, 1], [2, 2], [1, 30])
+        with pytest.raises(ValueError):
+            cal.from_julian_days_array([0, cal.era.epoch - 800])
+
+    def test_tables(self):
+        era = Era("tables", 100)
+        arabic = Arabic(era)
+        assert arabic._cycle_starts is not None
+        assert arabic._month_starts[1][-1] == arabic.leap_year
+
+        # Intercalations which do not repeat every cycle are computed year by year
+        class Irregular(Arabic):
+            _name = "Irregular"
+
+            def intercalation(self, year: int) -> bool:
+                return year % 31 == 0
+
+        irregular = Irregular(era)
+        assert irregular._cycle_starts is None
+        fallback = Arabic(era, variant="fallback")
+        fallback._cycle_starts = None
+
+        for year in (-40, -1, 1, 2, 29, 30, 31, 100, 1234):
+            assert arabic.jdn_at_ymd(year, 12, 29) == fallback.jdn_at_ymd(year, 12, 29)
+            if year > 0:
+                jdn = arabic.jdn_at_ymd(year, 12, 29)
+                assert arabic.from_julian_days(jdn).ymd == fallback.from_julian_days(jdn).ymd == (year, 12, 29)
+            assert irregular.jdn_at_ymd_array(year, 12, 29) == irregular.jdn_at_ymd(year, 12, 29)
+
+        # Intercalations repeating in the first cycles only are not tabulated either
+        class Gregorian(Julian):
+            _name = "Gregorian rule"
+
+            def intercalation(self, year: int) -> bool:
+                return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+        gregorian = Gregorian(era)
+        assert gregorian._cycle_starts is None
+        assert gregorian.jdn_at_ymd(100, 1, 1) == 36159 + era.epoch
+        for year in (99, 100, 101, 400, 1900):
+            jdn = gregorian.jdn_at_ymd(year, 3, 1)
+            assert gregorian.jdn_at_ymd_array(year, 3, 1) == jdn
+            assert gregorian.from_julian_days(jdn).ymd == (year, 3, 1)
+            assert tuple(gregorian.from_julian_days_array(jdn).item()) == (year, 3, 1)
+
+    def test_cache(self):
+        julian = Julian(Era("cached", 1721424))
+        other = Calendar.registry["Julian A.D."]
+        assert julian.cache is not other.cache
+        assert julian.cache.maxsize == conf.cache_size
+
+        date = julian.from_julian_days(2204719)
+        assert julian.from_julian_days(2204719) is date
+        # The date and the start of its year are cached
+        assert julian.cache.info() == CacheInfo(1, 2, conf.cache_size, 2)
+
+        lru = ConversionCache(2)
+        fifo = ConversionCache(2, "fifo")
+        for cache in (lru, fifo):
+            cache.get(1, lambda: 1)
+            cache.get(2, lambda: 2)
+            cache.get(1, lambda: 0)
+            cache.get(3, lambda: 3)
+        assert list(lru._data.items()) == [(1, 1), (3, 3)]
+        assert list(fifo._data.items()) == [(2, 2), (3, 3)]
+        lru.clear()
+        assert lru.info() == CacheInfo(0, 0, 2, 0)
+
+        with pytest.raises(ValueError):
+            julian.jdn_at_ymd(1, 50, 1)
+        assert ("ymd", 1, 50, 1) not in julian.cache._data
+
+        julian.cache = ConversionCache(0)
+        assert julian.from_julian_days(2204719) == date
+        assert julian.from_julian_days(2204719) is not date
+        assert julian.cache.info() == CacheInfo(0, 0, 0, 0)
+
+        with conf.set_temp("cache_policy", "fifo"):
+            assert ConversionCache().policy == "fifo"
+        with pytest.raises(ValueError):
+            ConversionCache(policy="random")
+
+    def test_lazy_date(self):
+        cal = Calendar.registry["Julian A.D."]
+
+        date = Date.from_jdn(cal, 2204719)
+        assert not hasattr(date, "__dict__")
+        assert date._ymd is None
+        assert date.ymd == (1324, 3, 10)
+        assert date == Date(cal, (1324, 3, 10))
+
+        date = Date(cal, (1324, 3, 10))
+        assert date._jdn is None
+        assert (date + 1)._ymd is None
+        assert (date + 1).ymd == (1324, 3, 11)
+        assert (date + 0.5).ymd == (1324, 3, 10)
+        assert date.jdn == 2204719
+        assert repr(date) == "Date(calendar=Calendar(Julian A.D.), ymd=(1324, 3, 10), jdn=2204719)"
+
+        with pytest.raises(ValueError):
+            Date(cal, (1324, 2, 30))
+
+    def test_date_array(self):
+        julian = Calendar.registry["Julian A.D."]
+        arabic = Calendar.registry["Arabic Civil Hijra"]
+
+        dates = DateArray.from_ymd(julian, [1324, 1324, 1325], [3, 12, 1], [10, 30, 1])
+        assert len(dates) == 3
+        assert dates.jdn.dtype == np.int64
+        assert dates.jdn.tolist() == [julian.jdn_at_ymd(1324, 3, 10), 2205014, 2205015]
+        assert dates[1] == Date(julian, (1324, 12, 30))
+        assert list(dates) == [Date.from_jdn(julian, jdn) for jdn in dates.jdn]
+        assert DateArray.from_dates(julian, dates).jdn.tolist() == dates.jdn.tolist()
+
+        shifted = dates + [1, 1, 2]
+        assert isinstance(shifted, DateArray)
+        assert (shifted - dates).tolist() == [1, 1, 2]
+        assert (dates - 1).jdn.tolist() == (dates.jdn - 1).tolist()
+        assert (1 + dates).jdn.tolist() == (dates.jdn + 1).tolist()
+        assert (dates < shifted).all()
+        assert (dates == dates[0]).tolist() == [True, False, False]
+        assert (dates[1:] >= dates[1]).all()
+
+        converted = dates.to_calendar(arabic)
+        assert converted.calendar is arabic
+        assert [tuple(ymd) for ymd in converted.ymd.tolist()] == [d.to_calendar(arabic).ymd for d in dates]
+        assert converted.days_from_epoch().tolist() == (dates.jdn - arabic.era.epoch).tolist()
+
+        assert not (converted == dates).any()
+        assert (converted != dates).all()
+        assert not (dates == converted[0]).any()
+        assert (dates == dates.jdn[0]).tolist() == [True, False, False]
+        assert (dates + 2.0).jdn.tolist() == (dates.jdn + 2).tolist()
+
+        with pytest.raises(ValueError):
+            dates + 0.5
+        with pytest.raises(ValueError):
+            dates - [1, 1.5, 2]
+        with pytest.raises(ValueError):
+            DateArray(julian, [2204719.5])
+
+    def test_time_arrays(self):
+        julian = Calendar.registry["Julian A.D."]
+        dates = DateArray.from_ymd(julian, [-4713, 1324, 1325], [1, 3, 1], [1, 10, 1])
+
+        time = dates.to_time()
+        assert time.shape == (3,)
+        assert time[1] == Date(julian, (1324, 3, 10)).to_time()
+        assert np.all(julian.get_time_array([-4713, 1324, 1325], [1, 3, 1], [1, 10, 1]) == time)
+
+        assert DateArray.from_time(julian, time).jdn.tolist() == dates.jdn.tolist()
+        assert DateArray.from_time(julian, Time(time.jd + 0.75, format="jd")).jdn.tolist() == dates.jdn.tolist()
+        assert DateArray.from_time(julian, Time(2204719.5, format="jd")).jdn.tolist() == [2204719]
@@ -9,6 +9,8 @@ packagename.test
 
 import os
 
+import pytest
+
 # For Astropy 3.0 and later, we can use the standalone pytest plugin
 try:
     from pytest_astropy_header.display import (PYTEST_HEADER_MODULES,
@@ -40,6 +42,16 @@ def pytest_configure(config):
         TESTED_VERSIONS[packagename] = __version__
 
 
+@pytest.fixture
+def table_cache(tmp_path):
+    """Caches the tables read from DISHAS in a temporary directory
+    """
+    from kanon.tables.cache import TableCache, conf
+
+    with conf.set_temp("directory", str(tmp_path / "tables")):
+        yield TableCache()
+
+
 def _hypothesis_sexagesimal_strategy():
     """We define hypothesis strategy to generate Sexagesimal values in tests
     """
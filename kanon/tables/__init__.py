@@ -1,3 +1,4 @@
+from . import binary  # noqa: F401  # Registers the kanon format
 from .htable import HTable
 from .symmetries import Symmetry
 
@@ -0,0 +1,403 @@
+"""
+Binary ``kanon`` format of `~kanon.tables.htable.HTable`, registered in the astropy
+unified I/O registry.
+
+Columns of `~kanon.units.radices.BasedReal` numbers are stored as sign, digit and
+precision arrays, instead of being pickled element by element. Units, index, symmetries,
+interpolation method and metadata are stored in a JSON header.
+
+>>> from kanon.tables import HTable
+>>> from kanon.units import Sexagesimal
+>>> table = HTable({"args": [1, 2], "values": [Sexagesimal("1;30"), Sexagesimal("-0;20,15")]}, index="args")
+>>> table.write("table.kanon")  # doctest: +SKIP
+>>> HTable.read("table.kanon", memmap=True)  # doctest: +SKIP
+<HTable length=2>
+ args   values
+int64   object
+----- ----------
+    1    01 ; 30
+    2 -00 ; 20,15
+
+Files start with a fixed preamble, followed by the header and by the arrays, each of them
+aligned on 64 bytes so that they can be memory-mapped :
+
+- the magic string ``\\x93KANON``, and the format version on 2 bytes,
+- the length of the JSON header, as a little-endian 64-bit integer,
+- the JSON header, describing each array with its dtype, shape and offset,
+- the arrays, in C order.
+"""
+
+import json
+import os
+import struct
+from dataclasses import asdict
+from decimal import Decimal
+from typing import (TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, Tuple,
+                    Union, cast)
+
+import numpy as np
+from astropy.io import registry
+from astropy.table import Column
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .htable import HTable
+
+__all__ = ["read_table_kanon", "write_table_kanon", "is_kanon"]
+
+
+MAGIC = b"\x93KANON"
+VERSION = 1
+#: Alignment of the arrays in the file, in bytes
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<6sHQ")
+
+#: Interpolations stored by name, other interpolations are stored with their parameters
+_INTERPOLATIONS = ("linear_interpolation", "quadratic_interpolation", "bilinear_interpolation")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON representation of a table attribute. `~kanon.units.radices.BasedReal` numbers are
+    stored with their digits, and interpolations with their type and parameters.
+
+    :raises TypeError: The value can not be serialized
+    """
+    from kanon.units.radices import BasedReal, radix_registry
+
+    from . import interpolations
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (np.integer, np.floating)):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, BasedReal) and radix_registry.get(type(value).__name__) is type(value):
+        return {
+            "radix": type(value).__name__,
+            "left": list(value.left),
+            "right": list(value.right),
+            "remainder": str(value.remainder),
+            "sign": value.sign,
+        }
+    name = type(value).__name__
+    if (
+        isinstance(value, (interpolations.Interpolation, interpolations.GridInterpolation))
+        and getattr(interpolations, name, None) is type(value)
+    ):
+        return {"interpolation": name, "parameters": {k: _encode_value(v) for k, v in vars(value).items()}}
+    raise TypeError(f"{value!r} can not be serialized")
+
+
+def _decode_value(value: Any) -> Any:
+    """Table attribute stored by `_encode_value`
+
+    :raises ValueError: The value is not valid
+    """
+    from kanon.units.radices import radix_registry
+
+    from . import interpolations
+
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "radix" in value:
+        return radix_registry[value["radix"]]._from_digits(
+            tuple(value["left"]), tuple(value["right"]), Decimal(value["remainder"]), value["sign"]
+        )
+    cls = getattr(interpolations, value["interpolation"])
+    if not isinstance(cls, type) or not issubclass(cls, (interpolations.Interpolation, interpolations.GridInterpolation)):
+        raise ValueError(f"Unknown interpolation {value['interpolation']}")
+    # Parameters are restored as they were stored, whatever the signature of the constructor
+    interpolate = cls.__new__(cls)
+    vars(interpolate).update({k: _decode_value(v) for k, v in value["parameters"].items()})
+    return interpolate
+
+
+def _encode_interpolation(table: "HTable") -> Union[str, Dict[str, Any]]:
+    """Interpolation method of a table, stored by name when it is a standard one
+
+    :raises TypeError: The table uses an interpolation method which is not defined in \
+    `kanon.tables.interpolations`
+    """
+    from . import interpolations
+
+    # Table attributes are copied, so interpolations are compared on their type and parameters
+    for name in _INTERPOLATIONS:
+        interpolate = getattr(interpolations, name)
+        if type(interpolate) is type(table.interpolate) and vars(interpolate) == vars(table.interpolate):
+            return name
+    if not isinstance(table.interpolate, (interpolations.Interpolation, interpolations.GridInterpolation)):
+        raise TypeError("Only tables using an interpolation method of kanon.tables.interpolations can be serialized")
+    return _encode_value(table.interpolate)
+
+
+def _decode_interpolation(value: Union[str, Dict[str, Any]]):
+    """Interpolation method stored by `_encode_interpolation`
+
+    :raises ValueError: The interpolation is not valid
+    """
+    from . import interpolations
+
+    if isinstance(value, str):
+        if value not in _INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation {value}")
+        return getattr(interpolations, value)
+    return _decode_value(value)
+
+
+def _encode_column(values: np.ndarray, arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, Any]:
+    """Stores the arrays representing a column in `arrays`, and returns its description
+
+    :raises TypeError: The column holds objects which are not `~kanon.units.radices.BasedReal`
+    """
+    from kanon.units.radices import BasedReal
+
+    if values.dtype != object:
+        if values.dtype.hasobject or values.dtype.names:
+            raise TypeError("Only numerical, string and BasedReal columns can be serialized")
+        arrays[f"{prefix}values"] = values
+        return {}
+
+    if not len(values) or not all(isinstance(v, BasedReal) for v in values):
+        raise TypeError("Only numerical, string and BasedReal columns can be serialized")
+    radix = type(values[0])
+    if any(type(v) is not radix for v in values):
+        raise TypeError("BasedReal columns should hold numbers of a single type")
+
+    left = np.array([len(v.left) for v in values], dtype=np.int16)
+    right = np.array([v.significant for v in values], dtype=np.int16)
+    integer = int(left.max())
+    significant = int(right.max())
+
+    # Digits are aligned on the unit position, so that the matrix can be read as a BasedRealArray
+    digits = np.zeros((len(values), integer + significant), dtype=np.int64)
+    for row, v, nl in zip(digits, values, left.tolist()):
+        row[integer - nl:integer + v.significant] = v[:]
+
+    arrays[f"{prefix}sign"] = np.array([v.sign for v in values], dtype=np.int8)
+    arrays[f"{prefix}left"] = left
+    arrays[f"{prefix}right"] = right
+    arrays[f"{prefix}digits"] = digits
+    if any(v.remainder for v in values):
+        arrays[f"{prefix}remainder"] = np.array([str(v.remainder) for v in values])
+    return {"radix": radix.__name__, "integer": integer, "significant": significant}
+
+
+def _decode_row(cls, integer: int, row: List[int], nl: int, nr: int, sign: int, remainder: Optional[str]):
+    """`~kanon.units.radices.BasedReal` number stored in a row of the arrays described by
+    `_encode_column`
+    """
+    return cls._from_digits(
+        tuple(row[integer - nl:integer]),
+        tuple(row[integer:integer + nr]),
+        Decimal(remainder) if remainder else Decimal(0),
+        sign
+    )
+
+
+def _decode_column(description: Dict[str, Any], arrays: Dict[str, np.ndarray], prefix: str) -> np.ndarray:
+    """Column built from the arrays described by `_encode_column`
+    """
+    if "radix" not in description:
+        return arrays[f"{prefix}values"]
+
+    from kanon.units.radices import radix_registry
+
+    cls = radix_registry[description["radix"]]
+    integer = description["integer"]
+    remainders = arrays[f"{prefix}remainder"].tolist() if f"{prefix}remainder" in arrays else None
+    column = np.empty(len(arrays[f"{prefix}sign"]), dtype=object)
+    column[:] = [
+        _decode_row(cls, integer, row, nl, nr, sign, remainders[i] if remainders else None)
+        for i, (row, nl, nr, sign) in enumerate(zip(
+            arrays[f"{prefix}digits"].tolist(),
+            arrays[f"{prefix}left"].tolist(),
+            arrays[f"{prefix}right"].tolist(),
+            arrays[f"{prefix}sign"].tolist()
+        ))
+    ]
+    return column
+
+
+def dumps(table: "HTable") -> bytes:
+    """Serializes a table in the ``kanon`` format
+
+    :raises TypeError: The table holds objects, or attributes, which can not be serialized
+    """
+
+    arrays: Dict[str, np.ndarray] = {}
+    columns: List[Dict[str, Any]] = []
+    for i, name in enumerate(table.colnames):
+        column = table[name]
+        if not isinstance(column, Column) or getattr(column, "mask", None) is not None:
+            raise TypeError(f"Column {name} can not be serialized")
+        description = _encode_column(np.asarray(column), arrays, f"{i}_")
+        description.update(name=name, unit=column.unit.to_string() if column.unit else None)
+        columns.append(description)
+
+    header: Dict[str, Any] = {
+        "columns": columns,
+        "index": list(table.primary_key or ()),
+        "symmetry": [{k: _encode_value(v) for k, v in asdict(sym).items()} for sym in table.symmetry],
+        "interpolate": _encode_interpolation(table),
+        "opposite": table.opposite,
+        "meta": {k: v for k, v in table.meta.items() if k != "__attributes__"},
+    }
+
+    # Offsets are relative to the end of the header, which is padded to the alignment
+    offset = 0
+    layout: Dict[str, Dict[str, Any]] = {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout[name] = {"dtype": array.dtype.str, "shape": array.shape, "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    header["arrays"] = layout
+
+    encoded = json.dumps(header).encode()
+    start = _aligned(_PREAMBLE.size + len(encoded))
+    encoded += b" " * (start - _PREAMBLE.size - len(encoded))
+
+    data = bytearray(_PREAMBLE.pack(MAGIC, VERSION, len(encoded)) + encoded)
+    for name, array in arrays.items():
+        data.extend(b"\0" * (start + layout[name]["offset"] - len(data)))
+        data.extend(array.tobytes())
+    return bytes(data)
+
+
+def _read_header(buffer: Union[bytes, np.ndarray]) -> Tuple[Dict[str, Any], int]:
+    """JSON header of a ``kanon`` binary, and the offset of its arrays
+
+    :raises ValueError: The binary is not in the ``kanon`` format
+    """
+    preamble = bytes(buffer[:_PREAMBLE.size])
+    if len(preamble) < _PREAMBLE.size:
+        raise ValueError("Truncated kanon binary")
+    magic, version, length = _PREAMBLE.unpack(preamble)
+    if magic != MAGIC:
+        raise ValueError("Not a kanon binary")
+    if version > VERSION:
+        raise ValueError(f"Unsupported kanon format version {version}")
+    header = json.loads(bytes(buffer[_PREAMBLE.size:_PREAMBLE.size + length]))
+    return header, _PREAMBLE.size + length
+
+
+def _arrays(buffer: Union[bytes, np.ndarray], header: Dict[str, Any], start: int) -> Dict[str, np.ndarray]:
+    """Arrays of a ``kanon`` binary, as read-only views of `buffer`
+    """
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        if dtype.hasobject:
+            raise ValueError("kanon binaries can not hold objects")
+        shape = tuple(spec["shape"])
+        offset = start + spec["offset"]
+        count = int(np.prod(shape))
+        if offset + count * dtype.itemsize > len(buffer):
+            raise ValueError("Truncated kanon binary")
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+    return arrays
+
+
+def loads(buffer: Union[bytes, np.ndarray], copy: bool = True) -> "HTable":
+    """Table deserialized from a ``kanon`` binary
+
+    :param buffer: The binary, as bytes or as a memory-mapped array
+    :param copy: Whether numerical columns are copied, or are views of `buffer`
+    :raises ValueError: The binary is not valid
+    """
+
+    from .htable import HTable
+    from .symmetries import Symmetry
+
+    header, start = _read_header(buffer)
+    arrays = _arrays(buffer, header, start)
+    try:
+        columns = [
+            _decode_column(description, arrays, f"{i}_")
+            for i, description in enumerate(header["columns"])
+        ]
+        interpolate = _decode_interpolation(header["interpolate"])
+        symmetry = [{k: _decode_value(v) for k, v in sym.items()} for sym in header["symmetry"]]
+    except (KeyError, AttributeError) as e:
+        raise ValueError("Invalid kanon binary") from e
+
+    index = header["index"]
+    return HTable(
+        columns,
+        names=[c["name"] for c in header["columns"]],
+        index=index[0] if len(index) == 1 else index or None,
+        units=[c["unit"] for c in header["columns"]],
+        meta=header["meta"],
+        symmetry=[
+            Symmetry(**{**sym, "source": tuple(sym["source"]) if sym["source"] else None})
+            for sym in symmetry
+        ],
+        interpolate=interpolate,
+        opposite=header["opposite"],
+        copy=copy,
+    )
+
+
+def read_table_kanon(filename: Union[str, "os.PathLike[str]", BinaryIO], memmap: bool = False) -> "HTable":
+    """Reads a table written in the ``kanon`` format.
+
+    :param filename: Path of the file, or the file opened in binary mode
+    :param memmap: Whether numerical columns are memory-mapped from the file instead of \
+    being read in memory. `~kanon.units.radices.BasedReal` columns are always built in memory.
+    :raises ValueError: The file is not in the ``kanon`` format
+    """
+    if not isinstance(filename, (str, os.PathLike)):
+        # Files opened by the astropy registry are mapped again from their path
+        name = getattr(filename, "name", None)
+        if not memmap or not isinstance(name, str) or not os.path.isfile(name):
+            return loads(filename.read())
+        filename = name
+    if memmap:
+        return loads(np.memmap(filename, dtype=np.uint8, mode="r"), copy=False)
+    with open(filename, "rb") as f:
+        return loads(f.read())
+
+
+def write_table_kanon(table: "HTable", filename: Union[str, "os.PathLike[str]"], overwrite: bool = False):
+    """Writes a table in the ``kanon`` format.
+
+    :param table: The table
+    :param filename: Path of the file
+    :param overwrite: Whether an existing file is overwritten
+    :raises OSError: The file exists and `overwrite` is False
+    :raises TypeError: The table can not be serialized
+    """
+    data = dumps(table)
+    with open(filename, "wb" if overwrite else "xb") as f:
+        f.write(data)
+
+
+def is_kanon(origin: str, filepath: Optional[str], fileobj: Any, *args, **kwargs) -> bool:
+    """Identifies files in the ``kanon`` format, from their extension or their magic string
+    """
+    if filepath is not None and str(filepath).endswith(".kanon"):
+        return True
+    if fileobj is not None:
+        position = fileobj.tell()
+        signature = fileobj.read(len(MAGIC))
+        fileobj.seek(position)
+        return cast(bytes, signature) == MAGIC
+    return False
+
+
+def _register():
+    from .htable import HTable
+
+    registry.register_reader("kanon", HTable, read_table_kanon)
+    registry.register_writer("kanon", HTable, write_table_kanon)
+    registry.register_identifier("kanon", HTable, is_kanon)
+
+
+_register()
@@ -0,0 +1,208 @@
+"""
+Local cache of the tables read with `~kanon.tables.htable.read_table_dishas`.
+
+Raw JSON contents are stored under their SHA-256 digest, along with a pre-parsed binary of
+the table built from them, in the `kanon.tables.binary` format. Tables already read are then loaded without any network access
+nor JSON parsing. The least recently used contents are evicted when the cache grows over its
+size limit.
+
+Settings are read from `conf`, and can be changed temporarily :
+
+>>> from kanon.tables import HTable
+>>> from kanon.tables.cache import conf
+>>> with conf.set_temp("offline", True):  # doctest: +SKIP
+...     table = HTable.read(180, format="dishas")
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from astropy import config as _config
+from astropy.config.paths import get_cache_dir
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .htable import HTable
+
+__all__ = ["Conf", "conf", "TableCache"]
+
+
+class Conf(_config.ConfigNamespace):
+    """Configuration parameters of the `kanon.tables.cache` module
+    """
+
+    enabled = _config.ConfigItem(
+        True,
+        "Whether tables read from DISHAS are cached on disk."
+    )
+    offline = _config.ConfigItem(
+        False,
+        "If True, tables are only read from the cache, without network access."
+    )
+    directory = _config.ConfigItem(
+        "",
+        "Directory of the tables cache, defaults to the kanon cache directory."
+    )
+    size_limit = _config.ConfigItem(
+        256 * 2 ** 20,
+        "Maximum size of the tables cache, in bytes."
+    )
+
+
+conf = Conf()
+
+
+class TableCache:
+    """Content-addressed cache of table contents, in a local directory.
+
+    Each content is stored under its SHA-256 digest, and referenced by a key such as
+    ``dishas-180``. A pre-parsed binary of the table can be stored next to the content.
+
+    :param directory: Directory of the cache, defaults to `Conf.directory`
+    :type directory: Optional[Union[str, os.PathLike]]
+    :param size_limit: Maximum size of the cache in bytes, defaults to `Conf.size_limit`
+    :type size_limit: Optional[int]
+    """
+
+    def __init__(self, directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+                 size_limit: Optional[int] = None):
+        directory = directory or conf.directory or os.path.join(get_cache_dir("kanon"), "tables")
+        self.path = Path(directory)
+        self.size_limit = conf.size_limit if size_limit is None else size_limit
+        (self.path / "objects").mkdir(parents=True, exist_ok=True)
+        (self.path / "refs").mkdir(exist_ok=True)
+
+    def _object(self, digest: str, suffix: str) -> Path:
+        return self.path / "objects" / f"{digest}{suffix}"
+
+    def _digest(self, key: str) -> Optional[str]:
+        try:
+            return (self.path / "refs" / key).read_text()
+        except FileNotFoundError:
+            return None
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+            # Marks this content as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            # Also evicted while being read, by another thread or process
+            return None
+        return data
+
+    def _write(self, path: Path, data: bytes):
+        # Written to a temporary file first, so that concurrent readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, key: str) -> Optional[bytes]:
+        """Raw content referenced by `key`, or None if it is not cached
+        """
+        digest = self._digest(key)
+        return None if digest is None else self._read(self._object(digest, ".json"))
+
+    def load_table(self, key: str) -> Optional["HTable"]:
+        """Pre-parsed table referenced by `key`, or None if it is not cached
+        """
+        digest = self._digest(key)
+        data = None if digest is None else self._read(self._object(digest, ".kanon"))
+        if data is None:
+            return None
+        try:
+            return _load_table(data)
+        except (ValueError, KeyError):
+            # Binaries which can not be loaded are parsed again from the raw content
+            return None
+
+    def store(self, key: str, content: bytes, table: Optional["HTable"] = None) -> str:
+        """Stores a raw content under `key`, and the table parsed from it, then evicts the least
+        recently used contents if the cache is over its size limit.
+
+        :param key: Key referencing the content
+        :param content: Raw content
+        :param table: Table parsed from `content`, only stored if all its columns are numerical \
+        or `~kanon.units.radices.BasedReal`
+        :return: SHA-256 digest of the content
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object(digest, ".json")
+        if path.exists():
+            os.utime(path)
+        else:
+            self._write(path, content)
+        binary = None if table is None else _dump_table(table)
+        if binary is not None:
+            self._write(self._object(digest, ".kanon"), binary)
+        self._write(self.path / "refs" / key, digest.encode())
+        self.evict()
+        return digest
+
+    def _objects(self) -> Iterator[os.DirEntry]:
+        with os.scandir(self.path / "objects") as entries:
+            yield from (e for e in entries if not e.name.startswith("."))
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached contents, in bytes
+        """
+        return sum(e.stat().st_size for e in self._objects())
+
+    def evict(self):
+        """Removes the least recently used contents until the cache fits in its size limit
+        """
+        entries = []
+        for e in self._objects():
+            try:
+                entries.append((e.stat(), e.path))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda x: x[0].st_mtime)
+        size = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if size <= self.size_limit:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            size -= stat.st_size
+
+    def clear(self):
+        """Removes every content of this cache
+        """
+        for directory in ("objects", "refs"):
+            for path in (self.path / directory).iterdir():
+                path.unlink()
+
+
+def _dump_table(table: "HTable") -> Optional[bytes]:
+    """Pre-parsed binary of a table, in the `kanon.tables.binary` format
+
+    :return: The binary, or None if the table holds objects, or attributes, which
+        are not serializable
+    """
+    from .binary import dumps
+
+    try:
+        return dumps(table)
+    except TypeError:
+        return None
+
+
+def _load_table(data: bytes) -> "HTable":
+    """Table from its pre-parsed binary, built with `_dump_table`
+
+    :raises ValueError: The binary is not valid
+    """
+    from .binary import loads
+
+    return loads(data)
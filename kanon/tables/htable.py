@@ -1,21 +1,34 @@
-from typing import (Callable, Dict, Generic, List, Optional, Tuple, TypeVar,
-                    Union)
+import bisect
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import (Any, Callable, Dict, Generic, Iterable, List, Optional,
+                    Sequence, Tuple, TypeVar, Union, cast)
 
 import numpy as np
 import pandas as pd
 from astropy.io import registry
-from astropy.table import Table
+from astropy.table import Column, Table
 from astropy.table.table import TableAttribute
 from astropy.units import Quantity
-from astropy.units.core import Unit
+from astropy.units.core import Unit, UnitBase
 
-from kanon.utils.types.dishas import NumberType, TableContent, UnitType
+from kanon.units.arrays import BasedRealArray
+from kanon.units.radices import BasedQuantity, BasedReal
+from kanon.utils.types.dishas import (NumberType, OriginalValue, TableContent,
+                                      UnitType)
 from kanon.utils.types.number_types import Real
 
-from .interpolations import Interpolator, linear_interpolation
+from .interpolations import (CompiledGridInterpolation, CompiledInterpolation,
+                             GridInterpolation, Interpolation, Interpolator,
+                             LinearInterpolation, SeparableInterpolation,
+                             _convert_many, bilinear_interpolation,
+                             linear_interpolation)
 from .symmetries import Symmetry
 
-__all__ = ["HTable"]
+__all__ = ["HTable", "HTableCollection"]
 
 
 T = TypeVar("T")
@@ -26,6 +39,189 @@ class GenericTableAttribute(TableAttribute, Generic[T]):
         return super().__get__(instance, owner)
 
 
+class InvalidatingTableAttribute(GenericTableAttribute[T]):
+    """`TableAttribute` invalidating `HTable` cached views when set.
+    """
+
+    def __set__(self, instance, value):
+        instance._version += 1
+        super().__set__(instance, value)
+
+
+class InvalidatingColumn(Column):
+    """`~astropy.table.Column` invalidating the cached views of its parent `HTable` when
+    its data is set in place.
+    """
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        table = self.info.parent_table
+        if isinstance(table, HTable):
+            table._version += 1
+
+
+class SymmetryAttribute(InvalidatingTableAttribute[List[Symmetry]]):
+    """`InvalidatingTableAttribute` holding symmetries in a `_SymmetryList`, so that their
+    in-place changes are tracked.
+    """
+
+    def __get__(self, instance, owner):
+        value = super().__get__(instance, owner)
+        if instance is not None and not isinstance(value, _SymmetryList):
+            value = _SymmetryList(value)
+            TableAttribute.__set__(self, instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        super().__set__(instance, _SymmetryList(value))
+
+
+@dataclass
+class _Lookup:
+    """Sorted view of an `HTable` arguments and values, with its symmetries applied.
+    """
+
+    #: `HTable` version this view was built from
+    version: int
+    #: Symmetries applied on this view
+    symmetry: List[Symmetry]
+    #: Version of `symmetry` this view was built from
+    symmetry_version: int
+    #: View as a `~pandas.DataFrame`, in the table order
+    expanded: pd.DataFrame
+    #: Sorted view as a `~pandas.DataFrame`
+    df: pd.DataFrame
+    #: Sorted arguments
+    keys: List[Any]
+    #: Sorted arguments, as an array
+    key_array: np.ndarray
+    #: Values associated with `keys`
+    values: np.ndarray
+    #: Interpolation method of the table
+    interpolate: Interpolator
+
+    @cached_property
+    def compiled(self) -> Optional[CompiledInterpolation]:
+        """Interpolation method compiled on this view, if it is an `Interpolation`
+        """
+        if isinstance(self.interpolate, Interpolation):
+            return self.interpolate.compile(self.key_array, self.values)
+        return None
+
+
+@dataclass
+class _GridLookup:
+    """Dense grid of the values of an `HTable` of two arguments.
+    """
+
+    #: `HTable` version this grid was built from
+    version: int
+    #: Sorted first arguments
+    keys1: np.ndarray
+    #: Sorted second arguments
+    keys2: np.ndarray
+    #: Values, ``grid[i, j]`` being associated with ``keys1[i]`` and ``keys2[j]``
+    grid: np.ndarray
+    #: Interpolation method of the table
+    interpolate: Union[Interpolator, GridInterpolation]
+
+    @cached_property
+    def compiled(self) -> CompiledGridInterpolation:
+        """Interpolation method compiled on this grid. Interpolations of one argument are
+        applied on both arguments, linear interpolation being made bilinear.
+        """
+        interpolate = self.interpolate
+        if isinstance(interpolate, LinearInterpolation):
+            interpolate = bilinear_interpolation
+        elif isinstance(interpolate, Interpolation):
+            interpolate = SeparableInterpolation(interpolate)
+        elif not isinstance(interpolate, GridInterpolation):
+            raise TypeError("Tables of two arguments should be interpolated with an Interpolation")
+        return interpolate.compile(self.keys1, self.keys2, self.grid)
+
+
+def _invalidating(method: Callable, owner: str = "HTable") -> Callable:
+    """Wraps a method mutating an object so that it increments its version, invalidating
+    `HTable` cached views.
+    """
+
+    def wrapper(self, *args, **kwargs):
+        self._version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = f"{owner}.{method.__name__}"
+    return wrapper
+
+
+class _SymmetryList(List[Symmetry]):
+    """List of symmetries incrementing its version on each mutation, so that `HTable` cached
+    views are checked against it without comparing its items.
+    """
+
+    #: Version of this list, incremented on each mutation
+    _version: int = 0
+
+    append = _invalidating(list.append, "_SymmetryList")
+    extend = _invalidating(list.extend, "_SymmetryList")
+    insert = _invalidating(list.insert, "_SymmetryList")
+    remove = _invalidating(list.remove, "_SymmetryList")
+    pop = _invalidating(list.pop, "_SymmetryList")
+    clear = _invalidating(list.clear, "_SymmetryList")
+    sort = _invalidating(list.sort, "_SymmetryList")
+    reverse = _invalidating(list.reverse, "_SymmetryList")
+    __setitem__ = _invalidating(list.__setitem__, "_SymmetryList")
+    __delitem__ = _invalidating(list.__delitem__, "_SymmetryList")
+    __iadd__ = _invalidating(list.__iadd__, "_SymmetryList")
+    __imul__ = _invalidating(list.__imul__, "_SymmetryList")
+
+
+def _based_array(values: np.ndarray) -> Optional[BasedRealArray]:
+    """Values as a `~kanon.units.arrays.BasedRealArray`, when they are `~kanon.units.radices.BasedReal`
+    numbers of one radix and precision
+    """
+    if values.dtype != object or values.ndim != 1 or not len(values):
+        return None
+    first = values[0]
+    if not isinstance(first, BasedReal):
+        return None
+    radix, significant = type(first), first.significant
+    if any(type(v) is not radix or v.significant != significant for v in values):
+        return None
+    return radix.base.array_type(values, significant)
+
+
+#: Function applied by the worker processes of `_apply_parallel`
+_applied: Optional[Callable] = None
+
+
+def _set_applied(func: Callable):
+    global _applied
+    _applied = func
+
+
+def _apply_chunk(values: np.ndarray) -> List[Any]:
+    return [cast(Callable, _applied)(v) for v in values]
+
+
+def _apply_parallel(func: Callable, values: np.ndarray, processes: int) -> np.ndarray:
+    """Results of `func` on each value, computed by a pool of `processes` worker processes
+    """
+    # Forked workers inherit `func`, so that lambdas and closures do not need to be pickled
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    chunks = np.array_split(np.asarray(values), min(processes * 4, max(len(values), 1)))
+    with ProcessPoolExecutor(processes, mp_context=context,
+                             initializer=_set_applied, initargs=(func,)) as executor:
+        results = [r for chunk in executor.map(_apply_chunk, chunks) for r in chunk]
+
+    if all(isinstance(r, (int, float, np.number)) for r in results):
+        return np.array(results)
+    array = np.empty(len(results), dtype=object)
+    array[:] = results
+    return array
+
+
 class HTable(Table):
     """`HTable` is a subclass of `astropy.table.Table`, made to model Historical Astronomy tables
     representing mathematical functions. Its argument column or columns are its index, while the
@@ -71,15 +267,53 @@ class HTable(Table):
     :param opposite: Defines if the table values should be of the opposite sign. Defaults to False.
     :type opposite: Optional[bool]
 
+    Lookups made with `get` use a cached sorted view of the table, with its symmetries applied.
+    This view is rebuilt after any mutation made through the `~astropy.table.Table` methods or
+    column item assignment, or when `symmetry` is set or its list modified. It is also used by
+    `to_pandas`. Call `invalidate` after modifying column data through other views, such as NumPy
+    arrays or mixin columns, or after modifying a `~kanon.tables.Symmetry` in place.
+
+    Tables indexed by two arguments, such as double-entry tables, should contain a value for each
+    pair of arguments. Their values are looked up on a cached dense grid, with `get` and `get_many` taking
+    the second argument as ``key2`` and ``keys2``. They are interpolated bilinearly by default, or with any
+    `~kanon.tables.interpolations.GridInterpolation`. Symmetries are not applied on these tables.
+
+    >>> grid = HTable({"x": [0, 0, 1, 1], "y": [0, 10, 0, 10], "v": [0., 10., 20., 40.]}, index=["x", "y"])
+    >>> grid.get(0.5, key2=5)
+    17.5
+
     """
 
-    interpolate = GenericTableAttribute[Interpolator](default=linear_interpolation)
+    interpolate = InvalidatingTableAttribute[Union[Interpolator, GridInterpolation]](default=linear_interpolation)
     """Interpolation method."""
-    symmetry: List[Symmetry] = TableAttribute(default=[])
+    symmetry = SymmetryAttribute(default=[])
     """Table symmetries."""
     opposite: bool = TableAttribute(default=False)
     """Defines if the table values should be of the opposite sign."""
 
+    Column = InvalidatingColumn
+
+    #: Version of this table, incremented on each mutation
+    _version: int = 0
+    _lookup_cache: Optional[_Lookup] = None
+    _grid_cache: Optional[_GridLookup] = None
+
+    insert_row = _invalidating(Table.insert_row)
+    remove_rows = _invalidating(Table.remove_rows)
+    add_column = _invalidating(Table.add_column)
+    add_columns = _invalidating(Table.add_columns)
+    remove_columns = _invalidating(Table.remove_columns)
+    replace_column = _invalidating(Table.replace_column)
+    rename_column = _invalidating(Table.rename_column)
+    keep_columns = _invalidating(Table.keep_columns)
+    sort = _invalidating(Table.sort)
+    reverse = _invalidating(Table.reverse)
+    update = _invalidating(Table.update)
+    add_index = _invalidating(Table.add_index)
+    remove_indices = _invalidating(Table.remove_indices)
+    __setitem__ = _invalidating(Table.__setitem__)
+    __delitem__ = _invalidating(Table.__delitem__)
+
     def __init__(self,
                  data=None,
                  names: Optional[Union[List[str], Tuple[str, ...]]] = None,
@@ -95,6 +329,16 @@ class HTable(Table):
             self.add_index(index, unique=True)
 
     def to_pandas(self, index=None, use_nullable_int=True, symmetry=True) -> pd.DataFrame:
+        """Returns this table as a `~pandas.DataFrame` indexed by its arguments, with its
+        symmetries applied.
+        With default parameters, the DataFrame is copied from a view cached until the table
+        or its symmetries change.
+        """
+        if index is None and use_nullable_int and symmetry:
+            return self._lookup().expanded.copy()
+        return self._to_pandas(index, use_nullable_int, symmetry)
+
+    def _to_pandas(self, index=None, use_nullable_int=True, symmetry=True) -> pd.DataFrame:
         if not self.indices and not index:
             raise IndexError("HTable should have an index, defining the function's arguments")
         df = super().to_pandas(index=index, use_nullable_int=use_nullable_int)
@@ -103,7 +347,7 @@ class HTable(Table):
                 df = df.pipe(sym)
         return df
 
-    def get(self, key: Real, with_unit=True) -> Union[Real, Quantity]:
+    def get(self, key: Real, with_unit=True, *, key2: Optional[Real] = None) -> Union[Real, Quantity]:
         """Get the value from any key based on interpolated data.
 
         :param key: Argument for an interpolated function
@@ -111,29 +355,296 @@ class HTable(Table):
         :param with_unit: Whether the result is represented as a Quantity or not. \
         Defaults to `True`
         :type with_unit: bool
+        :param key2: Second argument, for tables of two arguments
+        :type key2: Optional[`~numbers.Real`]
         :raises IndexError: Key is out of bounds
         :return: Interpolated value
         :rtype: `~numbers.Real`
         """
 
-        df = self.to_pandas()
+        if key2 is not None or self._is_grid:
+            grid = self._grid()
+            if key2 is None:
+                raise TypeError("This table needs two arguments")
+            return grid.compiled(key, key2) * ((self._value_unit() if with_unit else 1) or 1)
 
-        unit = (self.columns[1].unit if with_unit else 1) or 1
-        try:
-            return df.loc[key][0] * unit
-        except KeyError:
-            pass
+        if isinstance(key, BasedRealArray):
+            return self.get_many(key.to_basedreals(), with_unit=with_unit)
+
+        lookup = self._lookup()
+        keys = lookup.keys
+
+        unit = (self._value_unit() if with_unit else 1) or 1
+
+        idx = bisect.bisect_left(keys, key)
+        if idx < len(keys) and keys[idx] == key:
+            return lookup.values[idx] * unit
+
+        compiled = lookup.compiled
+        if compiled is None:
+            # Custom interpolators get a copy, so that they can not alter the cached view
+            return cast(Interpolator, self.interpolate)(lookup.df.copy(), key) * unit
+
+        return compiled(key) * unit
+
+    def get_many(self, keys: Union[Sequence[Real], np.ndarray, Quantity], with_unit=True, *,
+                 keys2: Optional[Union[Sequence[Real], np.ndarray, Quantity]] = None) -> Union[np.ndarray, Quantity]:
+        """Get the values from many keys based on interpolated data.
+        All keys are located in one pass, and interpolated together when the interpolation
+        method is an `~kanon.tables.interpolations.Interpolation`.
+
+        >>> table = HTable({"args": [1, 2, 3], "values": [5.1, 3.9, 4.3]}, index="args")
+        >>> table.get_many([1, 1.5, 2.75])
+        array([5.1, 4.5, 4.2])
+
+        :param keys: Arguments for an interpolated function. Quantities are converted to \
+        the unit of the argument column
+        :type keys: Union[Sequence[Real], np.ndarray, Quantity]
+        :param with_unit: Whether the result is represented as a Quantity or not. \
+        Defaults to `True`
+        :type with_unit: bool
+        :param keys2: Second arguments, for tables of two arguments, broadcast with `keys`
+        :type keys2: Optional[Union[Sequence[Real], np.ndarray, Quantity]]
+        :raises IndexError: A key is out of bounds
+        :return: Interpolated values
+        :rtype: Union[np.ndarray, Quantity]
+        """
+
+        if keys2 is not None or self._is_grid:
+            grid = self._grid()
+            if keys2 is None:
+                raise TypeError("This table needs two arguments")
+            name1, name2 = self.primary_key
+            values = grid.compiled.many(self._argument_array(keys, name1), self._argument_array(keys2, name2))
+        else:
+            lookup = self._lookup()
+            key_array = self._argument_array(keys, lookup.df.index.name)
+            if lookup.compiled is not None:
+                values = self._interpolate_many(lookup, key_array)
+            elif len(key_array):
+                values = np.array([self.get(k, with_unit=False) for k in key_array])
+            else:
+                values = np.empty(0, dtype=object if lookup.values.dtype == object else np.float64)
+
+        unit = self._value_unit() if with_unit else None
+        if not unit:
+            return values
+        if values.dtype == object:
+            if not len(values):
+                # Quantity can't infer the type of an empty object array
+                empty = values.view(BasedQuantity)
+                empty._set_unit(unit)
+                return empty
+            return Quantity(values, unit, dtype=object).view(BasedQuantity)
+        return values * unit
+
+    def _argument_array(self, keys: Union[Sequence[Real], np.ndarray, Quantity], name: str) -> np.ndarray:
+        """Array of keys, converted to the unit of the argument column `name` when they are quantities
+        """
+        if isinstance(keys, Quantity):
+            arg_unit = self[name].unit
+            keys = keys.to_value(arg_unit) if arg_unit else keys.value
+        return np.atleast_1d(cast(np.ndarray, keys))
+
+    def _value_unit(self) -> Optional[UnitBase]:
+        """Unit of the values of this table
+        """
+        if self._is_grid:
+            return self[self._value_name].unit
+        return self.columns[1].unit
+
+    @property
+    def _is_grid(self) -> bool:
+        """Whether this table is indexed by two arguments
+        """
+        return self.primary_key is not None and len(self.primary_key) == 2
+
+    @property
+    def _value_name(self) -> str:
+        """Name of the values column of a table of two arguments
+        """
+        return next(name for name in self.colnames if name not in self.primary_key)
+
+    @staticmethod
+    def _interpolate_many(lookup: _Lookup, keys: np.ndarray) -> np.ndarray:
+        """Interpolation of an array of keys on a lookup view
+        """
+
+        key_array = lookup.key_array
+        values = lookup.values
+        size = len(key_array)
+
+        if key_array.dtype != object:
+            keys = _convert_many(lookup.keys, False, keys)
+
+        idx = np.searchsorted(key_array, keys)
+        exact = idx < size
+        exact[exact] = key_array[idx[exact]] == keys[exact]
+        interpolated = ~exact
 
-        return self.interpolate(df, key) * unit
+        dtype = object if values.dtype == object else np.result_type(values.dtype, np.float64)
+        result = np.empty(len(keys), dtype=dtype)
+        result[exact] = values[idx[exact]]
+        if np.any(interpolated):
+            result[interpolated] = cast(CompiledInterpolation, lookup.compiled).many(keys[interpolated])
+        return result
 
-    def apply(self, column: str, func: Callable) -> "HTable":
+    def invalidate(self):
+        """Invalidates the cached views of this table. Only needed after modifying column
+        data through other views than the table columns, other mutations invalidate them automatically.
+        """
+        self._version += 1
+
+    def _lookup(self) -> _Lookup:
+        """Sorted view of this table used for lookups, rebuilt when the table or its
+        symmetries changed.
+        """
+        cache = self._lookup_cache
+        symmetry = cast(_SymmetryList, self.symmetry)
+        if (
+            cache is None or cache.version != self._version
+            or cache.symmetry is not symmetry or cache.symmetry_version != symmetry._version
+        ):
+            expanded = self._to_pandas()
+            df = expanded if expanded.index.is_monotonic_increasing else expanded.sort_index()
+            cache = _Lookup(
+                self._version,
+                symmetry,
+                symmetry._version,
+                expanded,
+                df,
+                df.index.tolist(),
+                df.index.to_numpy(),
+                df.iloc[:, 0].to_numpy(),
+                cast(Interpolator, self.interpolate)
+            )
+            self._lookup_cache = cache
+        return cache
+
+    def _grid(self) -> _GridLookup:
+        """Dense grid of the values of this table of two arguments, rebuilt when the table changed.
+
+        :raises TypeError: This table is not indexed by two arguments
+        :raises ValueError: Some pairs of arguments have no value
+        """
+        cache = self._grid_cache
+        if cache is None or cache.version != self._version:
+            if not self._is_grid:
+                raise TypeError("HTable should be indexed by two arguments")
+            name1, name2 = self.primary_key
+            column1 = np.asarray(self[name1])
+            column2 = np.asarray(self[name2])
+            keys1 = np.unique(column1)
+            keys2 = np.unique(column2)
+            if len(keys1) * len(keys2) != len(self):
+                raise ValueError("Arguments of this table should form a dense grid")
+            values = np.asarray(self[self._value_name])
+            grid = np.empty((len(keys1), len(keys2)), dtype=values.dtype)
+            grid[np.searchsorted(keys1, column1), np.searchsorted(keys2, column2)] = values
+            cache = _GridLookup(self._version, keys1, keys2, grid, self.interpolate)
+            self._grid_cache = cache
+        return cache
+
+    def apply(self, column: str, func: Callable, processes: Optional[int] = None) -> "HTable":
+        """Applies a function on a column, and returns the new table.
+
+        Columns of `~kanon.units.radices.BasedReal` numbers of one radix and precision are
+        given to `func` as a `~kanon.units.arrays.BasedRealArray`, so that arithmetic with
+        scalars, other columns, or lookups in other tables, is computed on whole digit arrays,
+        with float remainders. Otherwise, `func` is called on the column, or on each of its values.
+
+        >>> from kanon.units import Sexagesimal
+        >>> table = HTable({"args": [1, 2], "values": [Sexagesimal("1;30"), Sexagesimal("2;15")]}, index="args")
+        >>> table.apply("values", lambda x: x * 2)["values"].tolist()
+        [03 ; 00, 04 ; 30]
+
+        :param column: Name of the column
+        :type column: str
+        :param func: Function applied on the column
+        :type func: Callable
+        :param processes: Number of worker processes calling `func` on each value of the \
+        column, for functions which can not be computed on arrays. Defaults to `None`, \
+        computing values in this process.
+        :type processes: Optional[int]
+        :return: A new table, with the results of `func` in `column`
+        :rtype: HTable
+        """
         table = self.copy()
+        values = table[column]
+
+        if processes:
+            table[column] = values.copy(data=_apply_parallel(func, values, processes))
+            return table
+
+        array = _based_array(values)
+        if array is not None:
+            try:
+                result = func(array)
+            except (TypeError, ValueError):
+                result = None
+            if isinstance(result, BasedRealArray):
+                result = result.to_basedreals()
+            if (
+                isinstance(result, np.ndarray) and not isinstance(result, Quantity)
+                and result.shape == values.shape
+            ):
+                table[column] = values.copy(data=result)
+                return table
+
         try:
-            table[column] = func(table[column])
+            table[column] = func(values)
         except TypeError:
-            table[column] = np.vectorize(func)(table[column])
+            table[column] = np.vectorize(func)(values)
         return table
 
+    @classmethod
+    def read_many(cls, ids: Iterable[Any], format: str = "dishas", max_workers: int = 8,
+                  **kwargs) -> "HTableCollection":
+        """Reads many tables concurrently, with at most `max_workers` of them being read at
+        the same time. Tables from DISHAS are requested over one pooled HTTP session.
+
+        >>> tables = HTable.read_many([193, 236, 237], format="dishas")  # doctest: +SKIP
+        >>> tables[193]  # doctest: +SKIP
+
+        :param ids: Identifiers of the tables, passed to `read` one by one
+        :param format: Format of the tables, defaults to ``"dishas"``
+        :param max_workers: Maximum number of tables read concurrently
+        :return: Tables keyed by identifier, tables which could not be read being \
+        missing and their errors kept in `HTableCollection.errors`
+        """
+
+        ids = list(dict.fromkeys(ids))
+        tables = HTableCollection()
+        if not ids:
+            return tables
+
+        session = None
+        if format == "dishas":
+            import requests
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            kwargs["session"] = session
+
+        def read(table_id):
+            try:
+                return cls.read(table_id, format=format, **kwargs), None
+            except Exception as e:
+                return None, e
+
+        try:
+            with ThreadPoolExecutor(min(max_workers, len(ids))) as executor:
+                for table_id, (table, error) in zip(ids, executor.map(read, ids)):
+                    if error is None:
+                        tables[table_id] = table
+                    else:
+                        tables.errors[table_id] = error
+        finally:
+            if session is not None:
+                session.close()
+        return tables
+
     def set_index(self, index: Union[str, List[str]], engine=None):
         for c in self.colnames:
             self.remove_indices(c)
@@ -147,22 +658,71 @@ class HTable(Table):
         return table
 
 
+class HTableCollection(Dict[Any, HTable]):
+    """Tables read with `HTable.read_many`, keyed by identifier.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        #: Errors raised when reading the missing tables, keyed by identifier
+        self.errors: Dict[Any, Exception] = {}
+
+
 DISHAS_REQUEST_URL = "https://dishas.obspm.fr/elastic-query?index=table_content&hits=true&id={}"
 
 
-def read_table_dishas(requested_id: str) -> HTable:
+def read_table_dishas(requested_id: str, use_cache: Optional[bool] = None, session=None) -> HTable:
+    """Reads a table from the DISHAS database.
 
-    import astropy.units as u
-    import requests
+    Tables are cached on disk, see `kanon.tables.cache`. A cached table is loaded without
+    any network access, and only cached tables can be read in offline mode.
 
-    from kanon.units import BasedReal, Sexagesimal
+    :param requested_id: DISHAS id of the table
+    :param use_cache: Whether to use the cache, defaults to `kanon.tables.cache.Conf.enabled`
+    :param session: `requests.Session` used for the request, such as the pooled session \
+    of `HTable.read_many`
+    :raises FileNotFoundError: The table does not exist, or is not cached in offline mode
+    """
+
+    from .cache import TableCache, conf
+
+    table_id = int(requested_id)
+    key = f"dishas-{table_id}"
+    store = TableCache() if (conf.enabled if use_cache is None else use_cache) else None
+
+    content: Optional[bytes] = None
+    if store is not None:
+        table = store.load_table(key)
+        if table is not None:
+            return table
+        content = store.load(key)
+
+    if content is None:
+        if conf.offline:
+            raise FileNotFoundError(f"{requested_id} ID not found in the DISHAS cache, in offline mode")
 
-    res: TableContent = requests.get(
-        DISHAS_REQUEST_URL.format(int(requested_id)),
-    ).json()
+        import requests
+        content = (session or requests).get(DISHAS_REQUEST_URL.format(table_id)).content
+
+    res: TableContent = json.loads(content)
     if not res:
         raise FileNotFoundError(
             f'{requested_id} ID not found in DISHAS database')
+
+    table = _table_from_dishas(res, requested_id)
+    if store is not None:
+        store.store(key, content, table)
+    return table
+
+
+def _table_from_dishas(res: TableContent, requested_id: str) -> HTable:
+    """Builds an `HTable` from the content of a DISHAS table
+    """
+
+    import astropy.units as u
+
+    from kanon.units import BasedReal, Sexagesimal
+
     values = res["value_original"]
 
     def read_sexag_array(array: List[str]) -> BasedReal:
@@ -195,17 +755,41 @@ def read_table_dishas(requested_id: str) -> HTable:
     entry_reader = number_reader.get(res["entry_type_of_number"], lambda x: x)
 
     args = [arg_reader(v["value"]) for v in values["args"]["argument1"]]
-    entries = [entry_reader(v["value"]) for v in values["entry"]]
-
-    table = HTable(
-        [args, entries],
-        names=(res["argument1_name"], "Entries"),
-        index=(res["argument1_name"]),
-        units=[unit_reader.get(arg_unit), unit_reader.get(entry_unit)],
-        dtype=[object, object]
+    entries = [entry_reader(v["value"]) for v in _flatten_entries(values["entry"])]
+
+    args2_values = values["args"].get("argument2")
+    if not args2_values:
+        return HTable(
+            [args, entries],
+            names=(res["argument1_name"], "Entries"),
+            index=(res["argument1_name"]),
+            units=[unit_reader.get(arg_unit), unit_reader.get(entry_unit)],
+            dtype=[object, object]
+        )
+
+    # Double-entry table, entries are given for each argument1 then each argument2
+    arg2_unit = cast(UnitType, res.get("argument2_number_unit"))
+    arg2_reader = number_reader.get(res.get("argument2_type_of_number"), lambda x: x)
+    args2 = [arg2_reader(v["value"]) for v in args2_values]
+    if len(entries) != len(args) * len(args2):
+        raise ValueError(f"Table {requested_id} should have an entry for each pair of arguments")
+
+    arg2_name = res.get("argument2_name") or "Argument 2"
+    return HTable(
+        [[a for a in args for _ in args2], args2 * len(args), entries],
+        names=(res["argument1_name"], arg2_name, "Entries"),
+        index=[res["argument1_name"], arg2_name],
+        units=[unit_reader.get(arg_unit), unit_reader.get(arg2_unit), unit_reader.get(entry_unit)],
+        dtype=[object, object, object]
     )
 
-    return table
+
+def _flatten_entries(entries: List[Any]) -> List[OriginalValue]:
+    """Flattens the entries of a DISHAS table, given row by row for double-entry tables
+    """
+    if entries and isinstance(entries[0], list):
+        return [v for row in entries for v in row]
+    return entries
 
 
 registry.register_reader("dishas", HTable, read_table_dishas)
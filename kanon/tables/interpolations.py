@@ -1,10 +1,48 @@
-from typing import Callable, TypeVar
+"""
+Interpolation methods used by `~kanon.tables.htable.HTable` to evaluate its function
+between tabulated arguments.
 
+An `Interpolator` is any callable taking a `~pandas.DataFrame` and a key. Interpolation
+schemes defined here are `Interpolation` objects, which can also be compiled once against
+the sorted arguments and values of a table, precomputing their coefficients on each segment.
+The resulting `CompiledInterpolation` then locates keys by binary search.
+
+Functions of two arguments, tabulated on a dense grid, are interpolated with `GridInterpolation`
+objects, compiled the same way against the grid.
+
+>>> import numpy as np
+>>> keys = np.array([0, 2, 4, 6])
+>>> values = np.array([0., 4., 16., 36.])
+>>> linear_interpolation.compile(keys, values)(3)
+10.0
+>>> quadratic_interpolation.compile(keys, values)(3)
+9.0
+>>> DistributedInterpolation("convex").compile(keys, values).many(np.array([1, 3, 5]))
+array([ 1.33333333,  8.        , 22.66666667])
+>>> grid = np.array([[0., 10.], [20., 40.]])
+>>> bilinear_interpolation.compile(np.array([0, 1]), np.array([0, 10]), grid)(0.5, 5)
+17.5
+"""
+
+import abc
+import bisect
+from decimal import Decimal
+from fractions import Fraction
+from typing import (Any, Callable, Dict, List, Literal, Optional, Tuple, Type,
+                    TypeVar)
+
+import numpy as np
 import pandas as pd
 
+from kanon.units.precision import get_context
+from kanon.units.radices import BasedReal
 from kanon.utils.types.number_types import Real
 
-__all__ = ["Interpolator", "linear_interpolation"]
+__all__ = ["Interpolator", "Interpolation", "CompiledInterpolation",
+           "LinearInterpolation", "LagrangeInterpolation", "QuadraticInterpolation",
+           "DistributedInterpolation", "GridInterpolation", "CompiledGridInterpolation",
+           "SeparableInterpolation", "BilinearInterpolation", "linear_interpolation",
+           "quadratic_interpolation", "bilinear_interpolation"]
 
 
 NT = TypeVar("NT", bound=Real)
@@ -12,21 +50,595 @@ NT = TypeVar("NT", bound=Real)
 Interpolator = Callable[[pd.DataFrame, Real], NT]
 
 
-def linear_interpolation(df: pd.DataFrame, key: Real) -> NT:
-    """Linear interpolation
+def _convert(key_list: List[Any], key: Any) -> Any:
+    """Converts a float key to the type of `~kanon.units.radices.BasedReal` arguments
     """
+    if isinstance(key, float):
+        return type(key_list[0]).from_float(key, 4)
+    return key
 
-    if df.index.dtype == 'object' and isinstance(key, float):
-        key = type(df.index[0]).from_float(key, 4)
 
-    try:
-        low = df.truncate(after=key).iloc[-1]
-        high = df.truncate(before=key).iloc[0]
+def _convert_many(key_list: List[Any], based: bool, keys: np.ndarray) -> np.ndarray:
+    """Converts an array of keys to the type of the arguments. `~kanon.units.radices.BasedReal`
+    keys of numerical arguments are kept, so that they are interpolated as single keys are.
+    """
+    if based:
+        converted = np.empty(len(keys), dtype=object)
+        converted[:] = [_convert(key_list, k) for k in keys]
+        return converted
+    if keys.dtype == object and not all(isinstance(k, BasedReal) for k in keys):
+        return keys.astype(np.float64)
+    return keys
 
-        x = (low.name, low[0])
-        y = (high.name, high[0])
 
-    except IndexError:
+def _locate(key_list: List[Any], key: Any) -> int:
+    """Finds the segment ``[keys[i], keys[i + 1]]`` of sorted arguments containing `key`.
+
+    :raises IndexError: Key is out of bounds
+    """
+    idx = bisect.bisect_left(key_list, key)
+    if idx == 0 and key_list and key_list[0] == key and len(key_list) > 1:
+        return 0
+    if idx == 0 or idx == len(key_list):
         raise IndexError(f"Key ({key}) is out-of-bounds")
+    return idx - 1
+
+
+def _locate_many(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Finds the segments of sorted arguments containing each key of an array.
+
+    :raises IndexError: A key is out of bounds
+    """
+    size = len(sorted_keys)
+    idx = np.searchsorted(sorted_keys, keys)
+    first = (idx == 0) & (keys == sorted_keys[0]) if size > 1 else np.zeros(len(keys), dtype=bool)
+    out_of_bounds = ~first & ((idx == 0) | (idx == size))
+    if np.any(out_of_bounds):
+        raise IndexError(f"Keys ({keys[out_of_bounds]}) are out-of-bounds")
+    return np.maximum(idx - 1, 0)
+
+
+class CompiledInterpolation(abc.ABC):
+    """Interpolation scheme compiled against sorted arguments and values.
+
+    :param keys: Sorted arguments
+    :type keys: np.ndarray
+    :param values: Values associated with `keys`
+    :type values: np.ndarray
+    """
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        self.keys = keys
+        self.values = values
+        self._key_list: List[Any] = keys.tolist()
+        self._based = keys.dtype == object and len(keys) > 0
+        self._exact = self._based or values.dtype == object
+
+    def _convert(self, key: Any) -> Any:
+        """Converts float keys to the type of the arguments when they are `~kanon.units.radices.BasedReal`
+        """
+        return _convert(self._key_list, key) if self._based else key
+
+    def _locate(self, key: Any) -> int:
+        """Finds the segment ``[keys[i], keys[i + 1]]`` containing `key`.
+
+        :raises IndexError: Key is out of bounds
+        """
+        return _locate(self._key_list, key)
+
+    def _locate_many(self, keys: np.ndarray) -> np.ndarray:
+        """Finds the segments containing each key of an array.
+
+        :raises IndexError: A key is out of bounds
+        """
+        return _locate_many(self.keys, keys)
+
+    def __call__(self, key: Any) -> Any:
+        """Interpolates the value at `key`.
+
+        :raises IndexError: Key is out of bounds
+        """
+        key = self._convert(key)
+        return self.evaluate(key, self._locate(key))
+
+    def many(self, keys: np.ndarray) -> np.ndarray:
+        """Interpolates the values at each key of an array.
+
+        :raises IndexError: A key is out of bounds
+        """
+        keys = _convert_many(self._key_list, self._based, keys)
+        return self.evaluate_many(keys, self._locate_many(keys))
+
+    @abc.abstractmethod
+    def evaluate(self, key: Any, segment: int) -> Any:
+        """Interpolates the value at `key`, located in `segment`.
+        """
+        raise NotImplementedError
+
+    def evaluate_many(self, keys: np.ndarray, segments: np.ndarray) -> np.ndarray:
+        """Interpolates the values at each key, located in `segments`.
+        """
+        result = np.empty(len(keys), dtype=object if self._exact else np.float64)
+        result[:] = [self.evaluate(k, s) for k, s in zip(keys, segments)]
+        return result
+
+
+class Interpolation(abc.ABC):
+    """Interpolation scheme, usable as an `Interpolator` or compiled once against a table.
+    """
+
+    def __call__(self, df: pd.DataFrame, key: Real) -> Any:
+        """Interpolates `key` from the first column of `df`, indexed by the arguments.
+        Only the points in the `window` of the segment containing `key` are compiled.
+
+        :raises IndexError: Key is out of bounds
+        """
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        keys = df.index.to_numpy()
+        key_list = df.index.tolist()
+        if keys.dtype == object and len(keys) > 0:
+            key = _convert(key_list, key)
+        segment = _locate(key_list, key)
+        start, stop = self.window(segment, len(keys))
+        start, stop = max(start, 0), min(stop, len(keys))
+        compiled = self.compile(keys[start:stop], df.iloc[start:stop, 0].to_numpy())
+        return compiled.evaluate(key, segment - start)
+
+    def window(self, segment: int, size: int) -> Tuple[int, int]:
+        """Bounds of the points needed to interpolate on a segment. Defaults to all the points.
+
+        :param segment: Index of the segment ``[keys[segment], keys[segment + 1]]``
+        :param size: Number of points
+        :return: Start and stop indices of the points used
+        """
+        return 0, size
+
+    @abc.abstractmethod
+    def compile(self, keys: np.ndarray, values: np.ndarray) -> CompiledInterpolation:
+        """Precomputes this interpolation on sorted arguments and values.
+
+        :param keys: Sorted arguments
+        :param values: Values associated with `keys`
+        """
+        raise NotImplementedError
+
+
+class _CompiledLinear(CompiledInterpolation):
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray):
+        super().__init__(keys, values)
+        self.dx = keys[1:] - keys[:-1]
+        self.dy = values[1:] - values[:-1]
+        if not self._exact:
+            self.slopes = self.dy / self.dx
+
+    def evaluate(self, key, segment):
+        if self._exact:
+            return self.dy[segment] * (key - self.keys[segment]) / self.dx[segment] + self.values[segment]
+        return self.values[segment] + self.slopes[segment] * (key - self.keys[segment])
+
+    def evaluate_many(self, keys, segments):
+        if self._exact:
+            return self.dy[segments] * (keys - self.keys[segments]) / self.dx[segments] + self.values[segments]
+        return self.values[segments] + self.slopes[segments] * (keys - self.keys[segments])
+
+
+def _based_type(array: np.ndarray) -> Optional[Type[BasedReal]]:
+    """Returns the type shared by every element of `array` if it is a `~kanon.units.radices.BasedReal`
+    """
+    if array.dtype != object or not len(array):
+        return None
+    kind = type(array[0])
+    if not issubclass(kind, BasedReal) or any(type(x) is not kind for x in array):
+        return None
+    return kind
+
+
+class _CompiledScaledLinear(_CompiledLinear):
+    """Linear interpolation of `~kanon.units.radices.BasedReal` arguments and values of a single
+    radix each, computed exactly on integers scaled to their maximal precision.
+
+    The result is resized and truncated once, following the current
+    `~kanon.units.precision.PrecisionContext`.
+    """
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray, key_type: Type[BasedReal],
+                 value_type: Type[BasedReal]):
+        super().__init__(keys, values)
+        self.key_type = key_type
+        self.value_type = value_type
+        self.key_significant = max(x.significant for x in keys)
+        self.value_significant = max(y.significant for y in values)
+        self.scaled_keys = [x._exact_scaled(self.key_significant) for x in keys]
+        self.scaled_values = [y._exact_scaled(self.value_significant) for y in values]
+
+        # Operands of each segment with the lowest and highest precisions
+        self.bounds = []
+        for i in range(len(keys) - 1):
+            operands = (keys[i], keys[i + 1], values[i], values[i + 1])
+            self.bounds.append((
+                min(operands, key=lambda x: x.significant),
+                max(operands, key=lambda x: x.significant)
+            ))
+
+    def evaluate(self, key, segment):
+        ctx = get_context()
+        if type(key) is not self.key_type or ctx.recording or any(ctx._algorithms.values()):
+            return super().evaluate(key, segment)
+
+        low, high = self.bounds[segment]
+        if key.significant < low.significant:
+            low = key
+        elif key.significant > high.significant:
+            high = key
+        significant = ctx._precisionfunc(low, high)
+
+        x = self.scaled_keys[segment]
+        y = self.scaled_values[segment]
+        dx = self.scaled_keys[segment + 1] - x
+        dy = self.scaled_values[segment + 1] - y
+
+        base = self.value_type.base
+        numerator = (dy * (key._exact_scaled(self.key_significant) - x) + y * dx) * base.factor_at_pos(significant)
+        denominator = dx * base.factor_at_pos(self.value_significant)
+        if not isinstance(numerator, int) or not isinstance(denominator, int):
+            fraction = Fraction(numerator) / denominator
+            numerator, denominator = fraction.numerator, fraction.denominator
+
+        value, rest = divmod(abs(numerator), denominator)
+        result = self.value_type._from_scaled(
+            value, significant, Decimal(rest) / denominator, -1 if numerator < 0 else 1
+        )
+        return result if ctx._default else ctx.tmode(result)
+
+    def evaluate_many(self, keys, segments):
+        return CompiledInterpolation.evaluate_many(self, keys, segments)
+
+
+class LinearInterpolation(Interpolation):
+    """Linear interpolation between the two arguments surrounding a key.
+
+    Slopes are precomputed on each segment for numerical values. When arguments and values
+    are `~kanon.units.radices.BasedReal` of a single radix each, the value is computed exactly
+    on scaled integers and rounded once with the current `~kanon.units.precision.PrecisionContext`.
+    Otherwise, differences are precomputed and the value is computed as ``dy * (key - x) / dx + y``
+    to keep divisions last.
+    """
+
+    def window(self, segment, size):
+        return segment, segment + 2
+
+    def compile(self, keys, values):
+        key_type = _based_type(keys)
+        value_type = _based_type(values)
+        if key_type and value_type and len(keys) > 1:
+            return _CompiledScaledLinear(keys, values, key_type, value_type)
+        return _CompiledLinear(keys, values)
+
+
+class _CompiledLagrange(CompiledInterpolation):
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray, order: int):
+        super().__init__(keys, values)
+        self.order = order
+        size = len(keys)
+        if size <= order:
+            raise ValueError(f"At least {order + 1} points are needed for this interpolation")
+
+        windows = np.arange(size - order)[:, None] + np.arange(order + 1)
+        # Window of each segment, centered on the segment when possible
+        self.starts = np.clip(np.arange(size - 1) - (order - 1) // 2, 0, size - order - 1)
+
+        if self._exact:
+            # Lagrange denominators of each point in each window
+            self.denominators = np.empty(windows.shape, dtype=object)
+            for j in range(order + 1):
+                denominator = np.ones(len(windows), dtype=object)
+                for m in range(order + 1):
+                    if m != j:
+                        denominator = denominator * (keys[windows[:, j]] - keys[windows[:, m]])
+                self.denominators[:, j] = denominator
+        else:
+            # Polynomial coefficients of each window, in powers of (key - window start)
+            x = (keys[windows] - keys[windows[:, :1]]).astype(np.float64)
+            vandermonde = x[:, :, None] ** np.arange(order + 1)
+            self.coefficients = np.linalg.solve(vandermonde, values[windows].astype(np.float64))
+
+    def evaluate(self, key, segment):
+        start = self.starts[segment]
+        if self._exact:
+            result: Optional[Any] = None
+            for j in range(self.order + 1):
+                numerator = self.values[start + j]
+                for m in range(self.order + 1):
+                    if m != j:
+                        numerator = numerator * (key - self.keys[start + m])
+                term = numerator / self.denominators[start, j]
+                result = term if result is None else result + term
+            return result
+        return self.evaluate_many(np.array([key]), np.array([segment]))[0]
+
+    def evaluate_many(self, keys, segments):
+        if self._exact:
+            return super().evaluate_many(keys, segments)
+        starts = self.starts[segments]
+        x = keys - self.keys[starts]
+        coefficients = self.coefficients[starts]
+        result = coefficients[:, -1]
+        for i in range(self.order - 1, -1, -1):
+            result = result * x + coefficients[:, i]
+        return result
+
+
+class LagrangeInterpolation(Interpolation):
+    """Lagrange polynomial interpolation on the ``order + 1`` arguments surrounding a key.
+
+    Polynomial coefficients are precomputed on each window for numerical values. Lagrange
+    denominators are precomputed for `~kanon.units.radices.BasedReal` arguments and values.
+
+    :param order: Degree of the interpolating polynomials
+    :type order: int
+    """
+
+    def __init__(self, order: int):
+        if order < 1:
+            raise ValueError("Interpolation order should be positive")
+        self.order = order
+
+    def window(self, segment, size):
+        start = min(max(segment - (self.order - 1) // 2, 0), size - self.order - 1)
+        return start, start + self.order + 1
+
+    def compile(self, keys, values):
+        return _CompiledLagrange(keys, values, self.order)
+
+
+class QuadraticInterpolation(LagrangeInterpolation):
+    """Quadratic interpolation on the 3 arguments surrounding a key.
+    """
+
+    def __init__(self):
+        super().__init__(2)
+
+
+class _CompiledDistributed(CompiledInterpolation):
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray, direction: str, step: Real):
+        super().__init__(keys, values)
+        self.convex = direction == "convex"
+        self.step = step
+        self.dy = values[1:] - values[:-1]
+        # Number of steps on each segment
+        self.n = (keys[1:] - keys[:-1]) / step
+        self.norm = self.n * (self.n + 1)
+
+    def _distribute(self, m, n, dy, norm):
+        if self.convex:
+            return dy * (m * (m + 1)) / norm
+        return dy * (m * (n * 2 - m + 1)) / norm
+
+    def evaluate(self, key, segment):
+        m = (key - self.keys[segment]) / self.step
+        return self._distribute(m, self.n[segment], self.dy[segment], self.norm[segment]) + self.values[segment]
+
+    def evaluate_many(self, keys, segments):
+        m = (keys - self.keys[segments]) / self.step
+        return self._distribute(m, self.n[segments], self.dy[segments], self.norm[segments]) + self.values[segments]
+
+
+class DistributedInterpolation(Interpolation):
+    """Interpolation with distributed differences, used in medieval tables whose values were
+    only computed at regular nodes. On a segment of ``n`` steps, the difference between two
+    nodes is distributed on each step proportionally to ``1, 2, ..., n`` (convex) or
+    ``n, ..., 2, 1`` (concave).
+
+    :param direction: Whether the differences increase (`convex`) or decrease (`concave`)
+    :type direction: Literal["convex", "concave"]
+    :param step: Step between two successive arguments of the distribution, defaults to 1
+    :type step: Real
+    """
+
+    def __init__(self, direction: Literal["convex", "concave"], step: Real = 1):
+        if direction not in ("convex", "concave"):
+            raise ValueError(f"Illegal direction {direction}")
+        self.direction = direction
+        self.step = step
+
+    def window(self, segment, size):
+        return segment, segment + 2
+
+    def compile(self, keys, values):
+        return _CompiledDistributed(keys, values, self.direction, self.step)
+
+
+class CompiledGridInterpolation(abc.ABC):
+    """Interpolation scheme of a function of two arguments, compiled against a dense grid.
+
+    :param keys1: Sorted first arguments
+    :type keys1: np.ndarray
+    :param keys2: Sorted second arguments
+    :type keys2: np.ndarray
+    :param grid: Values, ``grid[i, j]`` being associated with ``keys1[i]`` and ``keys2[j]``
+    :type grid: np.ndarray
+    """
+
+    def __init__(self, keys1: np.ndarray, keys2: np.ndarray, grid: np.ndarray):
+        self.keys1 = keys1
+        self.keys2 = keys2
+        self.grid = grid
+        self._key_lists: Tuple[List[Any], List[Any]] = (keys1.tolist(), keys2.tolist())
+        self._based = (keys1.dtype == object and len(keys1) > 0, keys2.dtype == object and len(keys2) > 0)
+        self._exact = any(self._based) or grid.dtype == object
+
+    def __call__(self, key1: Any, key2: Any) -> Any:
+        """Interpolates the value at ``(key1, key2)``.
+
+        :raises IndexError: A key is out of bounds
+        """
+        list1, list2 = self._key_lists
+        if self._based[0]:
+            key1 = _convert(list1, key1)
+        if self._based[1]:
+            key2 = _convert(list2, key2)
+        return self.evaluate(key1, key2, _locate(list1, key1), _locate(list2, key2))
+
+    def many(self, keys1: np.ndarray, keys2: np.ndarray) -> np.ndarray:
+        """Interpolates the values at each pair of keys of two arrays, broadcast together.
+
+        :raises IndexError: A key is out of bounds
+        """
+        keys1, keys2 = np.broadcast_arrays(keys1, keys2)
+        shape = keys1.shape
+        keys1 = _convert_many(self._key_lists[0], self._based[0], keys1.ravel())
+        keys2 = _convert_many(self._key_lists[1], self._based[1], keys2.ravel())
+        result = self.evaluate_many(
+            keys1, keys2, _locate_many(self.keys1, keys1), _locate_many(self.keys2, keys2)
+        )
+        return result.reshape(shape)
+
+    @abc.abstractmethod
+    def evaluate(self, key1: Any, key2: Any, segment1: int, segment2: int) -> Any:
+        """Interpolates the value at ``(key1, key2)``, located in the cell ``(segment1, segment2)``.
+        """
+        raise NotImplementedError
+
+    def evaluate_many(self, keys1: np.ndarray, keys2: np.ndarray,
+                      segments1: np.ndarray, segments2: np.ndarray) -> np.ndarray:
+        """Interpolates the values at each pair of keys, located in the cells ``(segments1, segments2)``.
+        """
+        result = np.empty(len(keys1), dtype=object if self._exact else np.float64)
+        result[:] = [self.evaluate(*args) for args in zip(keys1, keys2, segments1, segments2)]
+        return result
+
+
+class GridInterpolation(abc.ABC):
+    """Interpolation scheme of a function of two arguments tabulated on a dense grid.
+    """
+
+    @abc.abstractmethod
+    def compile(self, keys1: np.ndarray, keys2: np.ndarray, grid: np.ndarray) -> CompiledGridInterpolation:
+        """Precomputes this interpolation on a grid.
+
+        :param keys1: Sorted first arguments
+        :param keys2: Sorted second arguments
+        :param grid: Values, ``grid[i, j]`` being associated with ``keys1[i]`` and ``keys2[j]``
+        """
+        raise NotImplementedError
+
+
+class _CompiledSeparable(CompiledGridInterpolation):
+
+    def __init__(self, keys1: np.ndarray, keys2: np.ndarray, grid: np.ndarray,
+                 first: Interpolation, second: Interpolation):
+        super().__init__(keys1, keys2, grid)
+        self.first = first
+        self.rows = [second.compile(keys2, row) for row in grid]
+        self._bases: Dict[Tuple[int, int], List[CompiledInterpolation]] = {}
+
+    def _basis(self, segment1: int) -> Tuple[int, List[CompiledInterpolation]]:
+        """Start of the window of the first interpolation on a segment, and this interpolation
+        compiled on each unit vector of the window, once per window.
+
+        Interpolations being linear in their values, a value is the sum of the rows of the window
+        interpolated on the second argument, weighted by these interpolations on the first one.
+        """
+        start, stop = self.first.window(segment1, len(self.rows))
+        start, stop = max(start, 0), min(stop, len(self.rows))
+        basis = self._bases.get((start, stop))
+        if basis is None:
+            units = np.eye(stop - start, dtype=object if self._exact else np.float64)
+            basis = [self.first.compile(self.keys1[start:stop], unit) for unit in units]
+            self._bases[start, stop] = basis
+        return start, basis
+
+    def evaluate(self, key1, key2, segment1, segment2):
+        # Only the rows needed by the first interpolation are interpolated
+        start, basis = self._basis(segment1)
+        result: Optional[Any] = None
+        for j, weight in enumerate(basis):
+            term = weight.evaluate(key1, segment1 - start) * self.rows[start + j].evaluate(key2, segment2)
+            result = term if result is None else result + term
+        return result
+
+    def evaluate_many(self, keys1, keys2, segments1, segments2):
+        if self._exact:
+            return super().evaluate_many(keys1, keys2, segments1, segments2)
+        result = np.zeros(len(keys1))
+        for segment in np.unique(segments1).tolist():
+            mask = segments1 == segment
+            start, basis = self._basis(segment)
+            for j, weight in enumerate(basis):
+                result[mask] += (
+                    weight.evaluate_many(keys1[mask], segments1[mask] - start)
+                    * self.rows[start + j].evaluate_many(keys2[mask], segments2[mask])
+                )
+        return result
+
+
+class SeparableInterpolation(GridInterpolation):
+    """Interpolation on a grid made with two interpolations of one argument : each row is
+    interpolated on the second argument, then the resulting column on the first one.
+    Only the rows in the `Interpolation.window` of the first interpolation are interpolated.
+
+    :param first: Interpolation along the first argument
+    :type first: Interpolation
+    :param second: Interpolation along the second argument, defaults to `first`
+    :type second: Optional[Interpolation]
+    """
+
+    def __init__(self, first: Interpolation, second: Optional[Interpolation] = None):
+        self.first = first
+        self.second = second or first
+
+    def compile(self, keys1, keys2, grid):
+        return _CompiledSeparable(keys1, keys2, grid, self.first, self.second)
+
+
+class _CompiledBilinear(_CompiledSeparable):
+
+    def __init__(self, keys1: np.ndarray, keys2: np.ndarray, grid: np.ndarray):
+        if grid.dtype == object or keys1.dtype == object or keys2.dtype == object:
+            super().__init__(keys1, keys2, grid, linear_interpolation, linear_interpolation)
+        else:
+            CompiledGridInterpolation.__init__(self, keys1, keys2, grid)
+            self.dx1 = (keys1[1:] - keys1[:-1]).astype(np.float64)
+            self.dx2 = (keys2[1:] - keys2[:-1]).astype(np.float64)
+
+    def evaluate(self, key1, key2, segment1, segment2):
+        if self._exact:
+            return super().evaluate(key1, key2, segment1, segment2)
+        return self.evaluate_many(np.array([key1]), np.array([key2]),
+                                  np.array([segment1]), np.array([segment2]))[0]
+
+    def evaluate_many(self, keys1, keys2, segments1, segments2):
+        if self._exact:
+            return CompiledGridInterpolation.evaluate_many(self, keys1, keys2, segments1, segments2)
+        t = (keys1 - self.keys1[segments1]) / self.dx1[segments1]
+        u = (keys2 - self.keys2[segments2]) / self.dx2[segments2]
+        grid = self.grid
+        return (
+            (1 - t) * ((1 - u) * grid[segments1, segments2] + u * grid[segments1, segments2 + 1])
+            + t * ((1 - u) * grid[segments1 + 1, segments2] + u * grid[segments1 + 1, segments2 + 1])
+        )
+
+
+class BilinearInterpolation(GridInterpolation):
+    """Bilinear interpolation between the four grid points surrounding a pair of keys.
+
+    Numerical grids are interpolated in a vectorized way. `~kanon.units.radices.BasedReal` grids
+    are linearly interpolated on the two rows surrounding the first key, then between them.
+    """
+
+    def compile(self, keys1, keys2, grid):
+        return _CompiledBilinear(keys1, keys2, grid)
+
+
+#: Default linear interpolation
+linear_interpolation = LinearInterpolation()
+
+#: Quadratic interpolation
+quadratic_interpolation = QuadraticInterpolation()
 
-    return (y[1] - x[1]) * (key - x[0]) / (y[0] - x[0]) + x[1]
+#: Default bilinear interpolation, for tables of two arguments
+bilinear_interpolation = BilinearInterpolation()
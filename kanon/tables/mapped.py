@@ -0,0 +1,216 @@
+"""
+Read-only views of tables written in the `kanon.tables.binary` format, memory-mapped from
+their file instead of being loaded in memory.
+
+Values of a `MappedHTable` are built from the mapped arrays when they are looked up, so
+that many processes can share one table through the operating system page cache, without
+holding their own copy of its data. Views are pickled as their file path, and can be sent
+to worker processes.
+
+>>> from kanon.tables.mapped import MappedHTable
+>>> table.write("mean_motion.kanon")  # doctest: +SKIP
+>>> view = MappedHTable("mean_motion.kanon")  # doctest: +SKIP
+>>> view.get(Sexagesimal("2;30"))  # doctest: +SKIP
+"""
+
+import os
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional, Union, cast
+
+import numpy as np
+from astropy.units import Quantity
+from astropy.units.core import Unit, UnitBase
+
+from kanon.units.radices import BasedQuantity, BasedReal, radix_registry
+from kanon.utils.types.number_types import Real
+
+from .binary import (_arrays, _decode_interpolation, _decode_row, _read_header,
+                     loads)
+from .htable import HTable
+from .interpolations import Interpolation, _convert, _locate
+
+__all__ = ["MappedHTable"]
+
+
+class _MappedColumn(Sequence):
+    """Column of a `MappedHTable`, building its values from the mapped arrays when accessed
+    """
+
+    def __init__(self, description: Dict[str, Any], arrays: Dict[str, np.ndarray], prefix: str):
+        self.name: str = description["name"]
+        self.unit: Optional[UnitBase] = Unit(description["unit"]) if description["unit"] else None
+        self._values: Optional[np.ndarray] = arrays.get(f"{prefix}values")
+        if self._values is not None:
+            return
+        self._type = radix_registry[description["radix"]]
+        self._integer: int = description["integer"]
+        self._significant: int = description["significant"]
+        self._sign = arrays[f"{prefix}sign"]
+        self._left = arrays[f"{prefix}left"]
+        self._right = arrays[f"{prefix}right"]
+        self._digits = arrays[f"{prefix}digits"]
+        self._remainder = arrays.get(f"{prefix}remainder")
+
+    @property
+    def based(self) -> bool:
+        """Whether this column holds `~kanon.units.radices.BasedReal` numbers
+        """
+        return self._values is None
+
+    def __len__(self) -> int:
+        return len(self._sign if self._values is None else self._values)
+
+    def __getitem__(self, i):
+        if self._values is not None:
+            return self._values[i]
+        if not isinstance(i, (int, np.integer)):
+            raise TypeError("Mapped columns of BasedReal are only indexed by integers")
+        if i < 0:
+            i += len(self)
+        return _decode_row(
+            self._type,
+            self._integer,
+            self._digits[i].tolist(),
+            int(self._left[i]),
+            int(self._right[i]),
+            int(self._sign[i]),
+            None if self._remainder is None else str(self._remainder[i])
+        )
+
+    def take(self, start: int, stop: int) -> np.ndarray:
+        """Values of the rows from `start` to `stop`, copied in memory
+        """
+        if self._values is not None:
+            return np.array(self._values[start:stop])
+        values = np.empty(stop - start, dtype=object)
+        values[:] = [self[i] for i in range(start, stop)]
+        return values
+
+    def floats(self) -> np.ndarray:
+        """Values of this column as a new float array, without the remainders of
+        `~kanon.units.radices.BasedReal` numbers
+        """
+        if self._values is not None:
+            return np.asarray(self._values, dtype=np.float64)
+        array = self._type.base.array_type._from_digits(
+            self._sign, self._digits, np.zeros(len(self)), self._significant
+        )
+        return np.asarray(array, dtype=np.float64)
+
+
+class MappedHTable:
+    """Read-only view of a table of one argument written in the `kanon.tables.binary` format,
+    memory-mapped from its file. It is looked up like an `~kanon.tables.htable.HTable`.
+
+    Arguments of the table should be sorted, and its symmetries should already be applied.
+
+    :param filename: Path of the file
+    :type filename: Union[str, os.PathLike]
+    :raises TypeError: The table does not have one argument
+    :raises ValueError: The file is not in the ``kanon`` format, the table has symmetries or \
+    its arguments are not sorted
+    """
+
+    def __init__(self, filename: Union[str, "os.PathLike[str]"]):
+        self.filename = os.fspath(filename)
+        self._buffer = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        header, start = _read_header(self._buffer)
+        arrays = _arrays(self._buffer, header, start)
+
+        if len(header["index"]) != 1:
+            raise TypeError("Only tables of one argument can be mapped")
+        if header["symmetry"]:
+            raise ValueError("Tables with symmetries can't be mapped, they should be written with their symmetries applied")
+
+        #: Metadata of the table
+        self.meta: Dict[str, Any] = header["meta"]
+        #: Interpolation method of the table
+        self.interpolate: Interpolation = _decode_interpolation(header["interpolate"])
+        self.columns: Dict[str, _MappedColumn] = {
+            description["name"]: _MappedColumn(description, arrays, f"{i}_")
+            for i, description in enumerate(header["columns"])
+        }
+
+        name = header["index"][0]
+        self._keys = self.columns[name]
+        self._values = next(column for column in self.columns.values() if column.name != name)
+
+        keys = self._keys.floats()
+        if np.any(keys[1:] < keys[:-1]):
+            raise ValueError("Arguments of a mapped table should be sorted")
+
+    @property
+    def colnames(self) -> List[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, name: str) -> _MappedColumn:
+        return self.columns[name]
+
+    def __reduce__(self):
+        return type(self), (self.filename,)
+
+    def get(self, key: Real, with_unit=True) -> Union[Real, Quantity]:
+        """Get the value from any key based on interpolated data, as `~kanon.tables.htable.HTable.get`.
+        Only the rows needed by the interpolation are read.
+
+        :param key: Argument for an interpolated function
+        :type key: `~numbers.Real`
+        :param with_unit: Whether the result is represented as a Quantity or not. \
+        Defaults to `True`
+        :type with_unit: bool
+        :raises IndexError: Key is out of bounds
+        :return: Interpolated value
+        :rtype: `~numbers.Real`
+        """
+
+        keys = self._keys
+        unit = (self._values.unit if with_unit else 1) or 1
+        if keys.based:
+            key = _convert(cast(List[Any], keys), key)
+
+        segment = _locate(cast(List[Any], keys), key)
+        for idx in (segment, segment + 1):
+            if keys[idx] == key:
+                return self._values[idx] * unit
+
+        start, stop = self.interpolate.window(segment, len(keys))
+        start, stop = max(start, 0), min(stop, len(keys))
+        compiled = self.interpolate.compile(keys.take(start, stop), self._values.take(start, stop))
+        return compiled.evaluate(key, segment - start) * unit
+
+    def get_many(self, keys: Union[List[Real], np.ndarray, Quantity], with_unit=True) -> Union[np.ndarray, Quantity]:
+        """Get the values from many keys based on interpolated data, as
+        `~kanon.tables.htable.HTable.get_many`.
+
+        :param keys: Arguments for an interpolated function. Quantities are converted to \
+        the unit of the argument column
+        :type keys: Union[List[Real], np.ndarray, Quantity]
+        :param with_unit: Whether the result is represented as a Quantity or not. \
+        Defaults to `True`
+        :type with_unit: bool
+        :raises IndexError: A key is out of bounds
+        :return: Interpolated values
+        :rtype: Union[np.ndarray, Quantity]
+        """
+        if isinstance(keys, Quantity):
+            keys = keys.to_value(self._keys.unit) if self._keys.unit else keys.value
+        results = [self.get(k, with_unit=False) for k in np.atleast_1d(cast(np.ndarray, keys))]
+        based = any(isinstance(v, BasedReal) for v in results)
+        values = np.empty(len(results), dtype=object) if based else np.array(results)
+        if based:
+            values[:] = results
+
+        unit = self._values.unit if with_unit else None
+        if not unit:
+            return values
+        if based:
+            return Quantity(values, unit, dtype=object).view(BasedQuantity)
+        return values * unit
+
+    def to_table(self) -> HTable:
+        """Loads this table in memory, as an `~kanon.tables.htable.HTable`
+        """
+        return loads(self._buffer)
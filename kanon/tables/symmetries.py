@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -84,42 +85,47 @@ class Symmetry:
         else:
             symdf = df.copy()
 
-        def apply(x):
-            return self.sign * x + self.offset
+        keys = symdf.index.to_numpy()
+
+        if self.sign == -1 or self.offset:
+            symdf = symdf * self.sign + self.offset
+
+        pieces: List[Tuple[np.ndarray, DataFrame]] = []
 
         if not self.targets:
 
             if self.symtype == "mirror":
-                symdf.index = symdf.index.map(lambda x: 2 * symdf.index[-1] - x)
-                symdf = symdf[:-1][::-1]
+                pieces.append(((keys[:-1] * -1 + 2 * keys[-1])[::-1], symdf.iloc[:-1].iloc[::-1]))
 
             elif self.symtype == "periodic":
-                symdf.index = symdf.index.map(lambda x: 1 + x + symdf.index[-1] - symdf.index[0])
-
-            if self.sign == -1 or self.offset:
-                symdf = symdf.applymap(apply)
+                pieces.append((keys + (1 + keys[-1] - keys[0]), symdf))
 
-            df = pd.concat([df, symdf])
         else:
+            reversed_df = symdf.iloc[::-1]
             for t in self.targets:
-                tdf = symdf.copy()
 
                 if self.symtype == "mirror":
-                    tdf.index = tdf.index.map(lambda x: tdf.index[-1] - x + t)
-                    tdf = tdf[::-1]
+                    pieces.append(((keys * -1 + (keys[-1] + t))[::-1], reversed_df))
 
                 else:
-                    tdf.index = tdf.index.map(lambda x: t + x - tdf.index[0])
+                    pieces.append((keys + (t - keys[0]), symdf))
 
-                if self.sign == -1 or self.offset:
-                    tdf = tdf.applymap(apply)
+            if _has_duplicates(np.concatenate([df.index.to_numpy(), *(k for k, _ in pieces)])):
+                raise OverlappingSymmetryError
 
-                if len(df.index.intersection(tdf.index)) > 0:
-                    raise OverlappingSymmetryError
+        frames = [
+            frame.set_axis(pd.Index(new_keys, name=df.index.name), axis=0)
+            for new_keys, frame in pieces
+        ]
 
-                df = pd.concat([df, tdf])
+        return pd.concat([df, *frames]).sort_index()
 
-        return df.sort_index()
+
+def _has_duplicates(keys: np.ndarray) -> bool:
+    """Checks if an array contains duplicated keys, by comparing its sorted neighbours
+    """
+    keys = np.sort(keys)
+    return bool(np.any(keys[1:] == keys[:-1]))
 
 
 class OutOfBoundsOriginError(IndexError):
@@ -1,6 +1,8 @@
 from math import isclose
-from typing import Tuple
+from typing import List, Tuple
+from unittest import mock
 
+import astropy.units as u
 import hypothesis.strategies as st
 import numpy as np
 import pytest
@@ -8,6 +10,7 @@ from hypothesis import assume
 from hypothesis.core import given
 
 from kanon.tables.htable import HTable
+from kanon.tables.interpolations import quadratic_interpolation
 from kanon.tables.symmetries import Symmetry
 
 
@@ -63,6 +66,109 @@ class TestHTable:
         with pytest.raises(IndexError):
             tab.get(tab[0]["A"] - 1)
 
+    @given(gen_table_strategy.flatmap(
+        lambda x: st.tuples(st.lists(st.floats(
+            min_value=float(min(x["A"])),
+            max_value=float(max(x["A"])),
+            allow_nan=False
+        ), min_size=1), st.just(x))))
+    def test_get_many(self, hypo: Tuple[List[float], HTable]):
+        keys, tab = hypo
+        values = tab.get_many(keys)
+        assert len(values) == len(keys)
+        for key, value in zip(keys, values):
+            assert isclose(value, tab.get(key), rel_tol=1e-9, abs_tol=1e-9)
+
+        with pytest.raises(IndexError):
+            tab.get_many([tab[0]["A"] - 1] + keys)
+
+    def test_get_many_units(self):
+        tab = HTable(self.sample, index="a", units=[u.day, u.degree])
+        values = tab.get_many([24, 36] * u.hour)
+        assert values.unit is u.degree
+        assert np.array_equal(values.value, [5, 7])
+        assert np.array_equal(tab.get_many(np.array([1.5, 4]), with_unit=False), [7, 15])
+        assert tab.get(1.5, False) == 7
+        assert np.array_equal(tab.get_many([1.5, 4], False), [7, 15])
+
+        tab.interpolate = lambda df, key: -1
+        assert np.array_equal(tab.get_many([1.5, 2], with_unit=False), [-1, 9])
+
+    def test_lookup_cache(self):
+        tab = HTable(self.sample, index="a")
+        assert tab.get(2.5) == 10.5
+        assert tab._lookup() is tab._lookup()
+
+        tab.add_row((5, 20))
+        assert tab.get(4.5) == 17.5
+
+        tab.symmetry = [Symmetry("periodic")]
+        assert tab.get(7) == 9
+
+        tab.symmetry = []
+        with pytest.raises(IndexError):
+            tab.get(7)
+
+        tab["b"][0] = 7
+        assert tab.get(1.5) == 8
+        tab[1]["b"] = 11
+        assert tab.get(1.5) == 9
+        assert tab.to_pandas()["b"].iloc[1] == 11
+
+        np.asarray(tab["b"])[0] = 9
+        tab.invalidate()
+        assert tab.get(1.5) == 10
+
+        tab.remove_row(0)
+        with pytest.raises(IndexError):
+            tab.get(1.5)
+
+        tab.interpolate = lambda df, key: -1
+        assert tab.get(2.5) == -1
+        assert tab.get(2) == 11
+
+        def interpolate(df, key):
+            df.iloc[:, 0] = 0
+            return key
+        tab.interpolate = interpolate
+        assert tab.get(2.5) == 2.5
+        assert tab.get(2) == 11
+
+    def test_symmetry_cache(self):
+        tab = HTable(self.sample, index="a", symmetry=[Symmetry("mirror")])
+        with mock.patch.object(Symmetry, "__call__", autospec=True, side_effect=Symmetry.__call__) as call:
+            df = tab.to_pandas()
+            assert len(df) == 7
+            df["b"] = 0
+            assert tab.to_pandas()["b"].iloc[-1] == 5
+            assert tab.get(6.5) == 7
+            assert call.call_count == 1
+
+            tab.symmetry = [Symmetry("periodic")]
+            assert len(tab.to_pandas()) == 8
+            assert call.call_count == 2
+
+            tab.symmetry.append(Symmetry("periodic", targets=[20]))
+            assert len(tab.to_pandas()) == 16
+            assert call.call_count == 4
+
+            tab.symmetry[1] = Symmetry("periodic", targets=[30])
+            assert tab.to_pandas().index[-1] == 37
+            assert call.call_count == 6
+
+            copied = tab.copy()
+            copied.symmetry.pop()
+            assert len(copied.to_pandas()) == 8
+            assert len(tab.to_pandas()) == 16
+            assert call.call_count == 7
+
+            tab.add_row((5, 3))
+            assert len(tab.to_pandas()) == 20
+            assert call.call_count == 9
+
+            assert len(tab.to_pandas(symmetry=False)) == 5
+            assert call.call_count == 9
+
     def test_apply(self):
         tab = HTable(self.sample, index="a")
 
@@ -87,3 +193,49 @@ class TestHTable:
         assert new_tab.loc[5]["a"] == 1
         with pytest.raises(KeyError):
             new_tab.loc[1]
+
+    def test_grid(self):
+        keys1, keys2 = np.meshgrid([0, 1, 3], [-2, 0, 2, 4], indexing="ij")
+        values = keys1 * 10 + keys2 ** 2
+        tab = HTable(
+            [keys1.ravel()[::-1], keys2.ravel()[::-1], values.ravel()[::-1]],
+            names=("x", "y", "v"), index=["x", "y"], units=[u.day, u.degree, u.degree]
+        )
+
+        assert tab.get(1, key2=2) == 14 * u.degree
+        assert tab.get(2, key2=1, with_unit=False) == 22
+        assert tab.get(0.5, key2=-1, with_unit=False) == 7
+
+        x = np.linspace(0, 3, 7)
+        y = np.linspace(-2, 4, 5)
+        many = tab.get_many(x, keys2=y[:, None], with_unit=False)
+        assert many.shape == (5, 7)
+        assert np.allclose(many, [[tab.get(i, key2=j, with_unit=False) for i in x] for j in y])
+        assert np.allclose(tab.get_many([24, 48] * u.hour, keys2=0).value, [10, 20])
+
+        with pytest.raises(IndexError):
+            tab.get(4, key2=0)
+        with pytest.raises(IndexError):
+            tab.get_many([0, 1], keys2=[0, 5])
+        with pytest.raises(TypeError):
+            tab.get(1)
+        with pytest.raises(TypeError):
+            tab.get(1, False)
+
+        tab.interpolate = quadratic_interpolation
+        assert isclose(tab.get(2, key2=1, with_unit=False), 21)
+
+        # Only the rows around the first argument are interpolated along the second one
+        keys1, keys2 = np.meshgrid(np.arange(8), np.arange(6), indexing="ij")
+        big = HTable(
+            [keys1.ravel(), keys2.ravel(), (keys1 ** 2 - 3 * keys2 ** 2).ravel()],
+            names=("x", "y", "v"), index=["x", "y"], interpolate=quadratic_interpolation
+        )
+        for x, y in ((0.5, 0.5), (3.25, 2.5), (6.5, 4.75)):
+            assert isclose(big.get(x, with_unit=False, key2=y), x ** 2 - 3 * y ** 2)
+
+        tab.remove_row(0)
+        with pytest.raises(ValueError):
+            tab.get(2, key2=1)
+        with pytest.raises(TypeError):
+            HTable(self.sample, index="a").get(1, key2=2)
@@ -0,0 +1,161 @@
+from fractions import Fraction
+from math import isclose
+
+import hypothesis.strategies as st
+import numpy as np
+import pandas as pd
+import pytest
+from hypothesis.core import given
+
+from kanon.tables import HTable
+from kanon.tables.interpolations import (DistributedInterpolation,
+                                         LagrangeInterpolation,
+                                         _CompiledLinear, linear_interpolation,
+                                         quadratic_interpolation)
+from kanon.units import Historical, Sexagesimal
+from kanon.units.precision import TruncatureMode, set_precision
+
+
+class TestInterpolations:
+
+    keys = np.array([0, 2, 3, 5, 8])
+
+    @given(st.lists(st.floats(min_value=0, max_value=8), min_size=1))
+    def test_linear(self, x):
+        values = np.array([3., -1., 4., 1.5, 9.])
+        compiled = linear_interpolation.compile(self.keys, values)
+        expected = np.interp(x, self.keys, values)
+        assert np.allclose(compiled.many(np.array(x)), expected)
+        assert isclose(compiled(x[0]), expected[0], abs_tol=1e-12)
+
+        df = pd.DataFrame({"v": values}, index=self.keys)
+        assert isclose(linear_interpolation(df, x[0]), expected[0], abs_tol=1e-12)
+
+        with pytest.raises(IndexError):
+            compiled(-1)
+        with pytest.raises(IndexError):
+            compiled.many(np.array([1, 9]))
+
+    def test_lagrange(self):
+        values = self.keys ** 3 - 2 * self.keys
+        x = np.linspace(0, 8, 17)
+
+        for order in (3, 4):
+            compiled = LagrangeInterpolation(order).compile(self.keys, values)
+            assert np.allclose(compiled.many(x), x ** 3 - 2 * x)
+
+        compiled = quadratic_interpolation.compile(self.keys, self.keys ** 2)
+        assert np.allclose(compiled.many(x), x ** 2)
+        assert compiled(7) == 49
+
+        with pytest.raises(ValueError):
+            LagrangeInterpolation(0)
+        with pytest.raises(ValueError):
+            LagrangeInterpolation(5).compile(self.keys, values)
+
+    def test_distributed(self):
+        keys = np.array([0, 4, 8])
+        values = np.array([0, 10, 30])
+
+        convex = DistributedInterpolation("convex").compile(keys, values)
+        assert np.allclose(convex.many(np.arange(9)), [0, 1, 3, 6, 10, 12, 16, 22, 30])
+        concave = DistributedInterpolation("concave").compile(keys, values)
+        assert np.allclose(concave.many(np.arange(9)), [0, 4, 7, 9, 10, 18, 24, 28, 30])
+
+        stepped = DistributedInterpolation("convex", step=2).compile(keys, values)
+        assert np.allclose(stepped.many(np.array([2, 6])), [10 / 3, 10 + 20 / 3])
+
+        with pytest.raises(ValueError):
+            DistributedInterpolation("linear")
+
+    def test_based(self):
+        keys = np.array([Sexagesimal(i) for i in (0, 2, 4, 6)] + [None])[:-1]
+        values = np.array([Sexagesimal(i * i) for i in (0, 2, 4, 6)] + [None])[:-1]
+
+        compiled = quadratic_interpolation.compile(keys, values)
+        assert compiled(Sexagesimal("2;30")) == Sexagesimal("6;15")
+        assert compiled(2.5) == Sexagesimal("6;15")
+        assert list(compiled.many(np.array([1, Sexagesimal(3)], dtype=object))) == [1, 9]
+
+        linear = linear_interpolation.compile(keys, values)
+        assert linear(Sexagesimal(1)) == 2
+        assert isinstance(linear(Sexagesimal(1)), Sexagesimal)
+
+        distributed = DistributedInterpolation("concave").compile(keys, values)
+        assert distributed(Sexagesimal(1)) == Sexagesimal("2;40")
+
+    @given(st.floats(min_value=0, max_value=6), st.integers(min_value=0, max_value=5))
+    def test_scaled(self, x, significant):
+        keys = np.array([Sexagesimal(i) for i in (0, 2, 4, 6)] + [None])[:-1]
+        values = np.array([Sexagesimal("0;20"), -Sexagesimal("1;0,7"), Sexagesimal("4;4,4"),
+                           Sexagesimal("0;1", remainder=Fraction(1, 3))] + [None])[:-1]
+        compiled = linear_interpolation.compile(keys, values)
+        legacy = _CompiledLinear(keys, values)
+
+        key = Sexagesimal.from_float(x, significant)
+        result = compiled(key)
+        assert isinstance(result, Sexagesimal)
+        assert result.significant == max(significant, 2)
+        assert result.truncate().equals(legacy(key).truncate())
+
+        segment = min(int(x) // 2, 2)
+        fkey = key.to_fraction()
+        fx, fy = keys[segment].to_fraction(), values[segment].to_fraction()
+        dx = keys[segment + 1].to_fraction() - fx
+        dy = values[segment + 1].to_fraction() - fy
+        assert isclose(result.to_fraction(), dy * (fkey - fx) / dx + fy, abs_tol=1e-20)
+
+        # The result is truncated once, instead of after each operation
+        with set_precision(pmode=1, tmode=TruncatureMode.TRUNC):
+            truncated = compiled(key)
+            assert truncated.significant == 1 and not truncated.remainder
+            assert truncated.equals(result.resize(1).truncate())
+
+        historical = np.array([Historical("1s 0;"), Historical("2s 0;")] + [None])[:-1]
+        assert linear_interpolation.compile(historical, historical)(Historical("1s 15;")) == Historical("1s 15;")
+
+    def test_table(self):
+        tab = HTable({"a": [0, 1, 2, 3], "b": [0, 1, 4, 9]}, index="a", interpolate=quadratic_interpolation)
+        assert tab.get(1.5) == 2.25
+        assert np.allclose(tab.get_many([0.5, 1, 2.5]), [0.25, 1, 6.25])
+
+        tab.interpolate = linear_interpolation
+        assert tab.get(1.5) == 2.5
+
+    def test_compiled_once(self, monkeypatch):
+        compiled = []
+        compile = LagrangeInterpolation.compile
+
+        def counting(self, keys, values):
+            compiled.append(len(keys))
+            return compile(self, keys, values)
+
+        monkeypatch.setattr(LagrangeInterpolation, "compile", counting)
+
+        tab = HTable({"a": [0, 1, 2, 3, 4], "b": [0, 1, 4, 9, 16]}, index="a", interpolate=quadratic_interpolation)
+        assert tab.get(1.5) == 2.25
+        assert np.allclose(tab.get_many([0.5, 2.5, 3.5]), [0.25, 6.25, 12.25])
+        assert tab.get(3.5) == 12.25
+        assert compiled == [5]
+        tab["b"][0] = 1
+        tab.get(0.5)
+        assert compiled == [5, 5]
+
+        # Interpolating a DataFrame only compiles the points around the key
+        compiled.clear()
+        df = pd.DataFrame({"b": [0, 1, 4, 9, 16]}, index=[0, 1, 2, 3, 4])
+        assert quadratic_interpolation(df, 2.5) == 6.25
+        assert compiled == [3]
+
+        # Rows of a grid are weighted by the first interpolation, compiled once per window
+        x = np.repeat(np.arange(5), 5)
+        y = np.tile(np.arange(5), 5)
+        grid = HTable([x, y, x ** 2 - 2 * y ** 2], names=("x", "y", "v"), index=["x", "y"],
+                      interpolate=quadratic_interpolation)
+        compiled.clear()
+        keys1 = np.linspace(0, 4, 20)
+        keys2 = np.linspace(4, 0, 20)
+        assert np.allclose(grid.get_many(keys1, keys2=keys2), keys1 ** 2 - 2 * keys2 ** 2)
+        assert all(isclose(grid.get(k1, key2=k2), k1 ** 2 - 2 * k2 ** 2) for k1, k2 in zip(keys1, keys2))
+        # 5 rows, then 3 unit vectors for each of the 3 windows
+        assert len(compiled) == 5 + 3 * 3
@@ -3,6 +3,7 @@ import pytest
 
 from kanon.tables.symmetries import (OutOfBoundsOriginError,
                                      OverlappingSymmetryError, Symmetry)
+from kanon.units import Sexagesimal
 
 
 class TestSymmetry:
@@ -55,3 +56,26 @@ class TestSymmetry:
 
         assert list(res.index) == [2, 3, 5, 10, 12, 13, 15, 17, 18]
         assert list(res["b"]) == [7, 6, 9, 9, 6, 7, 9, 6, 7]
+
+    def test_based_values(self):
+        index = pd.Index([Sexagesimal(1), Sexagesimal(2), Sexagesimal(4)], name="a")
+        df = pd.DataFrame({"b": [Sexagesimal("1;30"), Sexagesimal("-0;20"), Sexagesimal(3)]}, index=index)
+
+        res = df.pipe(Symmetry("mirror", sign=-1, offset=1, targets=[10, 20]))
+        assert res.index.name == "a"
+        assert list(res.index) == [1, 2, 4, 10, 12, 13, 20, 22, 23]
+        assert list(res["b"].iloc[3:6]) == [-2, Sexagesimal("1;20"), Sexagesimal("-0;30")]
+
+        with pytest.raises(OverlappingSymmetryError):
+            df.pipe(Symmetry("periodic", targets=[10, 12]))
+
+    def test_float_index(self):
+        df = pd.DataFrame({"v": [0., 10., 20., 30.]}, index=[0., 1., 2., 3.])
+
+        mirrored = df.pipe(Symmetry("mirror"))
+        assert list(mirrored.index) == [0, 1, 2, 3, 4, 5, 6]
+        assert list(mirrored["v"]) == [0, 10, 20, 30, 20, 10, 0]
+
+        targeted = df.pipe(Symmetry("mirror", sign=-1, targets=[4.5]))
+        assert list(targeted.index) == [0, 1, 2, 3, 4.5, 5.5, 6.5, 7.5]
+        assert list(targeted["v"]) == [0, 10, 20, 30, -30, -20, -10, 0]
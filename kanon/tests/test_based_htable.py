@@ -1,6 +1,16 @@
+import functools
 import json
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from math import isclose
-from typing import Tuple
+from typing import List, Tuple, cast
+from urllib.parse import parse_qs, urlparse
 
 import astropy.units as u
 import hypothesis.strategies as st
@@ -11,15 +21,29 @@ from astropy.units.quantity import Quantity
 from astropy.utils.data import get_pkg_data_filename
 from hypothesis.core import given
 
-from kanon.tables import HTable
+from kanon.tables import HTable, htable
+from kanon.tables.cache import TableCache, conf
 from kanon.tables.htable import DISHAS_REQUEST_URL
+from kanon.tables.interpolations import (DistributedInterpolation,
+                                         LagrangeInterpolation,
+                                         QuadraticInterpolation,
+                                         SeparableInterpolation,
+                                         linear_interpolation,
+                                         quadratic_interpolation)
+from kanon.tables.mapped import MappedHTable
+from kanon.tables.symmetries import Symmetry
 from kanon.units import Sexagesimal
+from kanon.units.radices import BasedQuantity
+
+
+def _mapped_get(view: MappedHTable, key: float) -> float:
+    return float(view.get(key, with_unit=False))
 
 
 class TestBasedHTable:
 
     @requests_mock.Mocker(kw="mock")
-    def test_read(self, **kwargs):
+    def test_read(self, table_cache, **kwargs):
         path = get_pkg_data_filename('data/table_content-180.json')
         with open(path, "r") as f:
             content = json.load(f)
@@ -38,6 +62,340 @@ class TestBasedHTable:
         with pytest.raises(FileNotFoundError):
             HTable.read(181, format="dishas")
 
+    @requests_mock.Mocker(kw="mock")
+    def test_read_double_entry(self, table_cache, **kwargs):
+        path = get_pkg_data_filename('data/table_content-180.json')
+        with open(path, "r") as f:
+            content = json.load(f)
+
+        entries = content["value_original"]["entry"]
+        args = content["value_original"]["args"]
+        args["argument2"] = args["argument1"][:3]
+        args["argument1"] = args["argument1"][:4]
+        content["value_original"]["entry"] = [entries[i * 3:i * 3 + 3] for i in range(4)]
+        content.update(
+            argument2_name="Anomaly",
+            argument2_type_of_number="integer and sexagesimal",
+            argument2_number_unit="degree"
+        )
+        kwargs["mock"].get(DISHAS_REQUEST_URL.format(180), json=content)
+
+        table: HTable = HTable.read(180, format="dishas")
+
+        assert len(table) == 12
+        assert table["Anomaly"].unit is u.degree
+        assert table.get(Sexagesimal(2), key2=Sexagesimal(3)).value.equals(Sexagesimal(0, 12, 53, sign=-1))
+
+        value = table.get(Sexagesimal("2;30"), with_unit=False, key2=Sexagesimal("1;30"))
+        assert isinstance(value, Sexagesimal)
+        expected = -np.mean([float(Sexagesimal(0, *x)) for x in ((8, 36), (10, 44), (15, 2), (17, 10))])
+        assert isclose(float(value), expected, abs_tol=1e-9)
+        values = table.get_many([Sexagesimal("2;30"), 3.5], keys2=[Sexagesimal("1;30"), 2])
+        assert values.unit is u.degree
+        assert values[0].value.equals(value)
+
+        content["value_original"]["entry"] = entries[:10]
+        kwargs["mock"].get(DISHAS_REQUEST_URL.format(180), json=content)
+        with pytest.raises(ValueError):
+            HTable.read(180, format="dishas", use_cache=False)
+
+    def test_read_many(self, table_cache, monkeypatch):
+        path = get_pkg_data_filename('data/table_content-180.json')
+        with open(path, "rb") as f:
+            content = f.read()
+
+        lock = threading.Lock()
+        running: List[str] = []
+        requested: List[str] = []
+        concurrency: List[int] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                table_id = parse_qs(urlparse(self.path).query)["id"][0]
+                with lock:
+                    running.append(table_id)
+                    requested.append(table_id)
+                    concurrency.append(len(running))
+                time.sleep(0.2)
+                with lock:
+                    running.remove(table_id)
+                body = content if table_id != "404" else b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setattr(
+            htable, "DISHAS_REQUEST_URL", f"http://127.0.0.1:{server.server_address[1]}/?id={{}}"
+        )
+        try:
+            start = time.perf_counter()
+            tables = HTable.read_many([180, 181, 182, 183, 404, 180], max_workers=3)
+            elapsed = time.perf_counter() - start
+
+            assert list(tables) == [180, 181, 182, 183]
+            assert all(len(t) == len(tables[180]) > 0 for t in tables.values())
+            assert isinstance(tables.errors[404], FileNotFoundError)
+            assert sorted(requested) == ["180", "181", "182", "183", "404"]
+            assert 1 < max(concurrency) <= 3
+            assert elapsed < 5 * 0.2
+
+            # Cached tables are loaded without any request
+            with conf.set_temp("offline", True):
+                tables = HTable.read_many([180, 183, 404])
+            assert list(tables) == [180, 183]
+            assert len(requested) == 5
+            assert not HTable.read_many([])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @requests_mock.Mocker(kw="mock")
+    def test_read_cache(self, table_cache: TableCache, **kwargs):
+        path = get_pkg_data_filename('data/table_content-180.json')
+        with open(path, "r") as f:
+            content = json.load(f)
+        mock = kwargs["mock"].get(DISHAS_REQUEST_URL.format(180), json=content)
+
+        table: HTable = HTable.read(180, format="dishas")
+        cached: HTable = HTable.read(180, format="dishas")
+        assert mock.call_count == 1
+        assert cached.colnames == table.colnames
+        assert cached.primary_key == table.primary_key
+        assert cached["Entries"].unit is u.degree
+        for name in table.colnames:
+            assert all(a.equals(b) for a, b in zip(cached[name], table[name]))
+        expected = cast(Quantity, table.get(Sexagesimal("2;30"))).value
+        assert cast(Quantity, cached.get(Sexagesimal("2;30"))).value.equals(expected)
+
+        HTable.read(180, format="dishas", use_cache=False)
+        assert mock.call_count == 2
+
+        with conf.set_temp("offline", True):
+            assert len(HTable.read(180, format="dishas")) == len(table)
+            with pytest.raises(FileNotFoundError):
+                HTable.read(181, format="dishas")
+        assert mock.call_count == 2
+
+        # Tables are parsed again from the raw content when their binary is missing
+        for binary in (table_cache.path / "objects").glob("*.kanon"):
+            binary.unlink()
+        assert table_cache.load_table("dishas-180") is None
+        assert len(HTable.read(180, format="dishas")) == len(table)
+        assert mock.call_count == 2
+        assert table_cache.load_table("dishas-180") is not None
+
+        small = TableCache(size_limit=table_cache.size - 1)
+        small.store("other", b"{}")
+        assert small.load("other") == b"{}"
+        assert small.load("dishas-180") is None
+        assert small.size <= small.size_limit
+
+        table_cache.clear()
+        assert table_cache.size == 0
+        HTable.read(180, format="dishas")
+        assert mock.call_count == 3
+
+    @requests_mock.Mocker(kw="mock")
+    def test_read_cache_objects(self, table_cache: TableCache, **kwargs):
+        path = get_pkg_data_filename('data/table_content-180.json')
+        with open(path, "r") as f:
+            content = json.load(f)
+        # Entries without a number reader are kept as lists of strings
+        content["entry_type_of_number"] = "decimal"
+        mock = kwargs["mock"].get(DISHAS_REQUEST_URL.format(180), json=content)
+
+        table: HTable = HTable.read(180, format="dishas")
+        cached: HTable = HTable.read(180, format="dishas")
+        assert mock.call_count == 1
+        assert not list((table_cache.path / "objects").glob("*.kanon"))
+        assert list(cached["Entries"][0]) == ["-0", "02", "10"]
+        assert np.array_equal(cached["Entries"], table["Entries"])
+
+    def test_cache_attributes(self, table_cache: TableCache):
+        table = HTable(
+            [[Sexagesimal(i) for i in range(4)], [1.5, 2.5, 3.5, 4.5]],
+            names=("A", "B"), index="A", dtype=[object, float],
+            symmetry=[Symmetry("mirror", sign=-1, source=(0, 2))], opposite=True,
+            interpolate=quadratic_interpolation, meta={"author": "Ptolemy"}
+        )
+        table_cache.store("table", b"{}", table)
+        cached = cast(HTable, table_cache.load_table("table"))
+        assert cached.symmetry == table.symmetry
+        assert cached.opposite
+        assert isinstance(cached.interpolate, QuadraticInterpolation)
+        assert cached.meta["author"] == "Ptolemy"
+        assert cached["B"].dtype == np.float64
+
+        # Tables with custom interpolations are not stored as binaries
+        table.interpolate = lambda df, key: 0
+        table_cache.store("custom", b"{ }", table)
+        assert table_cache.load("custom") == b"{ }"
+        assert table_cache.load_table("custom") is None
+
+    def test_kanon_format(self, tmp_path):
+        values = [Sexagesimal("1;30"), -Sexagesimal("0;20,15"), Sexagesimal((1, 2), (3,), remainder=Decimal("0.25"))]
+        table = HTable(
+            [[Sexagesimal(i) for i in range(3)], values, [1.5, 2.5, 3.5]],
+            names=("A", "B", "C"), index="A", units=[u.day, u.degree, None], dtype=[object, object, float],
+            symmetry=[Symmetry("mirror", sign=-1)], interpolate=quadratic_interpolation, meta={"author": "Ptolemy"}
+        )
+        path = tmp_path / "table.kanon"
+        table.write(path)
+        with pytest.raises(OSError):
+            table.write(path)
+        table.write(path, overwrite=True)
+
+        for memmap in (False, True):
+            read: HTable = HTable.read(path, memmap=memmap)
+            assert read.colnames == table.colnames
+            assert read.primary_key == ("A",)
+            assert read["B"].unit is u.degree
+            assert all(a.equals(b) for a, b in zip(read["B"], values))
+            assert all(a.equals(b) for a, b in zip(read["A"], table["A"]))
+            assert read.symmetry == table.symmetry
+            assert isinstance(read.interpolate, QuadraticInterpolation)
+            assert read.meta["author"] == "Ptolemy"
+            assert np.array_equal(read["C"], table["C"])
+            assert len(read.to_pandas()) == 5
+        # Numerical columns are read-only views of the mapped file
+        base = read["C"].base
+        while not isinstance(base, np.memmap):
+            base = base.base
+        assert not read["C"].flags.writeable
+
+        grid = HTable(
+            [[0, 0, 1, 1], [0, 10, 0, 10], [0., 10., 20., 40.]], names=("x", "y", "v"), index=["x", "y"]
+        )
+        grid.write(tmp_path / "grid", format="kanon")
+        assert HTable.read(tmp_path / "grid", format="kanon").get(0.5, key2=5) == 17.5
+
+        # Other interpolations are stored with their parameters, and symmetries with BasedReal bounds
+        table.interpolate = DistributedInterpolation("concave", Sexagesimal("0;30"))
+        table.symmetry = [Symmetry("periodic", offset=Sexagesimal("0;30"), targets=[Sexagesimal(10)])]
+        table.write(path, overwrite=True)
+        read = HTable.read(path)
+        assert isinstance(read.interpolate, DistributedInterpolation)
+        assert vars(read.interpolate) == vars(table.interpolate)
+        assert read.symmetry == table.symmetry
+        assert read.symmetry[0].offset.equals(Sexagesimal("0;30"))
+        assert read.get(Sexagesimal("1;30")).value.equals(table.get(Sexagesimal("1;30")).value)
+
+        table.symmetry = []
+        table.interpolate = LagrangeInterpolation(3)
+        table.write(path, overwrite=True)
+        assert HTable.read(path).interpolate.order == 3
+        assert MappedHTable(path).interpolate.order == 3
+
+        grid.interpolate = SeparableInterpolation(linear_interpolation, DistributedInterpolation("convex", 5))
+        grid.write(tmp_path / "grid", format="kanon", overwrite=True)
+        read = HTable.read(tmp_path / "grid", format="kanon")
+        assert vars(read.interpolate.second) == {"direction": "convex", "step": 5}
+        assert read.get(0.5, key2=5) == grid.get(0.5, key2=5)
+
+        table.interpolate = lambda df, key: 0
+        with pytest.raises(TypeError):
+            table.write(tmp_path / "custom.kanon")
+        table.interpolate = quadratic_interpolation
+        table.symmetry = [Symmetry("periodic", offset=Fraction(1, 2))]
+        with pytest.raises(TypeError):
+            table.write(tmp_path / "custom.kanon")
+        assert not (tmp_path / "custom.kanon").exists()
+        (tmp_path / "other.kanon").write_bytes(b"other")
+        with pytest.raises(ValueError):
+            HTable.read(tmp_path / "other.kanon")
+
+    def test_apply(self):
+        obl = Sexagesimal("23;51,20")
+        table = HTable(
+            [list(range(6)), [Sexagesimal.from_int(i) >> 1 for i in range(6)]],
+            names=("A", "B"), index="A", units=[None, u.degree], dtype=[int, object]
+        )
+        expected = [v * obl for v in table["B"]]
+
+        arguments = []
+
+        def func(x):
+            arguments.append(type(x))
+            return x * obl
+
+        product = table.apply("B", func)
+        assert arguments == [Sexagesimal.base.array_type]
+        assert product["B"].unit is u.degree
+        assert all(a.equals(b) for a, b in zip(product["B"], expected))
+
+        # Lookups in other tables are computed on the whole column
+        lookup = table.apply("B", lambda x: product.get(x * 60, with_unit=False))
+        assert all(a.equals(b) for a, b in zip(lookup["B"], expected))
+
+        # Remainders are the same as those computed row by row
+        quotient = table.apply("B", lambda x: x / 7)
+        assert all(a.equals(b / 7) for a, b in zip(quotient["B"], table["B"]))
+        assert any(a.remainder for a in quotient["B"])
+        lookup = table.apply("B", lambda x: quotient.get(x * 50 + Sexagesimal("0;20"), with_unit=False))
+        expected = [quotient.get(v * 50 + Sexagesimal("0;20"), with_unit=False) for v in table["B"]]
+        assert all(a.equals(b) for a, b in zip(lookup["B"], expected))
+
+        # Values of mixed precisions are computed one by one
+        table["B"][0] = Sexagesimal("0;0,30")
+        assert table.apply("B", func)["B"][0].equals(Sexagesimal("0;0,30") * obl)
+        assert arguments[-1] is not Sexagesimal.base.array_type
+
+        parallel = table.apply("B", lambda x: x * obl, processes=2)
+        assert all(a.equals(b * obl) for a, b in zip(parallel["B"], table["B"]))
+        assert table.apply("B", float, processes=2)["B"].dtype == np.float64
+
+    def test_mapped(self, tmp_path):
+        table = HTable(
+            [[Sexagesimal.from_int(i) for i in range(10)], [Sexagesimal.from_int(i * i) / 7 for i in range(10)]],
+            names=("A", "B"), index="A", units=[u.day, u.degree], dtype=[object, object]
+        )
+        table.write(tmp_path / "table.kanon")
+        table.interpolate = quadratic_interpolation
+        table.write(tmp_path / "quadratic.kanon")
+
+        for name in ("table.kanon", "quadratic.kanon"):
+            view = MappedHTable(tmp_path / name)
+            table = view.to_table()
+            assert len(view) == 10 and view.colnames == ["A", "B"]
+            assert view["B"][-1].equals(table["B"][-1])
+            for key in (Sexagesimal("2;30"), 3, 8.5):
+                assert view.get(key, with_unit=False).equals(table.get(key, with_unit=False))
+                assert view.get(key).unit is u.degree
+            assert np.all(view.get_many([1.5, 3] * u.day) == table.get_many([1.5, 3]))
+            with pytest.raises(IndexError):
+                view.get(10)
+
+        # Views are sent to other processes as their path
+        view = pickle.loads(pickle.dumps(view))
+        assert isinstance(view._buffer, np.memmap)
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork")) as pool:
+            assert list(pool.map(functools.partial(_mapped_get, view), [1.5, 4.5])) == \
+                [float(table.get(k, with_unit=False)) for k in (1.5, 4.5)]
+
+        floats = HTable([[0., 1., 3.], [0., 1., 9.]], names=("x", "y"), index="x")
+        floats.write(tmp_path / "floats.kanon")
+        assert MappedHTable(tmp_path / "floats.kanon").get(2) == floats.get(2) == 5
+
+        HTable([[0., 3., 1.], [0., 1., 9.]], names=("x", "y"), index="x").write(tmp_path / "unsorted.kanon")
+        with pytest.raises(ValueError):
+            MappedHTable(tmp_path / "unsorted.kanon")
+        floats.symmetry = [Symmetry("mirror")]
+        floats.write(tmp_path / "symmetry.kanon")
+        with pytest.raises(ValueError):
+            MappedHTable(tmp_path / "symmetry.kanon")
+        HTable([[0, 1], [0, 1], [0., 1.]], names=("x", "y", "v"), index=["x", "y"]).write(tmp_path / "grid.kanon")
+        with pytest.raises(TypeError):
+            MappedHTable(tmp_path / "grid.kanon")
+
     gen_table_strategy = st.builds(
         HTable,
         st.lists(
@@ -63,6 +421,45 @@ class TestBasedHTable:
         sres = tab.get(key)
         assert isclose(fres, float(sres), abs_tol=1e9)
 
+    @given(gen_table_strategy.flatmap(
+        lambda x: st.tuples(st.lists(st.floats(
+            min_value=float(min(x["A"])),
+            max_value=float(max(x["A"])),
+            allow_nan=False
+        ), min_size=1, max_size=5), st.just(x))))
+    def test_get_many(self, hypo: Tuple[List[float], HTable]):
+        keys, tab = hypo
+        keys = keys + list(tab["A"][:2])
+        tab["B"].unit = u.degree
+        try:
+            expected = [cast(Quantity, tab.get(key)).value for key in keys]
+        except IndexError:
+            # Float keys converted to Sexagesimal may round out of the table bounds
+            with pytest.raises(IndexError):
+                tab.get_many(keys)
+            return
+
+        values = cast(Quantity, tab.get_many(keys))
+        assert values.unit is u.degree
+        for value, expected_value in zip(values, expected):
+            assert value.value.equals(expected_value)
+
+    def test_get_many_empty(self):
+        tab = HTable(
+            [[Sexagesimal(i) for i in range(3)], [Sexagesimal(i) >> 1 for i in range(3)]],
+            names=("A", "B"), index="A", units=(None, u.degree)
+        )
+
+        values = tab.get_many([])
+        assert isinstance(values, BasedQuantity)
+        assert values.unit is u.degree
+        assert values.dtype == object
+        assert values.shape == (0,)
+        assert tab.get_many([], with_unit=False).dtype == object
+
+        tab.interpolate = lambda df, key: df.iloc[0, 0]
+        assert tab.get_many([], with_unit=False).dtype == object
+
     @given(gen_table_strategy)
     def test_quantity(self, tab: HTable):
         tab["A"].unit = u.degree
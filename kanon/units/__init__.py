@@ -1,6 +1,7 @@
+from .arrays import BasedRealArray
 from .radices import BasedReal, RadixBase, radix_registry
 
-__all__ = ["RadixBase", "BasedReal"]
+__all__ = ["RadixBase", "BasedReal", "BasedRealArray"]
 
 # Load all common radices
 
@@ -0,0 +1,647 @@
+"""
+In this module we define `BasedRealArray`, a vectorized collection of
+`~kanon.units.radices.BasedReal` numbers sharing the same `~kanon.units.radices.RadixBase`.
+
+Each `~kanon.units.radices.RadixBase` builds its own BasedRealArray class, accessible
+through its ``array_type`` attribute.
+Values are stored as a sign vector, a fixed-width integer digit matrix and a remainder
+vector of `~decimal.Decimal` objects, so that arithmetical operations are computed column by
+column with NumPy instead of one Python call per element. Remainders are computed like those
+of `~kanon.units.radices.BasedReal` operations, and are exactly the same.
+
+>>> from kanon.units import Sexagesimal
+>>> SexagesimalArray = Sexagesimal.base.array_type
+>>> array = SexagesimalArray([Sexagesimal("1;30"), Sexagesimal("-0;20,15")])
+>>> array
+SexagesimalArray([01 ; 30,00, -00 ; 20,15])
+>>> array + Sexagesimal("0;45")
+SexagesimalArray([02 ; 15,00, 00 ; 24,45])
+>>> array * 2
+SexagesimalArray([03 ; 00,00, -00 ; 40,30])
+>>> array > 0
+array([ True, False])
+
+.. testsetup::
+
+    >>> import builtins
+    >>> builtins.Sexagesimal = Sexagesimal
+    >>> builtins.SexagesimalArray = SexagesimalArray
+"""
+
+import math
+from decimal import Decimal
+from typing import (TYPE_CHECKING, Any, Callable, Iterable, Optional, Tuple,
+                    Type, Union, cast)
+
+import numpy as np
+
+from .precision import PreciseNumber
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .radices import BasedReal, RadixBase
+
+__all__ = ["BasedRealArray"]
+
+#: Floor of each number of an object array, as Python integers
+_floor = np.frompyfunc(math.floor, 1, 1)
+#: Each number of an object array as a `~decimal.Decimal`
+_decimals = np.frompyfunc(Decimal, 1, 1)
+
+
+def _zeros(size: int) -> np.ndarray:
+    """Null remainders"""
+    return np.full(size, Decimal(0), dtype=object)
+
+
+class BasedRealArray(PreciseNumber):
+    """
+    Abstract class representing a one dimensional array of `~kanon.units.radices.BasedReal`
+    of a specific `~kanon.units.radices.RadixBase`.
+    Each time a new `~kanon.units.radices.RadixBase` object is recorded, a new class
+    inheriting from BasedRealArray is created and stored in its ``array_type`` attribute.
+
+    All the numbers of an array share the same number of significant positions.
+    Integer positions are stored in as many columns as needed by the widest number.
+
+    Class attributes:
+       - base :        A `~kanon.units.radices.RadixBase` object (will be attributed dynamically to the children inheriting this class)
+    """
+
+    base: "RadixBase"
+    """`~kanon.units.radices.RadixBase` of this BasedRealArray"""
+
+    #: Let NumPy defer binary operations to this class
+    __array_ufunc__ = None
+
+    def __init__(self, values: Iterable["BasedReal"] = (), significant: Optional[int] = None):
+        """Builds an array from a sequence of `~kanon.units.radices.BasedReal` of the
+        same radix.
+
+        >>> SexagesimalArray([Sexagesimal("1;2,3"), Sexagesimal(4)])
+        SexagesimalArray([01 ; 02,03, 04 ; 00,00])
+        >>> SexagesimalArray([Sexagesimal("1;2,30")], significant=1)
+        SexagesimalArray([01 ; 02 |r0.5])
+
+        :param values: Numbers to store in this array
+        :param significant: Precision of the array, defaults to the maximum precision of `values`
+        :raises TypeError: Raised when a value is not of this array's radix
+        """
+        if type(self) is BasedRealArray:
+            raise TypeError("Can't instanciate abstract class BasedRealArray")
+
+        values = list(values)
+        for v in values:
+            if type(v) is not self.base.type:
+                raise TypeError(f"{v!r} is not a {self.base.type.__name__}")
+
+        if significant is None:
+            significant = max((v.significant for v in values), default=0)
+
+        resized = [v.resize(significant) for v in values]
+        width = significant + max((len(v.left) for v in resized), default=1)
+
+        digits = np.zeros((len(resized), width), dtype=np.int64)
+        for i, v in enumerate(resized):
+            row = v[:]
+            digits[i, width - len(row):] = row
+
+        remainder = np.empty(len(resized), dtype=object)
+        remainder[:] = [v.remainder for v in resized]
+        normalized = self._normalized(
+            np.array([v.sign for v in resized], dtype=np.int8), digits, remainder, significant
+        )
+        self._set(normalized._sign, normalized._digits, normalized._remainder, significant)
+
+    def _set(self, sign: np.ndarray, digits: np.ndarray, remainder: np.ndarray, significant: int):
+        self._sign = sign
+        self._digits = digits
+        self._remainder = remainder
+        self._significant = significant
+
+    @classmethod
+    def _from_digits(
+        cls, sign: np.ndarray, digits: np.ndarray, remainder: np.ndarray, significant: int
+    ) -> "BasedRealArray":
+        """
+        Builds a new array from already normalized digits, without any validation.
+        """
+        self = cls.__new__(cls)
+        self._set(sign, digits, remainder, significant)
+        return self
+
+    @classmethod
+    def from_float(cls, values: Union[Iterable[float], np.ndarray], significant: int) -> "BasedRealArray":
+        """
+        Class method to produce a new array from floating numbers
+
+        >>> SexagesimalArray.from_float([1/3, -2.5], 2)
+        SexagesimalArray([00 ; 20,00, -02 ; 30,00])
+
+        :param values: floating values of the numbers
+        :param significant: precision of the numbers
+        :return: a new BasedRealArray object
+        """
+        floats = np.asarray(values, dtype=np.float64).reshape(-1)
+        if not np.isfinite(floats).all():
+            raise ValueError("Can't convert non finite values")
+
+        sign = np.where(floats < 0, -1, 1).astype(np.int8)
+        value = np.abs(floats)
+
+        integer = np.floor(value)
+        value -= integer
+        integer = integer.astype(np.int64)
+
+        columns = []
+        for pos in range(1, significant + 1):
+            value *= cls.base[pos]
+            column = np.floor(value)
+            value -= column
+            columns.append(column.astype(np.int64))
+
+        left = []
+        pos = 0
+        while True:
+            integer, column = np.divmod(integer, cls.base[pos])
+            left.append(column)
+            pos -= 1
+            if not integer.any():
+                break
+
+        digits = np.stack(left[::-1] + columns, axis=1)
+        return cls._normalized(sign, digits, _decimals(value), significant)
+
+    @property
+    def significant(self) -> int:
+        """
+        Precision of the numbers of this array
+
+        :rtype: int
+        """
+        return self._significant
+
+    @property
+    def sign(self) -> np.ndarray:
+        """
+        Signs of the numbers of this array
+
+        :rtype: numpy.ndarray
+        """
+        return self._sign
+
+    @property
+    def digits(self) -> np.ndarray:
+        """
+        Digit matrix of this array, one row per number. The last `significant` columns are
+        the fractional positions.
+
+        :rtype: numpy.ndarray
+        """
+        return self._digits
+
+    @property
+    def remainder(self) -> np.ndarray:
+        """
+        Remainders of the numbers of this array, as `~decimal.Decimal` objects between [0, 1[
+
+        :rtype: numpy.ndarray
+        """
+        return self._remainder
+
+    def __len__(self) -> int:
+        return len(self._digits)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, key):
+        """
+        Gets a `~kanon.units.radices.BasedReal` at an integer position,
+        or a new array when `key` is a slice, a mask or an array of indices.
+        """
+        if isinstance(key, (int, np.integer)):
+            digits = self._digits[key].tolist()
+            integer = len(digits) - self.significant
+            first = 0
+            while first < integer - 1 and digits[first] == 0:
+                first += 1
+            return self.base.type._from_digits(
+                tuple(digits[first:integer]),
+                tuple(digits[integer:]),
+                self._remainder[key],
+                int(self._sign[key])
+            )
+        return self._from_digits(self._sign[key], self._digits[key], self._remainder[key], self.significant)
+
+    def _compact(self) -> Tuple[list, list, list, int]:
+        return (self._sign.tolist(), self._digits.tolist(), [str(r) for r in self._remainder], self._significant)
+
+    def to_basedreals(self) -> np.ndarray:
+        """
+        :return: this array as a `numpy.ndarray` of `~kanon.units.radices.BasedReal` objects
+        """
+        objects = np.empty(len(self), dtype=object)
+        objects[:] = list(self)
+        return objects
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Converts this array to a float `numpy.ndarray`
+
+        >>> np.asarray(SexagesimalArray.from_float([1.5, -0.25], 2))
+        array([ 1.5 , -0.25])
+        """
+        value = np.zeros(len(self), dtype=np.float64)
+        for column, radix in zip(self._digits.T, self._radices()):
+            value = value * radix + column
+        value = (value + self._remainder.astype(np.float64)) / self._factor(self.significant)
+        return (value * self._sign).astype(dtype or np.float64)
+
+    def __float__(self) -> float:
+        if len(self) != 1:
+            raise TypeError("Only arrays of size 1 can be converted to float")
+        return float(np.asarray(self)[0])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}([{', '.join(repr(x) for x in self)}])"
+
+    __str__ = __repr__
+
+    # Digit matrix helpers
+
+    @classmethod
+    def _radices_for(cls, width: int, significant: int) -> np.ndarray:
+        """Radix of each column of a digit matrix"""
+        return np.array([cls.base[pos] for pos in range(significant - width + 1, significant + 1)],
+                        dtype=np.int64)
+
+    def _radices(self) -> np.ndarray:
+        return self._radices_for(self._digits.shape[1], self.significant)
+
+    @classmethod
+    def _factor(cls, significant: int) -> int:
+        return cls.base.factor_at_pos(significant)
+
+    @classmethod
+    def _uniform(cls) -> bool:
+        return not cls.base.mixed
+
+    @classmethod
+    def _normalized(
+        cls, sign: np.ndarray, digits: np.ndarray, remainder: np.ndarray, significant: int
+    ) -> "BasedRealArray":
+        """
+        Propagates carries column-wise, from the least significant position to the most
+        significant one. Rows whose value is negative are negated and their sign flipped.
+        """
+        digits = digits.copy()
+        remainder = np.array(remainder, dtype=object)
+        if digits.shape[1] <= significant:
+            padding = np.zeros((len(digits), significant + 1 - digits.shape[1]), dtype=np.int64)
+            digits = np.concatenate([padding, digits], axis=1)
+
+        for _ in range(2):
+            carry = _floor(remainder)
+            remainder = remainder - carry
+            digits[:, -1] += carry.astype(np.int64)
+
+            radices = cls._radices_for(digits.shape[1], significant)
+            for j in range(digits.shape[1] - 1, 0, -1):
+                carry, digits[:, j] = np.divmod(digits[:, j], radices[j])
+                digits[:, j - 1] += carry
+
+            while (digits[:, 0] >= radices[0]).any():
+                carry, digits[:, 0] = np.divmod(digits[:, 0], radices[0])
+                digits = np.concatenate([carry[:, None], digits], axis=1)
+                radices = cls._radices_for(digits.shape[1], significant)
+
+            negative = digits[:, 0] < 0
+            if not negative.any():
+                break
+            digits[negative] *= -1
+            remainder[negative] *= -1
+            sign = np.where(negative, -sign, sign).astype(np.int8)
+
+        # Remove useless leading zero columns, keeping at least one integer column
+        leading_zeros = ~digits[:, :digits.shape[1] - significant - 1].any(axis=0)
+        first = len(leading_zeros) if leading_zeros.all() else int(np.argmin(leading_zeros))
+        return cls._from_digits(sign, digits[:, first:], remainder, significant)
+
+    def _padded(self, width: int) -> np.ndarray:
+        """Digit matrix with zero columns added on the left up to the specified width"""
+        pad = width - self._digits.shape[1]
+        if pad <= 0:
+            return self._digits
+        return np.concatenate([np.zeros((len(self), pad), dtype=np.int64), self._digits], axis=1)
+
+    def _coerce(self, other: Any) -> "BasedRealArray":
+        """Converts an operand to an array of the same radix"""
+        if isinstance(other, type(self)):
+            return other
+        if isinstance(other, self.base.type):
+            return type(self)([other])
+        if isinstance(other, (np.ndarray, list, tuple)) and np.asarray(other).dtype == object:
+            return type(self)(np.asarray(other).ravel())
+        if isinstance(other, (int, float, np.number, np.ndarray, list, tuple)):
+            return self.from_float(np.broadcast_to(np.asarray(other, dtype=np.float64), (len(self),)),
+                                   self.significant)
+        raise TypeError(f"Unsupported operand type {type(other).__name__}")
+
+    def _broadcast(self, other: "BasedRealArray") -> Tuple["BasedRealArray", "BasedRealArray"]:
+        if len(other) == len(self):
+            return self, other
+        if len(other) == 1:
+            index = np.zeros(len(self), dtype=np.intp)
+            return self, other[index]
+        if len(self) == 1:
+            index = np.zeros(len(other), dtype=np.intp)
+            return self[index], other
+        raise ValueError(f"Can't broadcast arrays of length {len(self)} and {len(other)}")
+
+    def _elementwise(self, func: Callable[[Any, Any], "BasedReal"], other: "BasedRealArray") -> "BasedRealArray":
+        """Computes an operation element by element on `~kanon.units.radices.BasedReal` objects"""
+        values = [func(a, b) for a, b in zip(self, other)]
+        return type(self)(values)
+
+    def _magnitudes(self) -> np.ndarray:
+        """Absolute values scaled at this array's precision, as Python integers"""
+        value = np.zeros(len(self), dtype=object)
+        for column, radix in zip(self._digits.T, self._radices()):
+            value = value * int(radix) + column.astype(object)
+        return value
+
+    # PreciseNumber interface
+
+    def resize(self, significant: int) -> "BasedRealArray":
+        """
+        Resizes and returns a new array to the specified precision
+
+        >>> SexagesimalArray([Sexagesimal("1;2,3")]).resize(1).resize(3)
+        SexagesimalArray([01 ; 02,03,00])
+
+        :param significant: Number of desired significant positions
+        :return: Resized BasedRealArray
+        """
+        if significant == self.significant:
+            return self
+        if significant < 0:
+            raise NotImplementedError
+
+        # Remainders are scaled at once, as in `~kanon.units.radices.BasedReal.resize`
+        if significant > self.significant:
+            remainder = self._remainder * (self._factor(significant) // self._factor(self.significant))
+            carry = _floor(remainder)
+            remainder = remainder - carry
+            columns = []
+            for pos in range(significant, self.significant, -1):
+                columns.append((carry % self.base[pos]).astype(np.int64)[:, None])
+                carry = carry // self.base[pos]
+            digits = np.concatenate([self._digits] + columns[::-1], axis=1)
+            return self._from_digits(self._sign, digits, remainder, significant)
+
+        dropped = self.significant - significant
+        rest = np.zeros(len(self), dtype=object)
+        for column, radix in zip(self._digits[:, -dropped:].T, self._radices()[-dropped:]):
+            rest = rest * int(radix) + column.astype(object)
+        remainder = (rest + self._remainder) / (self._factor(self.significant) // self._factor(significant))
+        return self._from_digits(self._sign, self._digits[:, :-dropped], remainder, significant)
+
+    def truncate(self, significant: Optional[int] = None) -> "BasedRealArray":
+        """
+        Truncates the numbers of this array to the specified precision
+
+        >>> SexagesimalArray([Sexagesimal("1;2,53")]).truncate(1)
+        SexagesimalArray([01 ; 02])
+
+        :param significant: Desired significant positions
+        :return: Truncated BasedRealArray
+        """
+        if significant is None:
+            significant = self.significant
+        if significant > self.significant:
+            return self
+        resized = self.resize(significant)
+        return self._normalized(resized._sign, resized._digits, _zeros(len(self)), significant)
+
+    def _increment(self, significant: Optional[int], mask_func: Callable[["BasedRealArray"], np.ndarray]):
+        resized = self.resize(self.significant if significant is None else significant)
+        digits = resized._digits.copy()
+        digits[:, -1] += mask_func(resized)
+        return self._normalized(resized._sign, digits, _zeros(len(self)), resized.significant)
+
+    def __round__(self, significant: Optional[int] = None) -> "BasedRealArray":
+        """
+        Rounds the numbers of this array to the specified precision
+
+        >>> round(SexagesimalArray([Sexagesimal("1;2,53"), Sexagesimal("-1;2,13")]), 1)
+        SexagesimalArray([01 ; 03, -01 ; 02])
+
+        :param significant: Number of desired significant positions
+        :return: Rounded BasedRealArray
+        """
+        return self._increment(significant, lambda x: x._remainder >= 0.5)
+
+    def ceil(self, significant: Optional[int] = None) -> "BasedRealArray":
+        return self._increment(significant, lambda x: (x._remainder > 0) & (x._sign > 0))
+
+    def floor(self, significant: Optional[int] = None) -> "BasedRealArray":
+        return self._increment(significant, lambda x: (x._remainder > 0) & (x._sign < 0))
+
+    def shift(self, i: int) -> "BasedRealArray":
+        """
+        Shifts numbers to the left (-) or the right (+).
+        Prefer using >> and << operators (right-shift and left-shift).
+
+        >>> SexagesimalArray([Sexagesimal(3)]) >> 2
+        SexagesimalArray([00 ; 00,03])
+
+        :param i: Amount to shift this BasedRealArray
+        :return: Shifted numbers
+        """
+        if i == 0:
+            return self
+        if not self._uniform():
+            return type(self)([x.shift(i) for x in self])
+        if i < 0:
+            resized = self.resize(max(self.significant, -i))
+            return self._normalized(resized._sign, resized._digits, resized._remainder, resized.significant + i)
+        return self._normalized(self._sign, self._digits, self._remainder, self.significant + i)
+
+    def __lshift__(self, other: int) -> "BasedRealArray":
+        """self << other"""
+        return self.shift(-other)
+
+    def __rshift__(self, other: int) -> "BasedRealArray":
+        """self >> other"""
+        return self.shift(other)
+
+    def __neg__(self) -> "BasedRealArray":
+        """-self"""
+        return self._from_digits(-self._sign, self._digits, self._remainder, self.significant)
+
+    def __pos__(self) -> "BasedRealArray":
+        """+self"""
+        return self
+
+    def __abs__(self) -> "BasedRealArray":
+        """abs(self)"""
+        return self._from_digits(np.ones(len(self), dtype=np.int8), self._digits,
+                                 self._remainder, self.significant)
+
+    def _add(self, _other: PreciseNumber) -> "BasedRealArray":
+        a, b = self._broadcast(cast(BasedRealArray, _other))
+
+        significant = max(a.significant, b.significant)
+        va = a.resize(significant)
+        vb = b.resize(significant)
+        width = max(va._digits.shape[1], vb._digits.shape[1]) + 1
+
+        digits = va._sign[:, None] * va._padded(width) + vb._sign[:, None] * vb._padded(width)
+        remainder = va._remainder * va._sign + vb._remainder * vb._sign
+
+        return self._normalized(np.ones(len(a), dtype=np.int8), digits, remainder, significant)
+
+    def _sub(self, _other: PreciseNumber) -> "BasedRealArray":
+        return self._add(-cast(BasedRealArray, _other))
+
+    def _mul(self, _other: PreciseNumber) -> "BasedRealArray":
+        a, b = self._broadcast(cast(BasedRealArray, _other))
+
+        if not self._uniform():
+            return a._elementwise(lambda x, y: x._mul(y), b)
+
+        significant = max(a.significant, b.significant)
+        va = a.resize(significant)
+        vb = b.resize(significant)
+
+        # Digit product, computed as a convolution of both digit matrices
+        width = va._digits.shape[1] + vb._digits.shape[1]
+        digits = np.zeros((len(a), width), dtype=np.int64)
+        for i, column in enumerate(va._digits.T[::-1]):
+            stop = width - i
+            digits[:, stop - vb._digits.shape[1]:stop] += column[:, None] * vb._digits
+
+        remainder = (va._magnitudes() * vb._remainder
+                     + vb._magnitudes() * va._remainder
+                     + va._remainder * vb._remainder)
+
+        null = ~(va._digits.any(axis=1) | (va._remainder != 0)) | ~(vb._digits.any(axis=1) | (vb._remainder != 0))
+        sign = np.where(null, 1, va._sign * vb._sign).astype(np.int8)
+
+        return self._normalized(sign, digits, remainder, 2 * significant)
+
+    def _truediv(self, _other: PreciseNumber) -> "BasedRealArray":
+        a, b = self._broadcast(cast(BasedRealArray, _other))
+
+        significant = max(a.significant, b.significant)
+        va = a.resize(significant)
+        vb = b.resize(significant)
+
+        numerator = va._magnitudes()
+        denominator = vb._magnitudes()
+        null_numerator = (numerator == 0) & (va._remainder == 0)
+        null_denominator = (denominator == 0) & (vb._remainder == 0)
+        if (null_denominator & ~null_numerator).any():
+            raise ZeroDivisionError
+
+        # Remainders of the operands make the quotient a fraction, computed as in
+        # `~kanon.units.radices.BasedReal` divisions
+        radix = self.base[1]
+        if (
+            not self._uniform()
+            or (va._remainder != 0).any()
+            or (vb._remainder != 0).any()
+            or (denominator * radix >= 2 ** 62).any()
+        ):
+            return a._elementwise(lambda x, y: x._truediv(y), b)
+
+        divisor = denominator.astype(np.int64)
+        divisor[null_denominator] = 1
+
+        # Long division of the numerator digits, followed by `significant` zeros,
+        # by the integer denominators, one column at a time
+        dividend = np.concatenate([va._digits, np.zeros((len(a), significant), dtype=np.int64)], axis=1)
+        digits = np.zeros_like(dividend)
+        rest = np.zeros(len(a), dtype=np.int64)
+        for j in range(dividend.shape[1]):
+            digits[:, j], rest = np.divmod(rest * radix + dividend[:, j], divisor)
+
+        remainder = _decimals(rest.astype(object)) / divisor.astype(object)
+
+        digits[null_numerator] = 0
+        remainder[null_numerator] = Decimal(0)
+        sign = np.where(null_numerator, 1, va._sign * vb._sign).astype(np.int8)
+
+        return self._normalized(sign, digits, remainder, significant)
+
+    # Operators
+
+    def __add__(self, other) -> "BasedRealArray":
+        """self + other"""
+        return super().__add__(self._coerce(other))
+
+    def __radd__(self, other) -> "BasedRealArray":
+        """other + self"""
+        return self + other
+
+    def __sub__(self, other) -> "BasedRealArray":
+        """self - other"""
+        return super().__sub__(self._coerce(other))
+
+    def __rsub__(self, other) -> "BasedRealArray":
+        """other - self"""
+        return self._coerce(other) - self
+
+    def __mul__(self, other) -> "BasedRealArray":
+        """self * other"""
+        return super().__mul__(self._coerce(other))
+
+    def __rmul__(self, other) -> "BasedRealArray":
+        """other * self"""
+        return self * other
+
+    def __truediv__(self, other) -> "BasedRealArray":
+        """self / other"""
+        return super().__truediv__(self._coerce(other))
+
+    def __rtruediv__(self, other) -> "BasedRealArray":
+        """other / self"""
+        return self._coerce(other) / self
+
+    # Comparisons
+
+    def _compare(self, other) -> np.ndarray:
+        """Sign of self - other for each element, without any precision context"""
+        difference = self._add(-self._coerce(other))
+        return np.where(difference._digits.any(axis=1) | (difference._remainder != 0), difference._sign, 0)
+
+    def __eq__(self, other) -> np.ndarray:  # type: ignore
+        """self == other"""
+        return self._compare(other) == 0
+
+    def __ne__(self, other) -> np.ndarray:  # type: ignore
+        """self != other"""
+        return self._compare(other) != 0
+
+    def __lt__(self, other) -> np.ndarray:
+        """self < other"""
+        return self._compare(other) < 0
+
+    def __le__(self, other) -> np.ndarray:
+        """self <= other"""
+        return self._compare(other) <= 0
+
+    def __gt__(self, other) -> np.ndarray:
+        """self > other"""
+        return self._compare(other) > 0
+
+    def __ge__(self, other) -> np.ndarray:
+        """self >= other"""
+        return self._compare(other) >= 0
+
+    __hash__ = None  # type: ignore
+
+
+def array_type_for(base: "RadixBase", type_name: str) -> Type[BasedRealArray]:
+    """Builds the `BasedRealArray` class of a `~kanon.units.radices.RadixBase`"""
+    return type(f"{type_name}Array", (BasedRealArray,), {"base": base})
@@ -23,6 +23,9 @@ truncated.
 ...
 03 ;
 
+Precision contexts are stored in a `~contextvars.ContextVar`: rules set with `set_precision`
+only apply to the current thread or asyncio task.
+
 If you want to use a specific algorithm for one of the arithmetical operations,
 you first need to define the algorithm with this signature :
 
@@ -54,6 +57,8 @@ All operations and their associated context are stored inside the `ContextPrecis
 the recording flag is set to ``True``. You can either set it to ``True`` inside of a
 `set_precision` context manager, or globally turn it on with `set_recording(True)`.
 Records are easily accessed through `get_records`, and can be cleared with `clear_records`.
+Records are stored by a `~kanon.units.recorders.Recorder`, which can be replaced with
+`set_recorder` to bound or stream them.
 
 Let's try to record our operations.
 
@@ -93,11 +98,14 @@ from __future__ import annotations
 
 import abc
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass, field
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import partial, wraps
 from numbers import Number
-from typing import Callable, List, Optional, SupportsFloat, Tuple
+from typing import Any, Callable, Dict, Optional, SupportsFloat, Tuple, Union
+
+from .recorders import ListRecorder, Recorder
 
 __all__ = ["PrecisionMode",
            "TruncatureMode",
@@ -108,6 +116,8 @@ __all__ = ["PrecisionMode",
            "set_context",
            "set_recording",
            "get_records",
+           "set_recorder",
+           "get_recorder",
            "clear_records",
            "ArithmeticIdentifier"]
 
@@ -119,8 +129,17 @@ def _with_context_precision(func=None, symbol=None):
     @wraps(func)
     def wrapper(*args, **kwargs) -> "PreciseNumber":
 
-        with set_precision(recording=False):
+        ctx = get_context()
+
+        if ctx._default:
             value: "PreciseNumber" = func(*args, **kwargs)
+        else:
+            f = ctx._algorithms.get(symbol)
+            token = _DEPTH.set(_DEPTH.get() + 1)
+            try:
+                value = f(*args, **kwargs) if f else func(*args, **kwargs)
+            finally:
+                _DEPTH.reset(token)
 
         if len(args) != 2 or any(not isinstance(a, PreciseNumber) for a in args):
             return value
@@ -128,8 +147,9 @@ def _with_context_precision(func=None, symbol=None):
         if not isinstance(value, PreciseNumber):
             raise TypeError
 
-        value = value.resize(args[0]._get_significant(args[1]))
-        ctx = get_context()
+        value = value.resize(ctx._precisionfunc(*args))
+        if ctx._default:
+            return value
         value = ctx.tmode(value)
         ctx.record(*args, symbol, value)
         return value
@@ -165,10 +185,13 @@ class PreciseNumber(Number, SupportsFloat):
     def _get_significant(self, other: "PreciseNumber") -> int:
         return get_context()._precisionfunc(self, other)
 
+    def _compact(self) -> Any:
+        """Compact and serializable representation of this number, used when streaming records
+        """
+        return float(self)
+
     @_with_context_precision(symbol="+")
     def __add__(self, other):
-        if f := get_context().add[0]:
-            return f(self, other)
         return self._add(other)
 
     @abc.abstractmethod
@@ -177,8 +200,6 @@ class PreciseNumber(Number, SupportsFloat):
 
     @_with_context_precision(symbol="-")
     def __sub__(self, other):
-        if f := get_context().sub[0]:
-            return f(self, other)
         return self._sub(other)
 
     @abc.abstractmethod
@@ -187,8 +208,6 @@ class PreciseNumber(Number, SupportsFloat):
 
     @_with_context_precision(symbol="*")
     def __mul__(self, other):
-        if f := get_context().mul[0]:
-            return f(self, other)
         return self._mul(other)
 
     @abc.abstractmethod
@@ -197,8 +216,6 @@ class PreciseNumber(Number, SupportsFloat):
 
     @_with_context_precision(symbol="/")
     def __truediv__(self, other):
-        if f := get_context().div[0]:
-            return f(self, other)
         return self._truediv(other)
 
     @abc.abstractmethod
@@ -237,8 +254,8 @@ ArithmeticIdentifier = Tuple[Optional[Callable[[PreciseNumber, PreciseNumber], P
 class PrecisionContext:
     """Context containing `PreciseNumber` arithmetic rules.
     """
-    #: Precision mode
-    pmode: PrecisionMode = PrecisionMode.MAX
+    #: Precision mode, or a constant significant number
+    pmode: Union[PrecisionMode, int] = PrecisionMode.MAX
     #: Truncature mode
     tmode: TruncatureMode = TruncatureMode.NONE
     #: Addition `ArithmeticIdentifier`
@@ -254,7 +271,7 @@ class PrecisionContext:
 
     #: `set_precision` context stack
     stack: int = field(init=False, default=0)
-    _records: List = field(init=False, default_factory=list)
+    _records: Recorder = field(init=False, default_factory=ListRecorder)
 
     def __post_init__(self):
         if type(self.tmode) is not TruncatureMode:
@@ -269,26 +286,61 @@ class PrecisionContext:
         else:
             raise TypeError
 
+        # Compiled dispatch rules, used by every arithmetical operation
+        self._identifiers: Dict[Optional[str], ArithmeticIdentifier] = {
+            "+": self.add, "-": self.sub, "*": self.mul, "/": self.div
+        }
+        self._algorithms: Dict[Optional[str], Optional[Callable]] = {
+            k: v[0] for k, v in self._identifiers.items()
+        }
+        self._default = (
+            self.pmode is PrecisionMode.MAX
+            and self.tmode is TruncatureMode.NONE
+            and not self.recording
+            and not any(self._algorithms.values())
+        )
+
+    def rules(self) -> Dict[str, Any]:
+        """Returns the rules of this context, as accepted by `mutate`
+        """
+        return {
+            "pmode": self.pmode,
+            "tmode": self.tmode,
+            "recording": self.recording,
+            "add": self.add,
+            "sub": self.sub,
+            "mul": self.mul,
+            "div": self.div
+        }
+
     def mutate(self,
-               pmode: Optional[PrecisionMode] = None,
+               pmode: Optional[Union[PrecisionMode, int]] = None,
                tmode: Optional[TruncatureMode] = None,
                recording: Optional[bool] = None,
                add: Optional[ArithmeticIdentifier] = None,
                sub: Optional[ArithmeticIdentifier] = None,
                mul: Optional[ArithmeticIdentifier] = None,
                div: Optional[ArithmeticIdentifier] = None
-               ):
-        """Mutates this `PrecisionContext` with new rules.
+               ) -> PrecisionContext:
+        """Returns a copy of this `PrecisionContext` with new rules, replacing it as the current
+        context if it is. This context is left unchanged, as other threads or tasks may share it.
         """
-        self.pmode = self.pmode if pmode is None else pmode
-        self.tmode = tmode or self.tmode
-        self.recording = self.recording if recording is None else recording
-        self.add = add or self.add
-        self.sub = sub or self.sub
-        self.mul = mul or self.mul
-        self.div = div or self.div
+        new_rules = {
+            "pmode": pmode, "tmode": tmode, "recording": recording,
+            "add": add, "sub": sub, "mul": mul, "div": div
+        }
+        context = self._copy(**{k: v for k, v in new_rules.items() if v is not None})
+        if _CONTEXT.get(None) is self:
+            _CONTEXT.set(context)
+        return context
 
-        self.__post_init__()
+    def _copy(self, **rules) -> PrecisionContext:
+        """Copy of this context with some of its rules replaced, sharing its stack and records
+        """
+        context = PrecisionContext(**{**self.rules(), **rules})
+        context.stack = self.stack
+        context._records = self._records
+        return context
 
     def freeze(self):
         """Returns a `Dict` containing this context rules
@@ -305,17 +357,27 @@ class PrecisionContext:
     def record(self, *args):
         """Record an operation
         """
-        if self.recording:
-            self._records.append({"args": args, **self.freeze()})
+        if self.recording and not _DEPTH.get():
+            self._records.record(args, self)
 
 
-__CONTEXT = PrecisionContext()
+_CONTEXT: ContextVar[PrecisionContext] = ContextVar("precision_context")
+# Depth of the operations being computed, nested operations are not recorded
+_DEPTH: ContextVar[int] = ContextVar("precision_depth", default=0)
 
 
 def get_context() -> PrecisionContext:
-    """Returns current context
+    """Returns current context.
+
+    Contexts are stored in a `~contextvars.ContextVar`, each thread starts with its own
+    default context and asyncio tasks inherit the context of the code creating them.
     """
-    return __CONTEXT
+    try:
+        return _CONTEXT.get()
+    except LookupError:
+        ctx = PrecisionContext()
+        _CONTEXT.set(ctx)
+        return ctx
 
 
 def set_context(context: PrecisionContext):
@@ -327,8 +389,7 @@ def set_context(context: PrecisionContext):
     if get_context().stack > 0:
         raise ValueError("You can't change context while inside a precision_context")
     context.stack = 0
-    global __CONTEXT
-    __CONTEXT = context
+    _CONTEXT.set(context)
 
 
 def set_recording(flag: bool):
@@ -341,15 +402,35 @@ def set_recording(flag: bool):
     if ctx.stack > 0:
         raise ValueError("You can't start recording while inside a precision_context,\
             you should use recording=True instead")
-    ctx.recording = flag
+    _CONTEXT.set(ctx._copy(recording=flag))
 
 
-def get_records():
-    """Get current `PrecisionContext` records.
+def set_recorder(recorder: Recorder):
+    """Set the `~kanon.units.recorders.Recorder` used by the current `PrecisionContext`.
+
+    :raises ValueError: Raise if you set a recorder while inside a `set_precision` \
+    context manager
+    """
+    ctx = get_context()
+    if ctx.stack > 0:
+        raise ValueError("You can't change the recorder while inside a precision_context")
+    context = ctx._copy()
+    context._records = recorder
+    _CONTEXT.set(context)
+
+
+def get_recorder() -> Recorder:
+    """Get the `~kanon.units.recorders.Recorder` used by the current `PrecisionContext`.
     """
     return get_context()._records
 
 
+def get_records():
+    """Get current `PrecisionContext` records kept in memory by its recorder.
+    """
+    return get_context()._records.records
+
+
 def clear_records():
     """Clear current `PrecisionContext` records.
     """
@@ -357,26 +438,27 @@ def clear_records():
 
 
 @contextmanager
-def set_precision(pmode: Optional[PrecisionMode] = None,
+def set_precision(pmode: Optional[Union[PrecisionMode, int]] = None,
                   tmode: Optional[TruncatureMode] = None,
                   recording: Optional[bool] = None,
                   add: Optional[ArithmeticIdentifier] = None,
                   sub: Optional[ArithmeticIdentifier] = None,
                   mul: Optional[ArithmeticIdentifier] = None,
                   div: Optional[ArithmeticIdentifier] = None):
-    """Mutates the current `PrecisionContext` with the specified rules.
+    """Runs the enclosed code with a copy of the current `PrecisionContext` following
+    the specified rules. The copy shares the records of the current context.
     """
-    ctx = get_context()
-    current = asdict(ctx)
-    del current["_records"]
-    del current["stack"]
+    new_rules = {
+        "pmode": pmode, "tmode": tmode, "recording": recording,
+        "add": add, "sub": sub, "mul": mul, "div": div
+    }
+    child = get_context()._copy(**{k: v for k, v in new_rules.items() if v is not None})
+    child.stack += 1
+    token = _CONTEXT.set(child)
     try:
-        ctx.stack += 1
-        ctx.mutate(pmode, tmode, recording, add, sub, mul, div)
-        yield asdict(ctx)
+        yield child.rules()
     finally:
-        ctx.mutate(**current)
-        ctx.stack -= 1
+        _CONTEXT.reset(token)
 
 
 class PrecisionError(Exception):
@@ -16,17 +16,20 @@ BasedReal are a class of Real numbers with a 1-1 relation with a RadixBase.
     >>> import builtins
     >>> builtins.Sexagesimal = radix_registry["Sexagesimal"]
     >>> builtins.Historical = radix_registry["Historical"]
+    >>> builtins.Temporal = radix_registry["Temporal"]
 
 """
 
+import itertools
 import math
+import operator
 from decimal import Decimal
 from fractions import Fraction
 from functools import cached_property, lru_cache
 from numbers import Number
 from numbers import Real as _Real
 from typing import (Any, Dict, List, Literal, Optional, Sequence,
-                    SupportsFloat, Tuple, Type, cast, overload)
+                    SupportsFloat, Tuple, Type, Union, cast, overload)
 
 import numpy as np
 from astropy.units.core import UnitBase, UnitTypeError
@@ -37,6 +40,7 @@ from astropy.units.quantity_helper.helpers import _d
 from kanon.utils.list_to_tuple import list_to_tuple
 from kanon.utils.looping_list import LoopingList
 
+from .arrays import BasedRealArray, array_type_for
 from .precision import (PreciseNumber, PrecisionMode, TruncatureMode,
                         set_precision)
 
@@ -60,6 +64,7 @@ class RadixBase:
         right: Sequence[int],
         name: str,
         integer_separators: Optional[Sequence[str]] = None,
+        factor_table_size: int = 32,
     ):
         """
         Definition of a numeral system. A radix must be specified for each integer position
@@ -71,6 +76,8 @@ class RadixBase:
         :param right: Radix list for the fractional part
         :param name: Name of this numeral system
         :param integer_separators: List of string separators, used for displaying the integer part of the number
+        :param factor_table_size: Number of positions, on each side of the unit position, whose
+            factors are precomputed, defaults to 32
         """
         assert left and right
         assert all(isinstance(x, int) for x in left)
@@ -88,6 +95,17 @@ class RadixBase:
 
         self.mixed = any(x != left[0] for x in tuple(left) + tuple(right))
 
+        # Precomputed positional factors, see `factor_at_pos`.
+        # Index i holds the factor of the fractional position i (or of the integer position -i)
+        self.factor_table_size = factor_table_size
+        self.right_factors: Tuple[int, ...] = tuple(
+            itertools.accumulate((self[i] for i in range(1, factor_table_size)), operator.mul, initial=1)
+        )
+        self.left_factors: Tuple[int, ...] = tuple(
+            itertools.accumulate((self[-i] for i in range(factor_table_size - 1)), operator.mul, initial=1)
+        )
+        self.float_reciprocals: Tuple[float, ...] = tuple(1 / f for f in self.right_factors)
+
         # Build a class inheriting from BasedReal, that will use this RadixBase as
         # its numeral system.
         type_name = "".join(map(str.capitalize, self.name.split("_")))
@@ -100,6 +118,9 @@ class RadixBase:
         # Store the newly created BasedReal class
         self.type: Type[BasedReal] = new_type
 
+        # Store the BasedRealArray class of this numeral system
+        self.array_type: Type[BasedRealArray] = array_type_for(self, type_name)
+
     @overload
     def __getitem__(self, key: int) -> int:
         ...
@@ -129,7 +150,6 @@ class RadixBase:
         else:
             return self.right[key - 1]
 
-    @lru_cache
     def factor_at_pos(self, pos: int) -> int:
         """
         Returns an int factor corresponding to a digit at position pos.
@@ -140,15 +160,22 @@ class RadixBase:
         3600
         >>> Sexagesimal.base.factor_at_pos(0)
         1
+        >>> Temporal.base.factor_at_pos(2)
+        1440
 
         :param pos: Position of the digit
         :type pos: int
         :return: Factor at pos
         :rtype: int
         """
+        if 0 <= pos < self.factor_table_size:
+            return self.right_factors[pos]
+        if 0 < -pos < self.factor_table_size:
+            return self.left_factors[-pos]
+
         factor = 1
         for i in range(abs(pos)):
-            factor *= self[i if pos > 0 else -i]
+            factor *= self[i + 1 if pos > 0 else -i]
         return factor
 
 
@@ -269,7 +296,7 @@ class BasedReal(PreciseNumber, _Real):
         self.__right = ()
         self.__remainder = remainder
         self.__sign = sign
-        if np.all([isinstance(x, int) for x in args]):
+        if all(isinstance(x, int) for x in args):
             return cls.__new__(cls, args, (), remainder=remainder, sign=sign)
         elif len(args) == 2:
             if isinstance(args[0], BasedReal):
@@ -294,11 +321,38 @@ class BasedReal(PreciseNumber, _Real):
 
         self.__check_range()
 
-        if self.__simplify_integer_part() or not self.left:
-            return cls.__new__(cls, self.left or (0,), self.right, remainder=self.remainder, sign=self.sign)
+        self.__simplify_integer_part()
+        if not self.left:
+            self.__left = (0,)
 
         return self
 
+    @classmethod
+    def _from_digits(
+        cls, left: Tuple[int, ...], right: Tuple[int, ...], remainder: Decimal = Decimal(0), sign: int = 1
+    ) -> "BasedReal":
+        """
+        Trusted constructor, building a number from digits already normalized by kanon's
+        own arithmetic. Digits are not validated, so the caller must ensure they are
+        in the range of the base, that the integer part has no useless leading zeros and
+        that the remainder is between [0, 1[.
+
+        >>> Sexagesimal._from_digits((1, 2), (30,), sign=-1)
+        -01,02 ; 30
+
+        :param left: Non empty tuple of values at integer positions
+        :param right: Tuple of values at fractional positions
+        :param remainder: Remainder of the number, defaults to 0
+        :param sign: Sign of the number, defaults to 1
+        :return: a new BasedReal object
+        """
+        self = super().__new__(cls)
+        self.__left = left
+        self.__right = right
+        self.__remainder = remainder
+        self.__sign = cast(Literal[-1, 1], sign)
+        return self
+
     @property
     def left(self) -> Tuple[int, ...]:
         """
@@ -371,18 +425,40 @@ class BasedReal(PreciseNumber, _Real):
 
         :rtype: Decimal
         """
-        value = Decimal()
-        factor = Decimal(1)
-        for i in range(len(self.left)):
-            value += factor * self.left[-i - 1]
-            factor *= self.base.left[i]
-        factor = Decimal(1)
-        for i in range(self.significant):
-            factor *= self.base.right[i]
-            value += self.right[i] / factor
+        factor = self.base.factor_at_pos(self.significant)
+        return (Decimal(self._magnitude) + self.remainder) / factor * self.sign
 
-        value += self.remainder / factor
-        return value * self.sign
+    @cached_property
+    def _magnitude(self) -> int:
+        """
+        Integer representation of the absolute value of this number, in units
+        of its last fractional position, without its remainder.
+
+        >>> Sexagesimal((1,), (2, 30))._magnitude
+        3750
+        """
+        value = 0
+        for i, v in enumerate(self[:]):
+            value = value * self.base[i - len(self.left) + 1] + v
+        return value
+
+    @cached_property
+    def _key(self) -> Tuple[int, Decimal]:
+        """
+        Signed `_magnitude` and remainder of this number, ordered like numbers of the
+        same type and precision.
+
+        >>> Sexagesimal("-1;2,30")._key
+        (-3750, Decimal('-0'))
+        """
+        return self.sign * self._magnitude, self.sign * self.remainder
+
+    def _compact(self) -> Tuple[int, Tuple[int, ...], Tuple[int, ...], str]:
+        """
+        >>> Sexagesimal((1,), (30,), remainder=Decimal("0.5"), sign=-1)._compact()
+        (-1, (1,), (30,), '0.5')
+        """
+        return (self.sign, self.left, self.right, str(self.remainder))
 
     def to_fraction(self) -> Fraction:
         """
@@ -524,7 +600,7 @@ class BasedReal(PreciseNumber, _Real):
         >>> n1.right
         (7, 23, 55, 11)
         >>> n1.remainder
-        Decimal('0.8560000000000000000000000000')
+        Decimal('0.856')
         >>> n1.resize(7)
         02,02 ; 07,23,55,11,51,21,36
 
@@ -533,16 +609,98 @@ class BasedReal(PreciseNumber, _Real):
         """
         if significant == self.significant:
             return self
+        if significant < 0:
+            raise NotImplementedError
+        value, remainder = self._scaled(significant)
+        return self._from_scaled(value, significant, remainder, self.sign)
+
+    @property
+    def _reciprocal(self) -> float:
+        """
+        Float value of a unit at the last fractional position of this number
+        """
+        if self.significant < self.base.factor_table_size:
+            return self.base.float_reciprocals[self.significant]
+        return 1 / self.base.factor_at_pos(self.significant)
+
+    def _scaled(self, significant: int) -> Tuple[int, Decimal]:
+        """
+        Integer representation of the absolute value of this number, scaled to the
+        specified fractional position, and the `~decimal.Decimal` remainder of this scaling.
+
+        >>> Sexagesimal((1,), (2, 30), remainder=Decimal("0.5"))._scaled(3)
+        (225030, Decimal('0.0'))
+        >>> Sexagesimal("1;2,30")._scaled(1)
+        (62, Decimal('0.5'))
+
+        :param significant: Fractional position of the unit of the resulting integer
+        :return: Tuple of the scaled integer and its remainder
+        """
+        value = self._magnitude
+        if significant == self.significant:
+            return value, self.remainder
+
         if significant > self.significant:
-            rem = type(self).from_decimal(self.sign * self.remainder, significant - self.significant)
-            return type(self)(self.left, self.right + rem.right, remainder=rem.remainder, sign=self.sign)
-        elif significant >= 0:
-            remainder = type(self)(
-                (), self.right[significant:], remainder=self.remainder)
+            factor = self.base.factor_at_pos(significant) // self.base.factor_at_pos(self.significant)
+            remainder = self.remainder * factor
+            carry = int(remainder)
+            return value * factor + carry, remainder - carry
 
-            return type(self)(self.left, self.right[:significant], remainder=remainder.decimal, sign=self.sign)
-        else:
-            raise NotImplementedError
+        factor = self.base.factor_at_pos(self.significant) // self.base.factor_at_pos(significant)
+        value, rest = divmod(value, factor)
+        return value, (rest + self.remainder) / factor
+
+    def _exact_scaled(self, significant: int) -> Union[int, Fraction]:
+        """
+        Exact signed value of this number, including its remainder, in units of the
+        specified fractional position.
+
+        >>> Sexagesimal("-1;2,30")._exact_scaled(3)
+        -225000
+        >>> Sexagesimal("1;2,30")._exact_scaled(1)
+        Fraction(125, 2)
+
+        :param significant: Fractional position of the unit of the result
+        :return: An `int` when the value is integral at this position, a `~fractions.Fraction` otherwise
+        """
+        if significant >= self.significant and not self.remainder:
+            factor = self.base.factor_at_pos(significant) // self.base.factor_at_pos(self.significant)
+            return self.sign * self._magnitude * factor
+        value = (self._magnitude + Fraction(self.remainder)) * self.base.factor_at_pos(significant)
+        value = value / self.base.factor_at_pos(self.significant) * self.sign
+        return int(value) if value.denominator == 1 else value
+
+    @classmethod
+    def _from_scaled(
+        cls, value: int, significant: int, remainder: Decimal = Decimal(0), sign: int = 1
+    ) -> "BasedReal":
+        """
+        Builds a new BasedReal from the integer representation of its absolute value,
+        scaled to the specified fractional position.
+
+        >>> Sexagesimal._from_scaled(225030, 3, sign=-1)
+        -01 ; 02,30,30
+
+        :param value: Positive integer amount of the unit at position `significant`
+        :param significant: Precision of the resulting number
+        :param remainder: Remainder of the number, defaults to 0
+        :param sign: Sign of the number, defaults to 1
+        :return: a new BasedReal object
+        """
+        right = [0] * significant
+        for i in range(significant, 0, -1):
+            value, right[i - 1] = divmod(value, cls.base[i])
+
+        left = []
+        pos = 0
+        while True:
+            value, digit = divmod(value, cls.base[pos])
+            left.append(digit)
+            pos -= 1
+            if not value:
+                break
+
+        return cls._from_digits(tuple(left[::-1]), tuple(right), remainder, sign)
 
     def __trunc__(self):
         return int(float(self.truncate(0)))
@@ -566,9 +724,9 @@ class BasedReal(PreciseNumber, _Real):
             n = self.significant
         if n > self.significant:
             return self
-        left = self.left if n >= 0 else self.left[:-n]
-        right = self.right[:n] if n >= 0 else ()
-        return type(self)(left, right, sign=self.sign)
+        if n >= 0:
+            return self._from_digits(self.left, self.right[:n], sign=self.sign)
+        return type(self)(self.left[:-n], (), sign=self.sign)
 
     def floor(self, significant: Optional[int] = None) -> "BasedReal":
         resized = self.resize(significant) if significant else self
@@ -839,7 +997,7 @@ class BasedReal(PreciseNumber, _Real):
         :param significant: desired precision
         :return: a zero number
         """
-        return cls((0,), (0,) * significant)
+        return cls._from_digits((0,), (0,) * significant)
 
     @classmethod
     def one(cls, significant=0) -> "BasedReal":
@@ -852,7 +1010,7 @@ class BasedReal(PreciseNumber, _Real):
         :param significant: desired precision
         :return: a unit number
         """
-        return cls((1,), (0,) * significant)
+        return cls._from_digits((1,), (0,) * significant)
 
     @classmethod
     def from_int(cls, value: int, significant=0) -> "BasedReal":
@@ -870,28 +1028,8 @@ class BasedReal(PreciseNumber, _Real):
         if not isinstance(value, int):
             raise TypeError(f"Argument {value} is not an int")
 
-        base = cls.base
         sign = -1 if value < 0 else 1
-        value *= sign
-
-        pos = 0
-        max_integer = 1
-
-        while value >= max_integer:
-            max_integer *= base.left[pos]
-            pos += 1
-
-        left = [0] * pos
-
-        int_factor = max_integer
-
-        for i in range(pos):
-            int_factor //= base.left[i]
-            position_value = int(value / int_factor)
-            value -= position_value * int_factor
-            left[i] = position_value
-
-        return cls(left, (0,) * significant, sign=sign)
+        return cls._from_scaled(value * sign * cls.base.factor_at_pos(significant), significant, sign=sign)
 
     def __float__(self) -> float:
         """
@@ -904,100 +1042,71 @@ class BasedReal(PreciseNumber, _Real):
 
         :return: float representation of this BasedReal object
         """
-        value = float(abs(int(self)))
-        factor = 1.0
-        for i in range(self.significant):
-            factor /= self.base.right[i]
-            value += factor * self.right[i]
-
-        value += factor * float(self.remainder)
-        return float(value * self.sign)
+        value = self._magnitude / self.base.factor_at_pos(self.significant)
+        if self.remainder:
+            value += float(self.remainder) * self._reciprocal
+        return value * self.sign
 
     def __int__(self) -> int:
         """
         Compute the int value of this BasedReal object
         """
-        value = 0
-        factor = 1
-        for i in range(len(self.left)):
-            value += factor * self.left[-i - 1]
-            factor *= self.base.left[-i - 1]
-
-        return value * self.sign
+        return self._magnitude // self.base.factor_at_pos(self.significant) * self.sign
 
     def _truediv(self, _other: PreciseNumber) -> "BasedReal":
 
         other = cast(BasedReal, _other)
 
-        max_significant = max(self.significant, other.significant)
-
-        if self == 0:
-            return self.zero(significant=max_significant)
-        if other in (1, -1):
-            return self * float(other)
-        if other == 0:
-            raise ZeroDivisionError
-
-        sign = self.sign * other.sign
-
-        q_res = self.zero(max_significant)
-        right = list(q_res.right)
+        significant = max(self.significant, other.significant)
 
-        numerator = abs(self)
-        denominator = abs(other)
+        numerator, num_remainder = self._scaled(significant)
+        denominator, den_remainder = other._scaled(significant)
 
-        q, r = divmod(numerator, denominator)
+        if not numerator and not num_remainder:
+            return self.zero(significant)
+        if not denominator and not den_remainder:
+            raise ZeroDivisionError
 
-        q_res += q
+        factor = self.base.factor_at_pos(significant)
 
-        for i in range(0, max_significant):
-            numerator = r * self.base.right[i]
-            q, r = divmod(numerator, denominator)
-            if q == self.base.right[i]:  # pragma: no cover
-                q_res += 1
-                r = self.zero()
-                break
-            right[i] = int(q)
+        if num_remainder or den_remainder:
+            exact_denominator = denominator + Fraction(den_remainder)
+            value, rest = divmod((numerator + Fraction(num_remainder)) * factor, exact_denominator)
+            fraction = rest / exact_denominator
+            remainder = Decimal(fraction.numerator) / fraction.denominator
+        else:
+            value, int_rest = divmod(numerator * factor, denominator)
+            remainder = Decimal(int_rest) / denominator
 
-        return type(self)(q_res.left, right, remainder=r.decimal / denominator.decimal, sign=sign)
+        return self._from_scaled(int(value), significant, remainder, self.sign * other.sign)
 
     def _add(self, _other: PreciseNumber) -> "BasedReal":
 
         other = cast(BasedReal, _other)
 
-        if self.decimal == -other.decimal:
-            return self.zero()
+        significant = max(self.significant, other.significant)
 
-        maxright = max(self.significant, other.significant)
-        maxleft = max(len(self.left), len(other.left))
-        va = self.resize(maxright)
-        vb = other.resize(maxright)
+        va, ra = self._scaled(significant)
+        vb, rb = other._scaled(significant)
 
-        sign = va.sign if abs(va) > abs(vb) else vb.sign
-        if sign < 0:
-            va = -va
-            vb = -vb
+        value = self.sign * va + other.sign * vb
+        remainder = self.sign * ra + other.sign * rb
+        carry = math.floor(remainder)
+        value += carry
+        remainder -= carry
 
-        maxlen = max(len(va[:]), len(vb[:]))
-        values = ([v.sign * x for x in v[::-1]] + [0] * (maxlen - len(v[:])) for v in (va, vb))
-        numbers: List[int] = [a + b for a, b in zip(*values)] + [0]
-
-        remainder = va.remainder * va.sign + vb.remainder * vb.sign
-        fn = remainder if remainder >= 0 else remainder - 1
-        remainder -= int(fn)
-        numbers[0] += int(fn)
-
-        for i, r in enumerate(numbers):
-            factor = self.base[maxright - i]
-            if r < 0 or r >= factor:
-                numbers[i] = r % factor
-                numbers[i + 1] += 1 if r > 0 else -1
-
-        numbers = [abs(x) for x in numbers[::-1]]
-        left = numbers[:maxleft + 1]
-        right = numbers[maxleft + 1:]
+        if value < 0:
+            sign = -1
+            value = -value
+            if remainder:
+                value -= 1
+                remainder = 1 - remainder
+        elif value == 0 and not remainder:
+            return self.zero(significant)
+        else:
+            sign = 1
 
-        return type(self)(left, right, remainder=abs(remainder), sign=sign)
+        return self._from_scaled(value, significant, remainder, sign)
 
     def __add__(self, other) -> "BasedReal":
         """
@@ -1006,6 +1115,9 @@ class BasedReal(PreciseNumber, _Real):
         >>> Sexagesimal('01, 21; 47, 25') + Sexagesimal('45; 32, 14, 22')
         02,07 ; 19,39,22
         """
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
+
         if not np.isreal(other):
             raise NotImplementedError
 
@@ -1026,6 +1138,8 @@ class BasedReal(PreciseNumber, _Real):
 
     def __sub__(self, other) -> "BasedReal":
         """self - other"""
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return super().__sub__(other)
 
     def __rsub__(self, other) -> "BasedReal":
@@ -1068,7 +1182,7 @@ class BasedReal(PreciseNumber, _Real):
 
     def __neg__(self) -> "BasedReal":
         """-self"""
-        return type(self)(self.left, self.right, remainder=self.remainder, sign=-self.sign)
+        return self._from_digits(self.left, self.right, self.remainder, -self.sign)
 
     def __pos__(self) -> "BasedReal":
         """+self"""
@@ -1091,52 +1205,21 @@ class BasedReal(PreciseNumber, _Real):
 
         other = cast(BasedReal, _other)
 
-        if self in (1, -1):
-            return other if self == 1 else -other
-        if other in (1, -1):
-            return self if other == 1 else -self
-        if self == 0 or other == 0:
-            return self.zero()
-
-        sign = self.sign * other.sign
+        significant = max(self.significant, other.significant)
 
-        max_right = max(self.significant, other.significant)
+        va, ra = self._scaled(significant)
+        vb, rb = other._scaled(significant)
 
-        va = self.resize(max_right)
-        vb = other.resize(max_right)
+        if not (va or ra) or not (vb or rb):
+            return self.zero(significant)
 
-        numbers = [[0] * i + [fv * s for s in vb[:]][::-1]
-                   for i, fv in enumerate(va[::-1])]
+        # Product of both scaled numbers is scaled at twice the precision
+        remainder = va * rb + vb * ra + ra * rb
+        carry = int(remainder)
 
-        count: List[int] = [0] * max(len(x) for x in numbers) + [0]
-
-        for n in numbers:
-            for i, r in enumerate(n):
-                count[i] += r
-                factor = self.base[max_right - i]
-                c = count[i]
-                if c < 0 or c >= factor:
-                    count[i] = c % factor
-                    count[i + 1] += c // factor
-
-        while count[-1] != 0:
-            factor = self.base[max_right - len(count)]
-            c = count[-1]
-            count[-1] = c % factor
-            count.append(c // factor)
-
-        res = type(self)(*tuple(count[::-1]), sign=sign)
-        res = res >> 2 * max_right
-
-        factor = self.base.factor_at_pos(max_right)
-        vb_rem = vb.sign * vb.remainder / factor
-        va_rem = va.sign * va.remainder / factor
-        res += float(va.truncate().decimal * vb_rem
-                     + vb.truncate().decimal * va_rem
-                     + va_rem * vb_rem
-                     )
-
-        return res
+        return self._from_scaled(
+            va * vb + carry, 2 * significant, remainder - carry, self.sign * other.sign
+        )
 
     def __mul__(self, other) -> "BasedReal":
         """
@@ -1146,6 +1229,9 @@ class BasedReal(PreciseNumber, _Real):
         09,19 ; 39,15 |r0.7
         """
 
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
+
         if isinstance(other, UnitBase):
             return BasedQuantity(self, unit=other)
 
@@ -1212,6 +1298,9 @@ class BasedReal(PreciseNumber, _Real):
 
     def __truediv__(self, other) -> "BasedReal":
         """self / other"""
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
+
         if isinstance(other, UnitBase):
             return self * (other ** -1)
 
@@ -1221,8 +1310,55 @@ class BasedReal(PreciseNumber, _Real):
         else:
             return self / self.from_float(float(other), significant=self.significant)
 
+    def _cmp(self, other: "BasedReal") -> int:
+        """
+        Compares this number with another of the same type on their integer-scaled
+        digits, only looking at remainders when the scaled integers are equal.
+        Numbers of the same precision are compared on their cached `_key`.
+
+        >>> Sexagesimal("1;30")._cmp(Sexagesimal("1;29,59"))
+        1
+        >>> Sexagesimal("-0;0")._cmp(Sexagesimal(0))
+        0
+
+        :param other: The other number, of the same type
+        :return: -1, 0 or 1 if this number is lower, equal or greater than the other
+        """
+        sig_a = self.significant
+        sig_b = other.significant
+        if sig_a == sig_b:
+            key_a = self._key
+            key_b = other._key
+            return (key_a > key_b) - (key_a < key_b)
+
+        if not self.remainder and not other.remainder:
+            # Without remainders, signed magnitudes scaled to the same position are enough
+            mag_a = self._key[0]
+            mag_b = other._key[0]
+            if sig_a < sig_b:
+                mag_a *= self.base.factor_at_pos(sig_b) // self.base.factor_at_pos(sig_a)
+            else:
+                mag_b *= self.base.factor_at_pos(sig_a) // self.base.factor_at_pos(sig_b)
+            return (mag_a > mag_b) - (mag_a < mag_b)
+
+        significant = max(sig_a, sig_b)
+        a = self._scaled(significant)
+        b = other._scaled(significant)
+
+        sign_a = self.sign if any(a) else 0
+        sign_b = other.sign if any(b) else 0
+        if sign_a != sign_b:
+            return 1 if sign_a > sign_b else -1
+        if a == b:
+            return 0
+        return sign_a if a > b else -sign_a
+
     def __gt__(self, other) -> bool:
         """self > other"""
+        if type(self) is type(other):
+            return self._cmp(other) > 0
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         if isinstance(other, BasedReal):
             return self.decimal > other.decimal
         return float(self) > float(other)
@@ -1230,7 +1366,9 @@ class BasedReal(PreciseNumber, _Real):
     def __eq__(self, other) -> bool:
         """self == other"""
         if type(self) is type(other):
-            return self.decimal == other.decimal
+            return self._cmp(other) == 0
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return float(self) == float(other)
 
     def equals(self, other: "BasedReal") -> bool:
@@ -1257,18 +1395,32 @@ class BasedReal(PreciseNumber, _Real):
 
     def __ne__(self, other: object) -> bool:
         """self != other"""
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return not self == other
 
     def __ge__(self, other: "BasedReal") -> bool:
         """self >= other"""
+        if type(self) is type(other):
+            return self._cmp(other) >= 0
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return self == other or self > other
 
     def __lt__(self, other: "BasedReal") -> bool:
         """self < other"""
+        if type(self) is type(other):
+            return self._cmp(other) < 0
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return not self >= other
 
     def __le__(self, other: "BasedReal") -> bool:
         """self <= other"""
+        if type(self) is type(other):
+            return self._cmp(other) <= 0
+        if isinstance(other, BasedRealArray):
+            return NotImplemented
         return not self > other
 
     def __floor__(self):
@@ -1284,6 +1436,10 @@ class BasedReal(PreciseNumber, _Real):
             return int(self)
         return hash((self.left, self.right, self.sign, self.remainder))
 
+    def __reduce__(self):
+        # Classes of BasedReal are built at runtime, so they are pickled by their name in the registry
+        return _from_registry, (type(self).__name__, self.left, self.right, self.remainder, self.sign)
+
     def sqrt(self, precision=None):
         raise NotImplementedError
         # return type(self).from_float(math.sqrt(float(self)), self.significant)
@@ -1355,6 +1511,13 @@ RadixBase([10], [24, 60], "temporal")
 # add new definitions here, corresponding BasedReal inherited classes will be automatically generated
 
 
+def _from_registry(
+    name: str, left: Tuple[int, ...], right: Tuple[int, ...], remainder: Decimal, sign: int
+) -> BasedReal:
+    """Unpickles a BasedReal of the class `name` in `radix_registry`"""
+    return radix_registry[name]._from_digits(left, right, remainder, sign)
+
+
 def _shift_helper(f, unit1, unit2):
     if unit2:  # pragma: no cover
         raise UnitTypeError("Can only apply '{}' function to "
@@ -0,0 +1,206 @@
+"""
+In this module we define the `Recorder` backends used by `~kanon.units.precision.PrecisionContext`
+to store the operations made while recording.
+
+The default `ListRecorder` keeps every operation in memory. Long computations should rather use
+a bounded `RingRecorder`, a `SamplingRecorder`, or a `StreamRecorder` writing compact records to
+a file or a callback.
+
+>>> from kanon.units import Sexagesimal
+>>> from kanon.units.precision import get_records, set_recorder, set_recording
+>>> set_recorder(RingRecorder(2))
+>>> set_recording(True)
+>>> for i in range(5):
+...     _ = Sexagesimal(i) + Sexagesimal("0;30")
+>>> [record["args"][-1] for record in get_records()]
+[03 ; 30, 04 ; 30]
+>>> lines = []
+>>> set_recorder(StreamRecorder(lines.append))
+>>> Sexagesimal("1;30") * Sexagesimal(2)
+03 ; 00
+>>> lines
+[('*', (1, (1,), (30,), '0'), (1, (2,), (), '0'), (1, (3,), (0,), '0'), 0, 'MAX', 'DEFAULT')]
+>>> set_recording(False)
+>>> set_recorder(ListRecorder())
+"""
+
+import abc
+import json
+import os
+from collections import deque
+from typing import (IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
+                    Optional, Sequence, Tuple, Union)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .precision import PrecisionContext
+
+__all__ = ["Recorder", "ListRecorder", "RingRecorder", "SamplingRecorder", "StreamRecorder",
+           "compact_record", "iter_stream"]
+
+#: Compact representation of an operation, see `compact_record`
+CompactRecord = Tuple[Any, ...]
+
+
+def compact_record(args: Tuple[Any, ...], context: "PrecisionContext") -> CompactRecord:
+    """
+    Builds a compact representation of an operation : the operator symbol, the operands
+    and the result as digits, the truncature mode identifier, the precision mode and the
+    name of the algorithm used.
+
+    :param args: Operands, operator symbol and result of the operation
+    :param context: Context in which the operation was made
+    :return: Tuple of JSON serializable values
+    """
+    *operands, symbol, result = args
+    algorithm = context._identifiers.get(symbol, (None, "DEFAULT"))[1]
+    pmode = context.pmode.name if hasattr(context.pmode, "name") else context.pmode
+    return (
+        symbol,
+        *(_compact(x) for x in operands),
+        _compact(result),
+        context.tmode.value[1],
+        pmode,
+        algorithm
+    )
+
+
+def _compact(number: Any) -> Any:
+    compact = getattr(number, "_compact", None)
+    return compact() if compact else number
+
+
+class Recorder(abc.ABC):
+    """Abstract recorder of operations made in a `~kanon.units.precision.PrecisionContext`
+    """
+
+    @abc.abstractmethod
+    def record(self, args: Tuple[Any, ...], context: "PrecisionContext"):
+        """Records an operation.
+
+        :param args: Operands, operator symbol and result of the operation
+        :param context: Context in which the operation was made
+        """
+        raise NotImplementedError
+
+    @property
+    def records(self) -> Sequence:
+        """Records kept in memory by this recorder
+        """
+        return []
+
+    def clear(self):
+        """Clears the records kept in memory by this recorder
+        """
+
+    def close(self):
+        """Releases the resources held by this recorder
+        """
+
+
+class ListRecorder(Recorder):
+    """Unbounded recorder keeping every operation as a `dict` of its arguments and
+    of the context rules.
+    """
+
+    def __init__(self):
+        self._records: List[Dict[str, Any]] = []
+
+    def record(self, args, context):
+        self._records.append({"args": args, **context.freeze()})
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        return self._records
+
+    def clear(self):
+        self._records.clear()
+
+
+class RingRecorder(ListRecorder):
+    """Recorder keeping only the `capacity` last operations.
+
+    :param capacity: Maximum number of records kept
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Capacity should be positive")
+        self._records = deque(maxlen=capacity)  # type: ignore
+
+
+class SamplingRecorder(Recorder):
+    """Recorder forwarding one operation out of `every` to another recorder.
+
+    :param recorder: Recorder receiving the sampled operations
+    :param every: Sampling period
+    """
+
+    def __init__(self, recorder: Recorder, every: int):
+        if every <= 0:
+            raise ValueError("Sampling period should be positive")
+        self.recorder = recorder
+        self.every = every
+        self._count = 0
+
+    def record(self, args, context):
+        if self._count % self.every == 0:
+            self.recorder.record(args, context)
+        self._count += 1
+
+    @property
+    def records(self) -> Sequence:
+        return self.recorder.records
+
+    def clear(self):
+        self.recorder.clear()
+        self._count = 0
+
+    def close(self):
+        self.recorder.close()
+
+
+class StreamRecorder(Recorder):
+    """Recorder streaming compact records, as built by `compact_record`, without keeping them
+    in memory.
+
+    Records are either given to a callback, or written as JSON lines to a text file.
+
+    :param sink: Callback, path or text file object receiving the records
+    """
+
+    def __init__(self, sink: Union[Callable[[CompactRecord], Any], str, "os.PathLike[str]", IO[str]]):
+        self._file: Optional[IO[str]] = None
+        self._owned = False
+        if isinstance(sink, (str, os.PathLike)):
+            self._file = open(sink, "a")
+            self._owned = True
+        elif hasattr(sink, "write"):
+            self._file = sink  # type: ignore
+        elif callable(sink):
+            self._callback = sink
+        else:
+            raise TypeError(f"Illegal sink {sink}")
+
+    def record(self, args, context):
+        compact = compact_record(args, context)
+        if self._file is not None:
+            self._file.write(json.dumps(compact, default=str) + "\n")
+        else:
+            self._callback(compact)
+
+    def close(self):
+        if self._file is not None:
+            if self._owned:
+                self._file.close()
+            else:
+                self._file.flush()
+
+
+def iter_stream(lines: Iterable[str]) -> Iterable[CompactRecord]:
+    """Reads back the compact records written by a `StreamRecorder` to a file.
+
+    :param lines: Lines of the file
+    :return: Iterator over compact records, operands as lists
+    """
+    for line in lines:
+        yield tuple(json.loads(line))
@@ -1,8 +1,10 @@
 import math as m
 import operator as op
+import pickle
 import warnings
 from decimal import Decimal, InvalidOperation
 from fractions import Fraction
+from unittest import mock
 
 import hypothesis
 import pytest
@@ -61,6 +63,13 @@ class TestRadix:
             Sexagesimal((0.3, 5), (6, 8))
         assert "An illegal float" in str(err.value)
 
+        # From trusted digits
+        assert Sexagesimal._from_digits((1, 2), (3,), Decimal("0.5"), -1).equals(
+            Sexagesimal((1, 2), (3,), remainder=Decimal("0.5"), sign=-1)
+        )
+        assert Sexagesimal((0, 0, 1), (2,)).left == (1,)
+        assert Sexagesimal((), (2,)).left == (0,)
+
         # From BasedReal
 
         assert Sexagesimal(Historical("3;15"), 1).equals(Sexagesimal("3;15"))
@@ -134,6 +143,9 @@ class TestRadix:
 
         assert Sexagesimal("1,0;2,30,1").subunit_quantity(1) == 3602
 
+        s = Sexagesimal((1, 2), (3,), remainder=Decimal("0.25"), sign=-1)
+        assert pickle.loads(pickle.dumps(s)).equals(s)
+
     def test_shift(self):
         s = Sexagesimal("20, 1, 2, 30; 0")
         assert (s >> 1).equals(Sexagesimal("20, 1, 2; 30, 0"))
@@ -162,6 +174,29 @@ class TestRadix:
             else:
                 assert not comp(s, xs)
 
+    @given(st.from_type(Sexagesimal), st.from_type(Sexagesimal))
+    def test_comparisons_same_type(self, x, y):
+        fx, fy = x.to_fraction(), y.to_fraction()
+        for comp in (op.lt, op.le, op.eq, op.ne, op.ge, op.gt):
+            assert comp(x, y) == comp(fx, fy)
+
+        assert Sexagesimal("1;30") == Sexagesimal("1;30,0")
+        assert -Sexagesimal(0) == Sexagesimal("0;0")
+        assert Sexagesimal((1,), (30,), remainder=Decimal("0.5")) > Sexagesimal("1;30,29")
+        assert -Sexagesimal((1,), (30,), remainder=Decimal("0.5")) < -Sexagesimal("1;30,29")
+        assert sorted([Sexagesimal("0;1"), -Sexagesimal("0;0,30"), Sexagesimal(0)]) == [
+            -Sexagesimal("0;0,30"), Sexagesimal(0), Sexagesimal("0;1")
+        ]
+
+    @given(st.lists(st.from_type(Sexagesimal), min_size=2, max_size=20))
+    def test_sort_same_precision(self, xs):
+        xs = [x.resize(2) if x.significant < 2 else x.truncate(2) for x in xs]
+        xs += [-x for x in xs] + [Sexagesimal(x.left, x.right, remainder=Decimal("0.25"), sign=x.sign) for x in xs]
+        # Numbers of the same precision are ordered on their cached keys, without any scaling
+        with mock.patch.object(Sexagesimal, "_scaled", side_effect=AssertionError):
+            ordered = sorted(xs)
+        assert [x.to_fraction() for x in ordered] == sorted(x.to_fraction() for x in xs)
+
     def biop_testing(self, x, y, operator):
         fx, fy = float(x), float(y)
         a = float(operator(x, y))
@@ -228,3 +263,9 @@ class TestRadix:
         assert (h << 1).equals(Historical("116r 10s 10; 30"))
 
         assert Historical("1s 3; 36, 58").__str__() == "1s 03 ; 36,58"
+
+        assert Historical.from_int(4199, 1).equals(Historical("11r 7s 29; 0"))
+        assert int(h) == 4199
+        assert float(Historical.from_float(-45.5, 1)) == -45.5
+        assert Historical.base.factor_at_pos(-3) == 3600
+        assert Historical.base.factor_at_pos(40) == 60 ** 40
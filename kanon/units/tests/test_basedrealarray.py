@@ -0,0 +1,161 @@
+import math as m
+import operator as op
+from decimal import Decimal
+
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from hypothesis import given
+
+from kanon.units import BasedRealArray, Historical, Sexagesimal
+from kanon.units.precision import TruncatureMode, set_precision
+
+SexagesimalArray = Sexagesimal.base.array_type
+
+# Generated remainders are kept short and between 0 and 1
+sexagesimals = st.from_type(Sexagesimal).map(
+    lambda x: x._set_remainder(x.remainder.quantize(Decimal("0.001")) % 1)
+)
+sexagesimal_lists = st.lists(sexagesimals, min_size=1, max_size=10)
+
+
+class TestBasedRealArray:
+
+    def test_init(self):
+        array = SexagesimalArray([Sexagesimal("1;2,3"), Sexagesimal("-1,0;30")])
+        assert len(array) == 2
+        assert array.significant == 2
+        assert array.digits.shape == (2, 4)
+        assert array[1].equals(Sexagesimal("-1,0;30,0"))
+        assert list(array.sign) == [1, -1]
+
+        assert len(SexagesimalArray()) == 0
+
+        with pytest.raises(TypeError):
+            BasedRealArray([Sexagesimal(1)])
+        with pytest.raises(TypeError):
+            SexagesimalArray([Historical(1)])
+        with pytest.raises(ValueError):
+            SexagesimalArray.from_float([np.nan], 1)
+
+        assert Historical.base.array_type.base is Historical.base
+
+    @given(sexagesimal_lists)
+    def test_conversions(self, values):
+        array = SexagesimalArray(values)
+        for a, v in zip(array, values):
+            assert m.isclose(float(a), float(v), abs_tol=1e-12)
+        assert np.allclose(np.asarray(array), [float(v) for v in values], atol=1e-12)
+        assert all(x.equals(y) for x, y in zip(array.to_basedreals(), array))
+
+    @given(sexagesimal_lists, st.integers(0, 4))
+    def test_resize(self, values, significant):
+        array = SexagesimalArray(values)
+        resized = array.resize(significant)
+        assert resized.significant == significant
+        for a, v in zip(resized, values):
+            assert m.isclose(float(a), float(v), abs_tol=1e-12)
+
+        for mode in (TruncatureMode.TRUNC, TruncatureMode.CEIL, TruncatureMode.FLOOR, TruncatureMode.ROUND):
+            for a, v in zip(mode(array), values):
+                assert a.equals(mode(v.resize(array.significant)))
+
+        values = [v.truncate() for v in values]
+        resized = SexagesimalArray(values).resize(significant)
+        for a, v in zip(resized, values):
+            assert a.truncate().equals(v.resize(significant).truncate())
+            assert round(a).equals(round(v.resize(significant)))
+
+    @given(sexagesimal_lists, st.integers(-3, 3))
+    def test_shift(self, values, i):
+        array = SexagesimalArray(values) >> i
+        for a, v in zip(array, values):
+            assert m.isclose(float(a), float(v >> i), abs_tol=1e-9)
+
+    @given(sexagesimal_lists.flatmap(
+        lambda x: st.tuples(st.just(x), st.lists(sexagesimals, min_size=len(x), max_size=len(x)))
+    ))
+    def test_operations(self, values):
+        left, right = values
+        a = SexagesimalArray(left)
+        b = SexagesimalArray(right)
+
+        for o in (op.add, op.sub, op.mul):
+            for x, y, z in zip(left, right, o(a, b)):
+                assert m.isclose(float(z), float(o(x, y)), abs_tol=1e-9)
+
+        # Numbers of the same precision give the same digits and remainders as scalars
+        b = SexagesimalArray(right, significant=a.significant)
+        nonzero = np.asarray(b) != 0
+        for o in (op.add, op.sub, op.mul):
+            for x, y, z in zip(a, b, o(a, b)):
+                assert z.equals(o(x, y))
+        if nonzero.any():
+            for x, y, z in zip(a[nonzero], b[nonzero], a[nonzero] / b[nonzero]):
+                assert z.equals(x / y)
+
+        left = [x.truncate() for x in a]
+        right = [y.truncate() for y in b]
+        a = SexagesimalArray(left)
+        b = SexagesimalArray(right)
+        nonzero = np.asarray(b) != 0
+        if nonzero.any():
+            for x, y, z in zip(a[nonzero], b[nonzero], a[nonzero] / b[nonzero]):
+                assert z.equals(x / y)
+
+        for comp in (op.lt, op.le, op.eq, op.ne, op.ge, op.gt):
+            assert list(comp(a, b)) == [comp(x, y) for x, y in zip(left, right)]
+
+    def test_remainders(self):
+        array = SexagesimalArray([Sexagesimal("0;0,6"), Sexagesimal("1;0,0")])
+
+        resized = array.resize(1)
+        assert resized[0].remainder == Sexagesimal("0;0,6").resize(1).remainder == Decimal("0.1")
+        quotient = array / Sexagesimal("0;7")
+        assert quotient[1].remainder == (Sexagesimal("1;0,0") / Sexagesimal("0;7")).remainder
+        product = resized * Sexagesimal("0;1")
+        assert product[0].remainder == (Sexagesimal("0;0,6").resize(1) * Sexagesimal("0;1")).remainder
+        assert all(isinstance(r, Decimal) for r in product.remainder)
+        assert all(x.equals(y) for x, y in zip(product.to_basedreals(), product))
+
+    def test_scalars(self):
+        array = SexagesimalArray([Sexagesimal("1;30"), Sexagesimal("-0;20,15")])
+
+        assert (array * 2)[0].equals(Sexagesimal("3;0,0"))
+        assert (2 * array)[1].equals(Sexagesimal("-0;40,30"))
+        assert (array + Sexagesimal(1))[1].equals(Sexagesimal("0;39,45"))
+        assert (Sexagesimal(1) - array)[0].equals(-Sexagesimal("0;30,0"))
+        assert (1 / array)[0].equals(Sexagesimal("0;40,0"))
+        assert list(array == Sexagesimal("1;30")) == [True, False]
+        assert list(Sexagesimal(0) < array) == [True, False]
+        assert (array * np.array([1, 2]))[1].equals(Sexagesimal("-0;40,30"))
+        assert (-array)[1].equals(Sexagesimal("0;20,15"))
+        assert abs(array)[1].equals(Sexagesimal("0;20,15"))
+
+        with pytest.raises(ZeroDivisionError):
+            array / 0
+        with pytest.raises(ValueError):
+            array + SexagesimalArray([Sexagesimal(1)] * 3)
+        with pytest.raises(TypeError):
+            array + "a"
+        with pytest.raises(TypeError):
+            float(array)
+
+    def test_precision(self):
+        array = SexagesimalArray([Sexagesimal("0;30,0,0,6")])
+        with set_precision(pmode=1, tmode=TruncatureMode.ROUND):
+            assert (array * Sexagesimal(2))[0].equals(Sexagesimal("1;0"))
+
+    def test_mixed(self):
+        HistoricalArray = Historical.base.array_type
+        values = [Historical("11r 7s 29; 45"), Historical("3s 2; 15")]
+        array = HistoricalArray(values)
+
+        for x, y in zip(array + array, values):
+            assert x.equals(y + y)
+        for x, y in zip(array * array, values):
+            assert x.equals(y * y)
+        for x, y in zip(array / array, values):
+            assert x.equals(y / y)
+        for x, y in zip(array >> 1, values):
+            assert x.equals(y >> 1)
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from decimal import Decimal
 
@@ -8,8 +10,9 @@ from kanon.units.precision import (PreciseNumber, PrecisionContext,
                                    PrecisionMode, TruncatureMode,
                                    _with_context_precision, clear_records,
                                    get_context, get_records, set_context,
-                                   set_precision, set_recording)
+                                   set_precision, set_recorder, set_recording)
 from kanon.units.radices import BasedReal
+from kanon.units.recorders import ListRecorder
 
 
 class TestPrecision:
@@ -31,6 +34,77 @@ class TestPrecision:
                 set_context(ctx)
         set_context(current_ctx)
 
+    def test_dispatch(self):
+        assert get_context()._default
+        with set_precision(tmode=TruncatureMode.ROUND) as rules:
+            assert rules["tmode"] is TruncatureMode.ROUND
+            assert not get_context()._default
+            with set_precision(tmode=TruncatureMode.NONE):
+                assert get_context()._default
+        assert get_context()._default
+
+        def add(a, b):
+            return a._add(b)
+
+        with set_precision(add=(add, "ADD")):
+            assert get_context()._algorithms["+"] is add
+            assert (Sexagesimal(1) + Sexagesimal(1)).equals(Sexagesimal(2))
+        assert get_context()._algorithms["+"] is None
+
+        set_recording(True)
+        assert not get_context()._default
+        set_recording(False)
+        assert get_context()._default
+
+    def test_concurrency(self):
+        s1 = Sexagesimal("0;30,0,0,6")
+        s2 = Sexagesimal(2)
+
+        def compute(tmode: TruncatureMode):
+            results = []
+            with set_precision(pmode=PrecisionMode.SCI, tmode=tmode):
+                for _ in range(200):
+                    results.append(s1 + s2)
+                    assert get_context().tmode is tmode
+            return results
+
+        with ThreadPoolExecutor(4) as executor:
+            floors, ceils = executor.map(compute, (TruncatureMode.FLOOR, TruncatureMode.CEIL))
+        assert all(x.equals(Sexagesimal(2)) for x in floors)
+        assert all(x.equals(Sexagesimal(3)) for x in ceils)
+        assert get_context().tmode is TruncatureMode.NONE
+
+        async def task(pmode: int):
+            with set_precision(pmode=pmode):
+                await asyncio.sleep(0)
+                return (s1 + s2).significant
+
+        async def main():
+            return await asyncio.gather(task(1), task(2), task(5))
+
+        assert asyncio.run(main()) == [1, 2, 5]
+
+        async def record(recorder: ListRecorder):
+            # Tasks share the context object of their parent, which should not be mutated
+            set_recorder(recorder)
+            set_recording(True)
+            get_context().mutate(pmode=0)
+            await asyncio.sleep(0)
+            s1 + s2
+            return get_context().pmode
+
+        async def record_many():
+            recorders = [ListRecorder(), ListRecorder()]
+            pmodes = await asyncio.gather(*(record(r) for r in recorders))
+            return pmodes, recorders, get_context()
+
+        parent = get_context()
+        pmodes, recorders, ctx = asyncio.run(record_many())
+        assert pmodes == [0, 0]
+        assert all(len(r.records) == 1 for r in recorders)
+        assert ctx is parent and not ctx.recording and ctx.pmode is PrecisionMode.MAX
+        assert get_context() is parent
+
     def equality(self, a: BasedReal, b: BasedReal):
         assert a.equals(b), f"{a.truncate()},r:{a.remainder} != {b.truncate()},r:{b.remainder}"
 
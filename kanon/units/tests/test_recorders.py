@@ -0,0 +1,89 @@
+import io
+
+import pytest
+
+from kanon.units import Sexagesimal
+from kanon.units.precision import (TruncatureMode, get_recorder, get_records,
+                                   set_precision, set_recorder, set_recording)
+from kanon.units.recorders import (ListRecorder, Recorder, RingRecorder,
+                                   SamplingRecorder, StreamRecorder,
+                                   iter_stream)
+
+
+class TestRecorders:
+
+    @classmethod
+    def setup_class(cls):
+        cls.recorder = get_recorder()
+
+    def run(self, recorder: Recorder, n: int = 10):
+        set_recorder(recorder)
+        set_recording(True)
+        try:
+            for i in range(n):
+                Sexagesimal.from_int(i) + Sexagesimal("0;30")
+        finally:
+            set_recording(False)
+
+    def test_list(self):
+        recorder = ListRecorder()
+        self.run(recorder)
+        assert len(get_records()) == 10
+        assert get_records()[3]["args"][-1] == Sexagesimal("3;30")
+        recorder.clear()
+        assert len(recorder.records) == 0
+
+    def test_ring(self):
+        recorder = RingRecorder(3)
+        self.run(recorder)
+        assert [r["args"][0] for r in get_records()] == [7, 8, 9]
+        with pytest.raises(ValueError):
+            RingRecorder(0)
+
+    def test_sampling(self):
+        recorder = SamplingRecorder(ListRecorder(), 4)
+        self.run(recorder)
+        assert [r["args"][0] for r in get_records()] == [0, 4, 8]
+        recorder.clear()
+        assert not recorder.records
+        with pytest.raises(ValueError):
+            SamplingRecorder(ListRecorder(), 0)
+
+    def test_stream(self, tmp_path):
+        records = []
+        self.run(StreamRecorder(records.append), 2)
+        assert records[1] == ("+", (1, (1,), (), "0"), (1, (0,), (30,), "0"),
+                              (1, (1,), (30,), "0"), 0, "MAX", "DEFAULT")
+        assert not get_records()
+
+        buffer = io.StringIO()
+        recorder = StreamRecorder(buffer)
+        set_recorder(recorder)
+        set_recording(True)
+        with set_precision(tmode=TruncatureMode.ROUND, pmode=0):
+            Sexagesimal("1;30") * Sexagesimal(3)
+        set_recording(False)
+        recorder.close()
+        assert list(iter_stream(buffer.getvalue().splitlines())) == [
+            ("*", [1, [1], [30], "0"], [1, [3], [], "0"], [1, [5], [], "0"], 1, 0, "DEFAULT")
+        ]
+
+        path = tmp_path / "records.jsonl"
+        recorder = StreamRecorder(path)
+        self.run(recorder, 100)
+        recorder.close()
+        with open(path) as f:
+            assert len(list(iter_stream(f))) == 100
+
+        with pytest.raises(TypeError):
+            StreamRecorder(5)
+
+    def test_nested(self):
+        set_recorder(ListRecorder())
+        with set_precision(recording=True):
+            with pytest.raises(ValueError):
+                set_recorder(ListRecorder())
+
+    def teardown_method(self):
+        set_recording(False)
+        set_recorder(self.recorder)
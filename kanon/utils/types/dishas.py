@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Literal, Optional, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
 
 # flake8: noqa
 
@@ -56,7 +56,7 @@ class OriginalArgs(TypedDict):
     argument2: Optional[List[OriginalValue]]
 class ValueOriginal(TypedDict):
     args: OriginalArgs
-    entry: List[OriginalValue]
+    entry: Union[List[OriginalValue], List[List[OriginalValue]]]
     template: Template
     symmetries: List
 